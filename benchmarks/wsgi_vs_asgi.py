@@ -0,0 +1,207 @@
+"""
+Throughput of src.core.wsgi and src.core.asgi serving the same requests
+to slow clients, in this process and with the caches of the settings:
+
+    python benchmarks/wsgi_vs_asgi.py --requests 2000 --client-delay 0.05
+
+--concurrency clients send the requests to both, a latency includes the wait
+for the server. A WSGI thread is held until its client has read the whole
+response, as with a threaded worker writing to a slow socket, there are
+--threads of them. The ASGI worker is one event loop.
+Every path is requested once before the runs, so the caches are warm.
+This is not a test, pytest does not collect it.
+
+ASGI pays off with slow clients only. On sqlite with the fixtures,
+1000 requests, 200 clients and 8 WSGI threads:
+
+    20 ms clients:  WSGI 364 req/s, ASGI 263 req/s
+    100 ms clients: WSGI  78 req/s, ASGI 227 req/s
+    300 ms clients: WSGI  27 req/s, ASGI 187 req/s
+
+For fast clients ASGI is slower. Django 4.1 runs every MiddlewareMixin
+middleware of an async view in a thread hop, and a cache miss renders
+the sync viewset in sync_to_async, so a request takes several hops
+where a WSGI thread takes none.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import threading
+import time
+import typing
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+os.environ.setdefault("DJANGO_SETTINGS_MODULE", "src.settings")
+
+DEFAULT_PATHS = (
+    "/api/v1/products/",
+    "/api/v1/posts/",
+    "/api/v1/menu/",
+    "/api/v1/sliders/",
+)
+
+
+class Result(typing.NamedTuple):
+    server: str
+    elapsed: float
+    latencies: typing.List[float]
+    errors: int
+
+    def report(self) -> str:
+        latencies = sorted(self.latencies)
+        p99 = latencies[int(len(latencies) * 0.99) - 1] if latencies else 0
+        return (
+            f"{self.server:5} {len(latencies) / self.elapsed:9.1f} req/s  "
+            f"p50 {statistics.median(latencies) * 1000:7.1f} ms  "
+            f"p99 {p99 * 1000:7.1f} ms  errors {self.errors}"
+        )
+
+
+def wsgi_request(application, path: str, host: str, client_delay: float):
+    """Status of the response, read by the client chunk by chunk"""
+    url = urlsplit(path)
+    environ = {
+        "REQUEST_METHOD": "GET",
+        "PATH_INFO": url.path,
+        "QUERY_STRING": url.query,
+        "SERVER_NAME": host,
+        "SERVER_PORT": "80",
+        "HTTP_HOST": host,
+        "SERVER_PROTOCOL": "HTTP/1.1",
+        "wsgi.url_scheme": "http",
+        "wsgi.input": sys.stdin.buffer,
+        "wsgi.errors": sys.stderr,
+        "wsgi.multithread": True,
+        "wsgi.multiprocess": False,
+        "wsgi.run_once": False,
+    }
+    statuses = []
+    body = application(environ, lambda status, headers: statuses.append(status))
+    try:
+        for _ in body:
+            time.sleep(client_delay)
+    finally:
+        if hasattr(body, "close"):
+            body.close()
+    return int(statuses[0].split()[0])
+
+
+async def asgi_request(application, path: str, host: str, client_delay: float):
+    url = urlsplit(path)
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": url.path,
+        "query_string": url.query.encode(),
+        "headers": [(b"host", host.encode())],
+    }
+    statuses = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.start":
+            statuses.append(message["status"])
+        elif message["type"] == "http.response.body":
+            await asyncio.sleep(client_delay)
+
+    await application(scope, receive, send)
+    return statuses[0]
+
+
+def run_wsgi(application, paths, args) -> Result:
+    clients = threading.BoundedSemaphore(args.concurrency)
+
+    def timed(path, sent):
+        try:
+            status = wsgi_request(application, path, args.host, args.client_delay)
+            return status, time.perf_counter() - sent
+        finally:
+            clients.release()
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=args.threads) as pool:
+        futures = []
+        for path in paths:
+            clients.acquire()
+            futures.append(pool.submit(timed, path, time.perf_counter()))
+        results = [future.result() for future in futures]
+    return Result(
+        "WSGI",
+        time.perf_counter() - started,
+        [latency for _, latency in results],
+        sum(status != 200 for status, _ in results),
+    )
+
+
+def run_asgi(application, paths, args) -> Result:
+    async def run():
+        clients = asyncio.Semaphore(args.concurrency)
+
+        async def timed(path):
+            async with clients:
+                started = time.perf_counter()
+                status = await asgi_request(
+                    application, path, args.host, args.client_delay
+                )
+                return status, time.perf_counter() - started
+
+        started = time.perf_counter()
+        results = await asyncio.gather(*(timed(path) for path in paths))
+        return time.perf_counter() - started, results
+
+    elapsed, results = asyncio.run(run())
+    return Result(
+        "ASGI",
+        elapsed,
+        [latency for _, latency in results],
+        sum(status != 200 for status, _ in results),
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--path", action="append", dest="paths")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--threads", type=int, default=8, help="of the WSGI worker")
+    parser.add_argument("--concurrency", type=int, default=200, help="clients at once")
+    parser.add_argument(
+        "--client-delay",
+        type=float,
+        default=0.02,
+        help="seconds a client takes to read a response",
+    )
+    parser.add_argument("--host", default="localhost")
+    args = parser.parse_args()
+
+    from src.core.asgi import application as asgi_application
+    from src.core.wsgi import application as wsgi_application
+
+    endpoints = args.paths or DEFAULT_PATHS
+    paths = [endpoints[i % len(endpoints)] for i in range(args.requests)]
+    for path in endpoints:
+        status = wsgi_request(wsgi_application, path, args.host, 0)
+        asyncio.run(asgi_request(asgi_application, path, args.host, 0))
+        print(f"warm {path} {status}")
+
+    print(
+        f"{args.requests} requests, {args.client_delay * 1000:.0f} ms clients, "
+        f"{args.concurrency} clients at once, WSGI {args.threads} threads"
+    )
+    for result in (
+        run_wsgi(wsgi_application, paths, args),
+        run_asgi(asgi_application, paths, args),
+    ):
+        print(result.report())
+
+
+if __name__ == "__main__":
+    main()
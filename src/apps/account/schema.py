@@ -0,0 +1,9 @@
+from graphene_django import DjangoObjectType
+
+from src.apps.account.models import User
+
+
+class AuthorType(DjangoObjectType):
+    class Meta:
+        model = User
+        fields = ("id", "first_name", "last_name", "about")
@@ -14,9 +14,10 @@ from src.apps.account.serializers import (
     SignOutSerializer,
     ProfileSerializer,
 )
+from src.core.mixins.cache import ResponseCacheMixin
 
 
-class UserViewSet(ReadOnlyModelViewSet):
+class UserViewSet(ResponseCacheMixin, ReadOnlyModelViewSet):
     queryset = User.objects.filter(account_type=AccountTypeChoices.AUTHOR)
     serializer_class = UserSerializer
     pagination_class = None
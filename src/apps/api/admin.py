@@ -0,0 +1,17 @@
+from django.contrib import admin
+
+from src.apps.api.models import PersistedQuery
+
+
+@admin.register(PersistedQuery)
+class PersistedQueryAdmin(admin.ModelAdmin):
+    list_display = ("pk", "name", "sha256", "created_at")
+    list_display_links = ("pk", "name")
+    search_fields = ("name", "sha256")
+    readonly_fields = ("sha256", "created_at")
+
+    def get_readonly_fields(self, request, obj=None):
+        # the hash the clients send is of the text, a new text is a new query
+        if obj is not None:
+            return (*self.readonly_fields, "query")
+        return self.readonly_fields
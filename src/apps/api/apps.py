@@ -3,3 +3,14 @@ from django.apps import AppConfig
 
 class ApiConfig(AppConfig):
     name = "src.apps.api"
+
+    def ready(self):
+        from src.apps.api.signals import (
+            connect_persisted_queries,
+            connect_response_cache,
+            connect_sitemap,
+        )
+
+        connect_response_cache()
+        connect_sitemap()
+        connect_persisted_queries()
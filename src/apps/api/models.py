@@ -0,0 +1,33 @@
+from django.core.exceptions import ValidationError
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from src.core.graphql.documents import get_document, get_query_hash
+
+
+class PersistedQuery(models.Model):
+    """GraphQL query the clients run by its hash, see src.apps.api.persisted"""
+
+    sha256 = models.CharField(_("SHA-256"), max_length=64, unique=True, editable=False)
+    name = models.CharField(_("Name"), max_length=255, blank=True)
+    query = models.TextField(_("Query"))
+    created_at = models.DateTimeField(_("Created"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Persisted Query")
+        verbose_name_plural = _("Persisted Queries")
+        ordering = ("name",)
+
+    def __str__(self):
+        return self.name or self.sha256
+
+    def clean(self):
+        from src.core.schema import schema
+
+        errors = get_document(schema.graphql_schema, self.query).errors
+        if errors:
+            raise ValidationError({"query": [error.message for error in errors]})
+
+    def save(self, *args, **kwargs):
+        self.sha256 = get_query_hash(self.query)
+        super().save(*args, **kwargs)
@@ -0,0 +1,42 @@
+import re
+import typing
+
+from django.conf import settings
+from django.core.cache import cache
+
+from src.apps.api.models import PersistedQuery
+from src.core.utils.cache import get_or_compute
+
+PERSISTED_QUERY_CACHE_KEY = "graphql:persisted:{sha256}"
+SHA256_RE = re.compile(r"^[0-9a-f]{64}$")
+# cached for unknown hashes, so retries of the clients do not reach the DB
+NOT_FOUND = ""
+
+
+def _load_query(sha256: str) -> str:
+    query = (
+        PersistedQuery.objects.filter(sha256=sha256)
+        .values_list("query", flat=True)
+        .first()
+    )
+    return NOT_FOUND if query is None else query
+
+
+def _get_query_timeout(query: str) -> int:
+    if query == NOT_FOUND:
+        return settings.GRAPHQL_PERSISTED_QUERY_NEGATIVE_CACHE_TIMEOUT
+    return settings.GRAPHQL_PERSISTED_QUERY_CACHE_TIMEOUT
+
+
+def get_persisted_query(sha256: str) -> typing.Optional[str]:
+    """Text of the registered query, django cache -> DB"""
+    if not isinstance(sha256, str) or not SHA256_RE.match(sha256):
+        return None
+    key = PERSISTED_QUERY_CACHE_KEY.format(sha256=sha256)
+    return get_or_compute(key, lambda: _load_query(sha256), _get_query_timeout) or None
+
+
+def invalidate_persisted_queries(hashes: typing.Iterable[str]) -> None:
+    cache.delete_many(
+        [PERSISTED_QUERY_CACHE_KEY.format(sha256=sha256) for sha256 in hashes]
+    )
@@ -0,0 +1,113 @@
+import typing
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_save, m2m_changed
+from modeltranslation.utils import build_localized_fieldname
+
+from src.apps.api.models import PersistedQuery
+from src.apps.api.persisted import invalidate_persisted_queries
+from src.apps.api.tasks import schedule_sitemap_render
+from src.core.utils.response_cache import (
+    instance_tag,
+    invalidate_tags,
+    model_tag,
+    parent_tags,
+    pk_tag,
+)
+
+
+def _invalidate_on_commit(tags):
+    transaction.on_commit(lambda: invalidate_tags(tags))
+
+
+def get_list_fields(model) -> typing.Optional[typing.List]:
+    """
+    Fields whose change can move a row into or out of a cached list,
+    by settings.RESPONSE_CACHE_LIST_FIELDS, None - any field can
+    """
+    names = settings.RESPONSE_CACHE_LIST_FIELDS.get(model._meta.label)
+    if names is None:
+        return None
+    names = [
+        *names,
+        *(
+            build_localized_fieldname(name, language)
+            for name in names
+            for language in settings.MODELTRANSLATION_LANGUAGES
+        ),
+    ]
+    return [field for field in model._meta.concrete_fields if field.name in names]
+
+
+def instance_saving(sender, instance, update_fields=None, raw=False, **kwargs):
+    """Compares the list fields of an update with the stored row"""
+    fields = get_list_fields(sender)
+    if fields is None or raw or instance._state.adding:
+        return
+    if update_fields is not None:
+        instance._response_cache_list_changed = any(
+            field.name in update_fields for field in fields
+        )
+        return
+    stored = (
+        sender._base_manager.filter(pk=instance.pk)
+        .values(*(field.attname for field in fields))
+        .first()
+    )
+    instance._response_cache_list_changed = stored is None or any(
+        field.to_python(getattr(instance, field.attname)) != stored[field.attname]
+        for field in fields
+    )
+
+
+def instance_changed(sender, instance, created=False, **kwargs):
+    tags = [instance_tag(instance), *parent_tags(instance)]
+    # the lists show the instance, so they carry its tag already, only
+    # a new, deleted or moved row changes the lists it is not rendered in
+    if created or instance.__dict__.pop("_response_cache_list_changed", True):
+        tags.append(model_tag(sender))
+    _invalidate_on_commit(tags)
+
+
+def relations_changed(sender, instance, action, model, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "post_clear"):
+        return
+    # filtered lists of both sides may change as well
+    tags = [instance_tag(instance), model_tag(type(instance)), model_tag(model)]
+    tags += [pk_tag(model, pk) for pk in pk_set or ()]
+    _invalidate_on_commit(tags)
+
+
+def connect_response_cache():
+    """Invalidation of ResponseCacheMixin by settings.RESPONSE_CACHE_MODELS"""
+    for label in settings.RESPONSE_CACHE_MODELS:
+        model = apps.get_model(label)
+        pre_save.connect(instance_saving, sender=model)
+        post_save.connect(instance_changed, sender=model)
+        post_delete.connect(instance_changed, sender=model)
+        for field in model._meta.many_to_many:
+            m2m_changed.connect(relations_changed, sender=field.remote_field.through)
+
+
+def sitemap_changed(sender, **kwargs):
+    transaction.on_commit(schedule_sitemap_render)
+
+
+def connect_sitemap():
+    """Render of the cached sitemap.xml by settings.SITEMAP_MODELS"""
+    for label in settings.SITEMAP_MODELS:
+        model = apps.get_model(label)
+        post_save.connect(sitemap_changed, sender=model)
+        post_delete.connect(sitemap_changed, sender=model)
+
+
+def persisted_query_changed(sender, instance, **kwargs):
+    # unknown hashes are cached as well, a new query must be seen at once
+    transaction.on_commit(lambda: invalidate_persisted_queries([instance.sha256]))
+
+
+def connect_persisted_queries():
+    post_save.connect(persisted_query_changed, sender=PersistedQuery)
+    post_delete.connect(persisted_query_changed, sender=PersistedQuery)
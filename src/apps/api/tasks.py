@@ -0,0 +1,38 @@
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from src.core.celery import app
+from src.core.sitemap import (
+    SITEMAP_INDEX_CACHE_KEY,
+    SITEMAP_SCHEDULED_CACHE_KEY,
+    render_sitemaps,
+)
+from src.core.utils.cache import cache_lock
+
+logger = logging.getLogger(__name__)
+
+
+def schedule_sitemap_render():
+    """
+    One render SITEMAP_RENDER_DELAY seconds after the first of a burst
+    of changes, the flag outlives the delay in case the task is lost
+    """
+    if cache.add(SITEMAP_SCHEDULED_CACHE_KEY, 1, settings.SITEMAP_RENDER_DELAY * 2):
+        render_sitemap.apply_async(countdown=settings.SITEMAP_RENDER_DELAY)
+
+
+@app.task()
+def render_sitemap() -> int:
+    with cache_lock(SITEMAP_INDEX_CACHE_KEY) as acquired:
+        if not acquired:
+            # a render in another worker is still running and may have
+            # read the rows before the change, this one follows it
+            render_sitemap.apply_async(countdown=settings.SITEMAP_RENDER_DELAY)
+            return 0
+        # changes from now on schedule the next render
+        cache.delete(SITEMAP_SCHEDULED_CACHE_KEY)
+        pages = render_sitemaps()
+    logger.info(f"Sitemap rendered, {pages} pages")
+    return pages
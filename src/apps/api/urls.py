@@ -1,4 +1,10 @@
 from django.urls import include, path
+from rest_framework import routers
+
+from src.apps.api.viewsets import CacheStatsViewSet
+
+router = routers.DefaultRouter()
+router.register(r"cache-stats", CacheStatsViewSet, basename="cache-stats")
 
 urlpatterns = [
     path("", include("src.apps.blog.urls")),
@@ -10,4 +16,5 @@ urlpatterns = [
     path("", include("src.apps.reviews.urls")),
     path("", include("src.apps.contacts.urls")),
     path("", include("src.apps.shorter.urls")),
+    path("", include(router.urls)),
 ]
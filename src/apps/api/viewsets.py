@@ -0,0 +1,14 @@
+from django.core.cache import cache
+from rest_framework import viewsets
+from rest_framework.permissions import IsAdminUser
+from rest_framework.response import Response
+
+
+class CacheStatsViewSet(viewsets.ViewSet):
+    """Hits and misses of the cache tiers in the process which answers"""
+
+    permission_classes = (IsAdminUser,)
+
+    def list(self, request):
+        stats = cache.stats() if hasattr(cache, "stats") else {}
+        return Response(stats)
@@ -0,0 +1,27 @@
+# Generated by Django 4.1.2 on 2026-10-17 06:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0002_images_watermark"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="article",
+            options={
+                "ordering": ("-created_at", "-id"),
+                "verbose_name": "Article",
+                "verbose_name_plural": "Articles",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="article",
+            index=models.Index(
+                fields=["created_at", "id"], name="blog_article_created_idx"
+            ),
+        ),
+    ]
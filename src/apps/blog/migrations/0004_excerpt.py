@@ -0,0 +1,55 @@
+# Generated by Django 4.1.2 on 2026-10-17 06:45
+
+from django.db import migrations, models
+
+from src.core.utils.text import fill_excerpts as fill_model_excerpts
+
+
+def fill_excerpts(apps, schema_editor):
+    fill_model_excerpts(apps.get_model("blog", "Article"), "content")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("blog", "0003_created_at_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="article",
+            name="excerpt",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=300,
+                verbose_name="Excerpt",
+            ),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="excerpt_en",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=300,
+                null=True,
+                verbose_name="Excerpt",
+            ),
+        ),
+        migrations.AddField(
+            model_name="article",
+            name="excerpt_ru",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                max_length=300,
+                null=True,
+                verbose_name="Excerpt",
+            ),
+        ),
+        migrations.RunPython(fill_excerpts, migrations.RunPython.noop),
+    ]
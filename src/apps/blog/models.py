@@ -4,7 +4,7 @@ from django.utils.translation import gettext_lazy as _
 from django.conf import settings
 
 from django_extensions.db.fields import AutoSlugField
-from src.core.mixins.mixin import SeoMixin, ImagesMixin
+from src.core.mixins.mixin import SeoMixin, ImagesMixin, ExcerptMixin
 
 
 class Tag(SeoMixin):
@@ -21,7 +21,7 @@ class Tag(SeoMixin):
         return self.title
 
 
-class Article(SeoMixin, ImagesMixin):
+class Article(SeoMixin, ImagesMixin, ExcerptMixin):
     """Article model"""
 
     title = models.CharField(_("Title"), max_length=64)
@@ -46,4 +46,8 @@ class Article(SeoMixin, ImagesMixin):
     class Meta:
         verbose_name = _("Article")
         verbose_name_plural = _("Articles")
-        ordering = ("-created_at",)
+        ordering = ("-created_at", "-id")
+        # keyset pagination and the admin list, see KeysetPagination
+        indexes = [
+            models.Index(fields=("created_at", "id"), name="blog_article_created_idx"),
+        ]
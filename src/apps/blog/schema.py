@@ -2,6 +2,7 @@ import graphene
 from graphene import ObjectType
 from graphene_django import DjangoObjectType
 
+from src.apps.account.schema import AuthorType
 from src.apps.blog.models import Tag, Article
 
 
@@ -11,16 +12,24 @@ class TagsType(DjangoObjectType):
 
 
 class ArticleType(DjangoObjectType):
+    author = graphene.Field(AuthorType)
+
     class Meta:
         model = Article
 
+    def resolve_author(self, info):
+        return info.context.loaders.load(self, "author")
+
+    def resolve_tags(self, info):
+        return info.context.loaders.load(self, "tags")
+
 
 class Query(ObjectType):
     all_tags = graphene.List(TagsType)
     all_articles = graphene.List(ArticleType)
 
-    async def resolve_all_categories(self, info, **kwargs):
-        return Tag.objects.all()
+    def resolve_all_tags(self, info, **kwargs):
+        return info.context.loaders.seen(Tag.objects.all())
 
-    async def resolve_all_articles(self, info, **kwargs):
-        return Article.objects.prefetch_related("tags").all()
+    def resolve_all_articles(self, info, **kwargs):
+        return info.context.loaders.seen(Article.objects.all())
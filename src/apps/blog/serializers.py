@@ -2,6 +2,8 @@ from rest_framework import serializers
 
 from src.apps.blog.models import Tag
 from src.apps.blog.models import Article
+from src.core.mixins.fields import SparseFieldsSerializerMixin
+from src.core.mixins.mixin import IMAGE_FIELDS
 
 
 class TagsForArticleSerializer(serializers.ModelSerializer):
@@ -13,9 +15,10 @@ class TagsForArticleSerializer(serializers.ModelSerializer):
         )
 
 
-class ArticleListSerializer(serializers.ModelSerializer):
+class ArticleListSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     tags = TagsForArticleSerializer(many=True, read_only=True)
     image_preview = serializers.CharField(source="get_image")
+    image_srcset = serializers.DictField(source="get_srcset", read_only=True)
 
     class Meta:
         model = Article
@@ -23,17 +26,23 @@ class ArticleListSerializer(serializers.ModelSerializer):
             "title",
             "slug",
             "content",
+            "excerpt",
             "author",
             "tags",
             "image_preview",
+            "image_srcset",
             "image_alt",
             "created_at",
         )
+        field_columns = {"image_preview": IMAGE_FIELDS, "image_srcset": IMAGE_FIELDS}
 
 
-class ArticleRetrieveSerializer(serializers.ModelSerializer):
+class ArticleRetrieveSerializer(
+    SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
     tags = TagsForArticleSerializer(many=True, read_only=True)
     image_preview = serializers.CharField(source="get_image")
+    image_srcset = serializers.DictField(source="get_srcset", read_only=True)
 
     class Meta:
         model = Article
@@ -41,10 +50,12 @@ class ArticleRetrieveSerializer(serializers.ModelSerializer):
             "title",
             "slug",
             "content",
+            "excerpt",
             "is_active",
             "author",
             "tags",
             "image_preview",
+            "image_srcset",
             "image_alt",
             "title_seo",
             "meta_keywords",
@@ -52,3 +63,4 @@ class ArticleRetrieveSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         )
+        field_columns = {"image_preview": IMAGE_FIELDS, "image_srcset": IMAGE_FIELDS}
@@ -1,13 +1,17 @@
 from rest_framework.permissions import AllowAny
 from rest_framework.viewsets import ModelViewSet
 from .serializers import ArticleListSerializer, ArticleRetrieveSerializer
+from src.core.mixins.cache import ConditionalGetMixin
+from src.core.mixins.fields import SparseFieldsetMixin
+from src.core.pagination import KeysetPagination
 from .models import Article
 
 
-class ArticleList(ModelViewSet):
+class ArticleList(ConditionalGetMixin, SparseFieldsetMixin, ModelViewSet):
     queryset = Article.objects.filter(is_active=True).prefetch_related("tags")
     http_method_names = ["get"]
     lookup_field = "slug"
+    pagination_class = KeysetPagination
 
     serializer_classes = {
         "list": ArticleListSerializer,
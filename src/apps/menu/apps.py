@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class MenuConfig(AppConfig):
+    name = "src.apps.menu"
+
+    def ready(self):
+        import src.apps.menu.signals  # noqa
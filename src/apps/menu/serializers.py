@@ -29,3 +29,24 @@ class MenuItemsSerializer(serializers.ModelSerializer):
             "ordering",
             "is_active",
         )
+
+
+class MenuTreeSerializer(serializers.ModelSerializer):
+    """Item with its children, for trees walked by mptt get_cached_trees"""
+
+    children = serializers.SerializerMethodField()
+
+    class Meta:
+        model = MenuItems
+        fields = (
+            "id",
+            "name",
+            "url",
+            "target",
+            "ordering",
+            "children",
+        )
+
+    def get_children(self, obj):
+        children = sorted(obj.get_children(), key=lambda item: item.ordering)
+        return MenuTreeSerializer(children, many=True).data
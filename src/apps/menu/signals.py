@@ -0,0 +1,13 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from src.apps.menu.models import Menu, MenuItems
+from src.apps.menu.tree import invalidate_menu_trees
+
+
+@receiver(post_save, sender=Menu)
+@receiver(post_delete, sender=Menu)
+@receiver(post_save, sender=MenuItems)
+@receiver(post_delete, sender=MenuItems)
+def menu_changed(sender, **kwargs):
+    invalidate_menu_trees()
@@ -0,0 +1,62 @@
+import time
+import typing
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils.translation import get_language
+from mptt.utils import get_cached_trees
+
+from src.apps.menu.models import Menu, MenuItems
+from src.apps.menu.serializers import MenuTreeSerializer
+from src.core.utils.cache import get_or_compute
+
+MENU_TREE_CACHE_KEY = "menu:tree:{version}:{slug}:{language}"
+# bumped on any change of a menu, old trees are left to expire
+MENU_TREE_VERSION_KEY = "menu:tree:version"
+# cached for unknown menus
+NOT_FOUND = ()
+
+
+def _get_version() -> int:
+    return cache.get_or_set(MENU_TREE_VERSION_KEY, lambda: int(time.time()), None)
+
+
+def build_menu_tree(menu: Menu) -> typing.List[dict]:
+    """
+    Active items of the menu nested by parent, in one query.
+    Items under an inactive parent are hidden with it.
+    """
+    items, hidden = [], set()
+    for item in MenuItems.objects.filter(menu=menu).order_by("tree_id", "lft"):
+        if not item.is_active or item.parent_id in hidden:
+            hidden.add(item.pk)
+        else:
+            items.append(item)
+    roots = sorted(get_cached_trees(items), key=lambda item: item.ordering)
+    return list(MenuTreeSerializer(roots, many=True).data)
+
+
+def _load_menu_tree(slug: str) -> typing.Union[dict, tuple]:
+    menu = Menu.objects.filter(slug=slug, is_active=True).first()
+    if menu is None:
+        return NOT_FOUND
+    return {"slug": menu.slug, "hint": menu.hint, "items": build_menu_tree(menu)}
+
+
+def get_menu_tree(slug: str) -> typing.Optional[dict]:
+    """Menu with its items as a tree, cached per language"""
+    key = MENU_TREE_CACHE_KEY.format(
+        version=_get_version(), slug=slug, language=get_language()
+    )
+    tree = get_or_compute(
+        key, lambda: _load_menu_tree(slug), settings.MENU_TREE_CACHE_TIMEOUT
+    )
+    return tree or None
+
+
+def invalidate_menu_trees() -> None:
+    try:
+        cache.incr(MENU_TREE_VERSION_KEY)
+    except ValueError:
+        # no version yet, nothing was cached with it
+        pass
@@ -1,10 +1,24 @@
+from django.http import Http404
+from rest_framework.decorators import action
 from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
 from rest_framework.viewsets import ReadOnlyModelViewSet
+from src.core.mixins.cache import ResponseCacheMixin
 from .serializers import MenuItemsSerializer
-from .models import MenuItems
+from .models import Menu, MenuItems
+from .tree import get_menu_tree
 
 
-class MenuAPIViewSet(ReadOnlyModelViewSet):
-    queryset = MenuItems.objects.filter(is_active=True)
+class MenuAPIViewSet(ResponseCacheMixin, ReadOnlyModelViewSet):
+    queryset = MenuItems.objects.filter(is_active=True).select_related("menu")
     serializer_class = MenuItemsSerializer
     permission_classes = (AllowAny,)
+
+    @action(detail=False, url_path=r"tree/(?P<slug>[-\w]+)")
+    def tree(self, request, slug=None):
+        """Active items of the menu nested as a tree"""
+        self.tag_response(models=[Menu, MenuItems])
+        tree = get_menu_tree(slug)
+        if tree is None:
+            raise Http404
+        return Response(tree)
@@ -0,0 +1,30 @@
+# Generated by Django 4.1.2 on 2026-10-17 06:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("reviews", "0002_auto_20200328_2201"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="review",
+            name="image_hash",
+            field=models.CharField(
+                blank=True, editable=False, max_length=64, verbose_name="Images hash"
+            ),
+        ),
+        migrations.AddField(
+            model_name="review",
+            name="image_watermark",
+            field=models.ImageField(
+                blank=True,
+                editable=False,
+                upload_to="",
+                verbose_name="Images with watermark",
+            ),
+        ),
+    ]
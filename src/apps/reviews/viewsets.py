@@ -3,9 +3,10 @@ from rest_framework.viewsets import GenericViewSet
 
 from src.apps.reviews.models import Review
 from src.apps.reviews.serializers import ReviewSerializer
+from src.core.mixins.cache import ResponseCacheMixin
 
 
-class ReviewViewSet(mixins.ListModelMixin, GenericViewSet):
+class ReviewViewSet(ResponseCacheMixin, mixins.ListModelMixin, GenericViewSet):
     queryset = Review.objects.filter(is_active=True)[:2]
     serializer_class = ReviewSerializer
     http_method_names = ["get"]
@@ -92,6 +92,8 @@ class OrderCartAdmin(admin.ModelAdmin):
     inlines = [OrderCartItemInline]
     list_display = ("id", "order_number", "status", "updated_at", "created_at")
     list_display_links = ("order_number",)
+    # no COUNT(*) of all the orders on every page of the list
+    show_full_result_count = False
     readonly_fields = ("updated_at", "created_at", "order_number", "order_total_cost")
     fieldsets = (
         (
@@ -112,6 +114,10 @@ class OrderCartAdmin(admin.ModelAdmin):
         ),
     )
 
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        form.instance.update_total_cost()
+
 
 @admin.register(OrderCartItem)
 class OrderCartItemAdmin(admin.ModelAdmin):
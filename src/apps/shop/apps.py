@@ -0,0 +1,9 @@
+from django.apps import AppConfig
+
+
+class ShopConfig(AppConfig):
+    name = "src.apps.shop"
+
+    def ready(self):
+        import src.apps.shop.checks  # noqa
+        import src.apps.shop.signals  # noqa
@@ -0,0 +1,45 @@
+from django.apps import apps
+from django.conf import settings
+from django.core import checks
+
+from src.apps.shop.models.product import (
+    CONVERTED_FIELDS,
+    ConvertedPriceField,
+    converted_field_name,
+)
+
+
+@checks.register(checks.Tags.models)
+def check_converted_price_fields(app_configs=None, **kwargs):
+    """The price_<currency> and sale_<currency> columns follow settings.CURRENCIES"""
+    Product = apps.get_model("shop", "Product")
+    expected = {
+        converted_field_name(field, currency)
+        for field in CONVERTED_FIELDS
+        for currency in settings.CURRENCIES
+    }
+    declared = {
+        field.name
+        for field in Product._meta.get_fields()
+        if isinstance(field, ConvertedPriceField)
+    }
+    errors = []
+    for name in sorted(expected - declared):
+        errors.append(
+            checks.Error(
+                f"Product has no column {name} for a currency of settings.CURRENCIES",
+                hint="Add a ConvertedPriceField and a migration filling it.",
+                obj=Product,
+                id="shop.E001",
+            )
+        )
+    for name in sorted(declared - expected):
+        errors.append(
+            checks.Error(
+                f"Product column {name} is of a currency not in settings.CURRENCIES",
+                hint="Remove the field or add its currency to settings.CURRENCIES.",
+                obj=Product,
+                id="shop.E002",
+            )
+        )
+    return errors
@@ -35,3 +35,23 @@ class ProductTypeChoices:
         (COURSE, _("Course")),
         (SCHEMA, _("Schema")),
     )
+
+
+class ProductFacetChoices:
+    """Facets of the product search, prices are bucketed per currency"""
+
+    CATEGORY = "category"
+    COLOR = "color"
+    DIGITAL = "digital"
+    PRICE_RUB = "price_rub"
+    PRICE_EUR = "price_eur"
+    PRICE_USD = "price_usd"
+
+    CHOICES = (
+        (CATEGORY, _("Category")),
+        (COLOR, _("Color")),
+        (DIGITAL, _("Digital")),
+        (PRICE_RUB, _("Price RUB")),
+        (PRICE_EUR, _("Price EUR")),
+        (PRICE_USD, _("Price USD")),
+    )
@@ -0,0 +1,87 @@
+import logging
+import time
+import typing
+from decimal import Decimal
+
+from django.conf import settings
+from django.core.cache import cache
+from djmoney.contrib.exchange.exceptions import MissingRate
+from djmoney.contrib.exchange.models import Rate, get_default_backend_name
+from djmoney.money import Money
+
+from src.core.utils.cache import get_or_compute
+
+logger = logging.getLogger(__name__)
+
+RATES_CACHE_KEY = "shop:exchange:rates:{backend}:{version}"
+# bumped by invalidate_rates(), a snapshot loaded before is cached under
+# the old version, where no one reads it anymore
+RATES_VERSION_KEY = "shop:exchange:version:{backend}"
+
+
+class RatesSnapshot(typing.NamedTuple):
+    """Rates of one exchange backend, every value relative to ``base_currency``"""
+
+    base_currency: typing.Optional[str]
+    rates: typing.Dict[str, Decimal]
+
+
+def _load_snapshot(backend: str) -> RatesSnapshot:
+    rows = Rate.objects.filter(backend_id=backend).values_list(
+        "currency", "value", "backend__base_currency"
+    )
+    base_currency, rates = None, {}
+    for currency, value, base_currency in rows:
+        rates[currency] = value
+    if base_currency:
+        rates.setdefault(base_currency, Decimal(1))
+    return RatesSnapshot(base_currency, rates)
+
+
+def _get_version(backend: str) -> int:
+    return cache.get_or_set(
+        RATES_VERSION_KEY.format(backend=backend), lambda: int(time.time()), None
+    )
+
+
+def get_rates_snapshot(backend: typing.Optional[str] = None) -> RatesSnapshot:
+    """
+    Rates table of the backend.
+    The local tier of the two tier cache first, then the shared one,
+    the DB only once after ``update_rates`` invalidated the snapshot.
+    """
+    backend = backend or get_default_backend_name()
+    snapshot = get_or_compute(
+        RATES_CACHE_KEY.format(backend=backend, version=_get_version(backend)),
+        lambda: tuple(_load_snapshot(backend)),
+        settings.EXCHANGE_RATES_CACHE_TIMEOUT,
+    )
+    return RatesSnapshot(*snapshot)
+
+
+def invalidate_rates(backend: typing.Optional[str] = None):
+    backend = backend or get_default_backend_name()
+    try:
+        # evicts the local tier of every process as well
+        cache.incr(RATES_VERSION_KEY.format(backend=backend))
+    except ValueError:
+        # no version yet, nothing was cached with it
+        pass
+    logger.info(f"Exchange rates snapshot of {backend} invalidated")
+
+
+def get_rate(source: str, target: str, backend: typing.Optional[str] = None):
+    source, target = str(source), str(target)
+    if source == target:
+        return 1
+    rates = get_rates_snapshot(backend).rates
+    try:
+        return rates[target] / rates[source]
+    except KeyError:
+        raise MissingRate(f"Rate {source} -> {target} does not exist")
+
+
+def convert_money(value: Money, currency: str) -> Money:
+    """Same as djmoney ``convert_money``, without DB or cache round trips"""
+    amount = value.amount * get_rate(value.currency, currency)
+    return value.__class__(amount, currency)
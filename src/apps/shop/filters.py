@@ -0,0 +1,85 @@
+from decimal import Decimal, InvalidOperation
+
+from django.conf import settings
+from modeltranslation.utils import get_language
+from rest_framework.filters import BaseFilterBackend
+
+from src.apps.shop.choices import ProductFacetChoices
+from src.apps.shop.models.product import converted_field_name
+from src.apps.shop.search import search_products, filter_by_facets, TRUE, FALSE
+
+
+def get_price_currency() -> str:
+    """Prices are filtered and ordered in the currency of the active language"""
+    return settings.LANG_EXCHANGE.get(get_language(), settings.BASE_CURRENCY)
+
+
+def filter_price_range(queryset, price_min=None, price_max=None):
+    price_field = converted_field_name("price", get_price_currency())
+    if price_min is not None:
+        queryset = queryset.filter(**{f"{price_field}__gte": price_min})
+    if price_max is not None:
+        queryset = queryset.filter(**{f"{price_field}__lte": price_max})
+    return queryset
+
+
+class ProductPriceFilter(BaseFilterBackend):
+    """
+    Price range and price ordering in the currency of the active language
+    ?price_min=10&price_max=100&ordering=-price
+    """
+
+    ordering_param = "ordering"
+    ordering_fields = ("price", "sale")
+
+    def filter_queryset(self, request, queryset, view):
+        currency = get_price_currency()
+        queryset = filter_price_range(
+            queryset,
+            self.get_decimal(request, "price_min"),
+            self.get_decimal(request, "price_max"),
+        )
+
+        ordering = request.query_params.get(self.ordering_param, "")
+        if ordering.lstrip("-") in self.ordering_fields:
+            direction = "-" if ordering.startswith("-") else ""
+            field = converted_field_name(ordering.lstrip("-"), currency)
+            # the cursor of the paginator can not point at NULL
+            queryset = queryset.filter(**{f"{field}__isnull": False})
+            queryset = queryset.order_by(f"{direction}{field}", "-id")
+        return queryset
+
+    @staticmethod
+    def get_decimal(request, param):
+        try:
+            return Decimal(request.query_params[param])
+        except (KeyError, InvalidOperation):
+            return None
+
+
+class ProductSearchFilter(BaseFilterBackend):
+    """
+    Words of the translated text fields and facets, over the search index
+    ?q=knitted bea&category=1&category=2&color=3&is_digital=false
+    """
+
+    search_param = "q"
+    facet_params = {
+        "category": ProductFacetChoices.CATEGORY,
+        "color": ProductFacetChoices.COLOR,
+    }
+
+    def filter_queryset(self, request, queryset, view):
+        query = request.query_params.get(self.search_param, "").strip()
+        if query:
+            queryset = search_products(queryset, query)
+        for param, facet in self.facet_params.items():
+            values = request.query_params.getlist(param)
+            if values:
+                queryset = filter_by_facets(queryset, facet, values)
+        is_digital = request.query_params.get("is_digital")
+        if is_digital in (TRUE, FALSE):
+            queryset = filter_by_facets(
+                queryset, ProductFacetChoices.DIGITAL, [is_digital]
+            )
+        return queryset
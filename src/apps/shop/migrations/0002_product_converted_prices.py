@@ -0,0 +1,142 @@
+# Generated by Django 4.1.2 on 2026-10-17 06:20
+
+from decimal import Decimal
+
+from django.conf import settings
+from django.db import migrations
+from django.utils.module_loading import import_string
+
+import src.apps.shop.models.product
+
+
+def get_rates(apps) -> dict:
+    """Rates of the default backend as exchange.get_rate reads them, may be empty"""
+    Rate = apps.get_model("exchange", "Rate")
+    backend = import_string(settings.EXCHANGE_BACKEND).name
+    rates = {}
+    for currency, value, base_currency in Rate.objects.filter(
+        backend_id=backend
+    ).values_list("currency", "value", "backend__base_currency"):
+        rates[currency] = value
+        rates.setdefault(base_currency, Decimal(1))
+    return rates
+
+
+def fill_converted_prices(apps, schema_editor):
+    """
+    Same conversion as Product.set_converted_prices, without rates
+    only the column of the currency of the price is filled
+    """
+    Product = apps.get_model("shop", "Product")
+    rates = get_rates(apps)
+    fields = []
+    rows = list(Product.objects.all())
+    for row in rows:
+        for field in ("price", "sale"):
+            value = getattr(row, field)
+            amount, source = value.amount, str(value.currency)
+            for currency in settings.CURRENCIES:
+                name = f"{field}_{currency.lower()}"
+                if source == currency:
+                    converted = amount
+                elif source in rates and currency in rates:
+                    converted = amount * rates[currency] / rates[source]
+                else:
+                    converted = None
+                if converted is not None:
+                    converted = converted.quantize(Decimal("0.01"))
+                setattr(row, name, converted)
+                if name not in fields:
+                    fields.append(name)
+    if fields:
+        Product.objects.bulk_update(rows, fields, batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shop", "0001_initial"),
+        ("exchange", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="price_eur",
+            field=src.apps.shop.models.product.ConvertedPriceField(
+                blank=True,
+                db_index=True,
+                decimal_places=2,
+                editable=False,
+                max_digits=14,
+                null=True,
+                verbose_name="Price EUR",
+            ),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="price_rub",
+            field=src.apps.shop.models.product.ConvertedPriceField(
+                blank=True,
+                db_index=True,
+                decimal_places=2,
+                editable=False,
+                max_digits=14,
+                null=True,
+                verbose_name="Price RUB",
+            ),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="price_usd",
+            field=src.apps.shop.models.product.ConvertedPriceField(
+                blank=True,
+                db_index=True,
+                decimal_places=2,
+                editable=False,
+                max_digits=14,
+                null=True,
+                verbose_name="Price USD",
+            ),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="sale_eur",
+            field=src.apps.shop.models.product.ConvertedPriceField(
+                blank=True,
+                db_index=True,
+                decimal_places=2,
+                editable=False,
+                max_digits=14,
+                null=True,
+                verbose_name="Sale EUR",
+            ),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="sale_rub",
+            field=src.apps.shop.models.product.ConvertedPriceField(
+                blank=True,
+                db_index=True,
+                decimal_places=2,
+                editable=False,
+                max_digits=14,
+                null=True,
+                verbose_name="Sale RUB",
+            ),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="sale_usd",
+            field=src.apps.shop.models.product.ConvertedPriceField(
+                blank=True,
+                db_index=True,
+                decimal_places=2,
+                editable=False,
+                max_digits=14,
+                null=True,
+                verbose_name="Sale USD",
+            ),
+        ),
+        migrations.RunPython(fill_converted_prices, migrations.RunPython.noop),
+    ]
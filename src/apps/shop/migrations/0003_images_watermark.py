@@ -0,0 +1,47 @@
+# Generated by Django 4.1.2 on 2026-10-17 06:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shop", "0002_product_converted_prices"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="product",
+            name="image_hash",
+            field=models.CharField(
+                blank=True, editable=False, max_length=64, verbose_name="Images hash"
+            ),
+        ),
+        migrations.AddField(
+            model_name="product",
+            name="image_watermark",
+            field=models.ImageField(
+                blank=True,
+                editable=False,
+                upload_to="",
+                verbose_name="Images with watermark",
+            ),
+        ),
+        migrations.AddField(
+            model_name="productphoto",
+            name="image_hash",
+            field=models.CharField(
+                blank=True, editable=False, max_length=64, verbose_name="Images hash"
+            ),
+        ),
+        migrations.AddField(
+            model_name="productphoto",
+            name="image_watermark",
+            field=models.ImageField(
+                blank=True,
+                editable=False,
+                upload_to="",
+                verbose_name="Images with watermark",
+            ),
+        ),
+    ]
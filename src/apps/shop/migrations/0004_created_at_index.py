@@ -0,0 +1,41 @@
+# Generated by Django 4.1.2 on 2026-10-17 06:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shop", "0003_images_watermark"),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name="ordercart",
+            options={
+                "ordering": ("-created_at", "-id"),
+                "verbose_name": "Order",
+                "verbose_name_plural": "Orders",
+            },
+        ),
+        migrations.AlterModelOptions(
+            name="product",
+            options={
+                "ordering": ("-created_at", "-id"),
+                "verbose_name": "Product",
+                "verbose_name_plural": "Products",
+            },
+        ),
+        migrations.AddIndex(
+            model_name="ordercart",
+            index=models.Index(
+                fields=["created_at", "id"], name="shop_ordercart_created_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="product",
+            index=models.Index(
+                fields=["created_at", "id"], name="shop_product_created_idx"
+            ),
+        ),
+    ]
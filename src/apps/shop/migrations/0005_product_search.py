@@ -0,0 +1,133 @@
+# Generated by Django 4.1.2 on 2026-10-17 06:37
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shop", "0004_created_at_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ProductFacet",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "facet",
+                    models.CharField(
+                        choices=[
+                            ("category", "Category"),
+                            ("color", "Color"),
+                            ("digital", "Digital"),
+                            ("price_rub", "Price RUB"),
+                            ("price_eur", "Price EUR"),
+                            ("price_usd", "Price USD"),
+                        ],
+                        max_length=16,
+                        verbose_name="Facet",
+                    ),
+                ),
+                ("value", models.CharField(max_length=32, verbose_name="Value")),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="facets",
+                        to="shop.product",
+                        verbose_name="Product",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Product facet",
+                "verbose_name_plural": "Product facets",
+            },
+        ),
+        migrations.CreateModel(
+            name="FacetCount",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "facet",
+                    models.CharField(
+                        choices=[
+                            ("category", "Category"),
+                            ("color", "Color"),
+                            ("digital", "Digital"),
+                            ("price_rub", "Price RUB"),
+                            ("price_eur", "Price EUR"),
+                            ("price_usd", "Price USD"),
+                        ],
+                        max_length=16,
+                        verbose_name="Facet",
+                    ),
+                ),
+                ("value", models.CharField(max_length=32, verbose_name="Value")),
+                ("count", models.IntegerField(default=0, verbose_name="Count")),
+            ],
+            options={
+                "verbose_name": "Facet count",
+                "verbose_name_plural": "Facet counts",
+                "unique_together": {("facet", "value")},
+            },
+        ),
+        migrations.CreateModel(
+            name="ProductSearchTerm",
+            fields=[
+                (
+                    "id",
+                    models.AutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "term",
+                    models.CharField(db_index=True, max_length=64, verbose_name="Term"),
+                ),
+                (
+                    "product",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="search_terms",
+                        to="shop.product",
+                        verbose_name="Product",
+                    ),
+                ),
+            ],
+            options={
+                "verbose_name": "Search term",
+                "verbose_name_plural": "Search terms",
+                "unique_together": {("product", "term")},
+            },
+        ),
+        migrations.AddIndex(
+            model_name="productfacet",
+            index=models.Index(fields=["facet", "value"], name="shop_facet_value_idx"),
+        ),
+        migrations.AlterUniqueTogether(
+            name="productfacet",
+            unique_together={("product", "facet", "value")},
+        ),
+    ]
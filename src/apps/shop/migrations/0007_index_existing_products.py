@@ -0,0 +1,51 @@
+# Generated by Django 4.1.2 on 2026-10-17 07:30
+
+import collections
+
+from django.db import migrations
+
+from src.apps.shop.search import get_product_facets, get_product_terms
+
+
+def index_products(apps, schema_editor):
+    """
+    Search terms and facets of the products saved before the index existed,
+    later saves keep them up to date through the signals
+    """
+    Product = apps.get_model("shop", "Product")
+    ProductSearchTerm = apps.get_model("shop", "ProductSearchTerm")
+    ProductFacet = apps.get_model("shop", "ProductFacet")
+    FacetCount = apps.get_model("shop", "FacetCount")
+
+    ProductSearchTerm.objects.all().delete()
+    ProductFacet.objects.all().delete()
+    FacetCount.objects.all().delete()
+    terms, facets, counts = [], [], collections.Counter()
+    for product in Product.objects.order_by("pk").iterator(chunk_size=500):
+        terms += [
+            ProductSearchTerm(product=product, term=term)
+            for term in get_product_terms(product)
+        ]
+        for facet in get_product_facets(product):
+            facets.append(ProductFacet(product=product, facet=facet[0], value=facet[1]))
+            counts[facet] += 1
+    ProductSearchTerm.objects.bulk_create(terms, batch_size=500)
+    ProductFacet.objects.bulk_create(facets, batch_size=500)
+    FacetCount.objects.bulk_create(
+        (
+            FacetCount(facet=facet, value=value, count=count)
+            for (facet, value), count in counts.items()
+        ),
+        batch_size=500,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shop", "0006_excerpt"),
+    ]
+
+    operations = [
+        migrations.RunPython(index_products, migrations.RunPython.noop),
+    ]
@@ -1,3 +1,4 @@
 from .product import Product, ProductColor  # noqa
 from .category import Category  # noqa
 from .order import OrderCartItem, OrderCart  # noqa
+from .search import ProductSearchTerm, ProductFacet, FacetCount  # noqa
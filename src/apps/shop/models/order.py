@@ -1,14 +1,15 @@
-from typing import Optional
+from typing import List, Optional
 
 from django.conf import settings
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django_extensions.db.fields import ShortUUIDField
-from djmoney.contrib.exchange.models import convert_money
 from djmoney.models.fields import MoneyField
 from djmoney.money import Money
 
 from src.apps.shop.choices import OrderCartStatusChoices
+from src.apps.shop.exchange import convert_money
+from src.apps.shop.models.product import Product
 
 
 class OrderCart(models.Model):
@@ -46,24 +47,45 @@ class OrderCart(models.Model):
     class Meta:
         verbose_name = _("Order")
         verbose_name_plural = _("Orders")
-        ordering = ("-created_at",)
+        ordering = ("-created_at", "-id")
+        # keyset pagination and the admin list, see KeysetPagination
+        indexes = [
+            models.Index(
+                fields=("created_at", "id"), name="shop_ordercart_created_idx"
+            ),
+        ]
 
     def __str__(self):
         return f"{self.order_number}-{self.order_total_cost}"
 
-    def save(self, *args, **kwargs):
-        # if not self.order_total_cost:
-        self.order_total_cost = self.get_total_cost_order()
-        return super().save(*args, **kwargs)
+    def update_total_cost(self, items: Optional[List["OrderCartItem"]] = None) -> Money:
+        """Price all items in one batch, write them back and save the total"""
+        if items is None:
+            items = list(self.ordercartitem_ordercart.all())
+        self.order_total_cost = self.price_items(items)
+        OrderCartItem.objects.bulk_update(
+            items, ["item_total_cost", "item_total_cost_currency"]
+        )
+        self.save(
+            update_fields=[
+                "order_total_cost",
+                "order_total_cost_currency",
+                "updated_at",
+            ]
+        )
+        return self.order_total_cost
 
-    def get_total_cost_order(self):
+    @staticmethod
+    def price_items(items: List["OrderCartItem"]) -> Money:
+        """Set item_total_cost of the items in memory, return the order total"""
+        products = Product.objects.only("id", "price", "price_currency").in_bulk(
+            {item.product_id for item in items}
+        )
         order_total_cost = Money(0, settings.BASE_CURRENCY)
-        items = self.ordercartitem_ordercart.all()
         for item in items:
-            order_total_cost = convert_money(
-                order_total_cost, settings.BASE_CURRENCY
-            ) + convert_money(
-                item.get_and_save_total_cost_item(), settings.BASE_CURRENCY
+            item.item_total_cost = products[item.product_id].price * item.amount
+            order_total_cost += convert_money(
+                item.item_total_cost, settings.BASE_CURRENCY
             )
         return order_total_cost
 
@@ -101,11 +123,6 @@ class OrderCartItem(models.Model):
     def __str__(self):
         return f"{self.product} - {self.amount}"
 
-    def get_and_save_total_cost_item(self):
-        self.item_total_cost = self.product.price * self.amount
-        self.save()
-        return self.item_total_cost
-
     @property
     def is_digital(self) -> Optional[bool]:
         """Check if a variant is digital and contains digital content."""
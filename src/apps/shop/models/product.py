@@ -1,5 +1,6 @@
 import logging
 import typing
+from decimal import Decimal
 
 from ckeditor.fields import RichTextField
 from colorful.fields import RGBColorField
@@ -8,17 +9,52 @@ from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django_extensions.db.fields import AutoSlugField
 from djmoney.contrib.exchange.exceptions import MissingRate
-from djmoney.contrib.exchange.models import convert_money
 from djmoney.models.fields import MoneyField
 from djmoney.money import Money
 from modeltranslation.utils import get_language
 
-from src.core.mixins.mixin import SeoMixin, ImagesMixin
+from src.apps.shop.exchange import convert_money
+from src.core.mixins.mixin import SeoMixin, ImagesMixin, ExcerptMixin
 
 logger = logging.getLogger(__name__)
 
+CONVERTED_FIELDS = ("price", "sale")
+
+
+def converted_field_name(field: str, currency: str) -> str:
+    return f"{field}_{currency.lower()}"
+
+
+# columns get_price and get_sale read
+PRICE_FIELDS = (
+    "price",
+    "price_currency",
+    "sale",
+    "sale_currency",
+    *(
+        converted_field_name(field, currency)
+        for field in CONVERTED_FIELDS
+        for currency in settings.CURRENCIES
+    ),
+)
+
+
+class ConvertedPriceField(models.DecimalField):
+    """Denormalized copy of a MoneyField converted into one currency"""
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("max_digits", 14)
+        kwargs.setdefault("decimal_places", 2)
+        kwargs.setdefault("null", True)
+        kwargs.setdefault("blank", True)
+        kwargs.setdefault("editable", False)
+        kwargs.setdefault("db_index", True)
+        super().__init__(*args, **kwargs)
+
+
+class Product(SeoMixin, ImagesMixin, ExcerptMixin):
+    excerpt_source = "description"
 
-class Product(SeoMixin, ImagesMixin):
     title = models.CharField(_("Title"), max_length=120)
     code = models.IntegerField(verbose_name=_("Code product"), db_index=True)
     slug = AutoSlugField(_("slug"), populate_from="title", editable=True)
@@ -42,6 +78,14 @@ class Product(SeoMixin, ImagesMixin):
         default_currency="RUB",
         default=0,
     )
+    # price and sale in every settings.CURRENCIES,
+    # kept up to date by save() and the refresh_product_prices task
+    price_rub = ConvertedPriceField(_("Price RUB"))
+    price_eur = ConvertedPriceField(_("Price EUR"))
+    price_usd = ConvertedPriceField(_("Price USD"))
+    sale_rub = ConvertedPriceField(_("Sale RUB"))
+    sale_eur = ConvertedPriceField(_("Sale EUR"))
+    sale_usd = ConvertedPriceField(_("Sale USD"))
     count = models.IntegerField(verbose_name=_("Count"), blank=True, default=1)
     type_product = models.CharField(
         _("Type Product"), max_length=120, null=True, blank=True
@@ -77,7 +121,11 @@ class Product(SeoMixin, ImagesMixin):
     class Meta:
         verbose_name = _("Product")
         verbose_name_plural = _("Products")
-        ordering = ("-created_at",)
+        ordering = ("-created_at", "-id")
+        # keyset pagination and the admin list, see KeysetPagination
+        indexes = [
+            models.Index(fields=("created_at", "id"), name="shop_product_created_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"{self.title}"
@@ -89,11 +137,40 @@ class Product(SeoMixin, ImagesMixin):
             f"(code={self.code}, name={self.title})>"
         )
 
+    def save(self, *args, **kwargs):
+        self.set_converted_prices()
+        return super().save(*args, **kwargs)
+
     def get_price(self):
-        return self.get_money(value=self.price)
+        return self.get_converted(field="price")
 
     def get_sale(self):
-        return self.get_money(value=self.sale)
+        return self.get_converted(field="sale")
+
+    def get_converted(self, field: str, currency: typing.Optional[str] = None):
+        """Stored converted value, converts on the fly until the column is filled"""
+        currency = currency or settings.LANG_EXCHANGE.get(get_language())
+        amount = getattr(self, converted_field_name(field, currency), None)
+        if amount is None:
+            return self.get_money(value=getattr(self, field), currency=currency)
+        return Money(amount, currency)
+
+    def set_converted_prices(self) -> typing.List[str]:
+        """Fill the converted columns, return names of the updated fields"""
+        updated_fields = []
+        for field in CONVERTED_FIELDS:
+            value = getattr(self, field)
+            for currency in settings.CURRENCIES:
+                name = converted_field_name(field, currency)
+                try:
+                    amount = convert_money(value=value, currency=currency).amount
+                    amount = amount.quantize(Decimal("0.01"))
+                except (MissingRate, ValueError, AttributeError) as e:
+                    logger.warning(f"Product {self.pk}, not converted {field} - {e}")
+                    amount = None
+                setattr(self, name, amount)
+                updated_fields.append(name)
+        return updated_fields
 
     def get_money(
         self, value: MoneyField or Money, currency: typing.Optional[str] = None
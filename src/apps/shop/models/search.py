@@ -0,0 +1,68 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from src.apps.shop.choices import ProductFacetChoices
+
+
+class ProductSearchTerm(models.Model):
+    """Word of the translated text fields of a product, kept by the search index"""
+
+    product = models.ForeignKey(
+        "Product",
+        verbose_name=_("Product"),
+        on_delete=models.CASCADE,
+        related_name="search_terms",
+    )
+    term = models.CharField(_("Term"), max_length=64, db_index=True)
+
+    class Meta:
+        verbose_name = _("Search term")
+        verbose_name_plural = _("Search terms")
+        unique_together = ("product", "term")
+
+    def __str__(self):
+        return self.term
+
+
+class ProductFacet(models.Model):
+    """Facet value of an active product, e.g. its category or price bucket"""
+
+    product = models.ForeignKey(
+        "Product",
+        verbose_name=_("Product"),
+        on_delete=models.CASCADE,
+        related_name="facets",
+    )
+    facet = models.CharField(
+        _("Facet"), max_length=16, choices=ProductFacetChoices.CHOICES
+    )
+    value = models.CharField(_("Value"), max_length=32)
+
+    class Meta:
+        verbose_name = _("Product facet")
+        verbose_name_plural = _("Product facets")
+        unique_together = ("product", "facet", "value")
+        indexes = [
+            models.Index(fields=("facet", "value"), name="shop_facet_value_idx"),
+        ]
+
+    def __str__(self):
+        return f"{self.facet}={self.value}"
+
+
+class FacetCount(models.Model):
+    """Number of active products with the facet value, updated with ProductFacet"""
+
+    facet = models.CharField(
+        _("Facet"), max_length=16, choices=ProductFacetChoices.CHOICES
+    )
+    value = models.CharField(_("Value"), max_length=32)
+    count = models.IntegerField(_("Count"), default=0)
+
+    class Meta:
+        verbose_name = _("Facet count")
+        verbose_name_plural = _("Facet counts")
+        unique_together = ("facet", "value")
+
+    def __str__(self):
+        return f"{self.facet}={self.value}: {self.count}"
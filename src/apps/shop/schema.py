@@ -1,36 +1,264 @@
 import graphene
 from graphene import relay
+from graphene.types.generic import GenericScalar
 from graphene_django import DjangoObjectType
-from graphene_django.filter import DjangoFilterConnectionField
 
-from src.apps.shop.models import Product
+from src.apps.account.schema import AuthorType
+from src.apps.shop.choices import ProductFacetChoices
+from src.apps.shop.filters import filter_price_range
+from src.apps.shop.models import (
+    Category,
+    OrderCart,
+    OrderCartItem,
+    Product,
+    ProductColor,
+)
+from src.apps.shop.models.product import ProductPhoto
+from src.apps.shop.search import FALSE, TRUE, filter_by_facets, search_products
+from src.core.graphql.connection import KeysetConnectionField
 
+# same filters as ProductSearchFilter and ProductPriceFilter of the REST API
+PRODUCT_FILTERS = {
+    "q": graphene.String(),
+    "category": graphene.List(graphene.NonNull(graphene.Int)),
+    "color": graphene.List(graphene.NonNull(graphene.Int)),
+    "is_digital": graphene.Boolean(),
+    "price_min": graphene.Decimal(),
+    "price_max": graphene.Decimal(),
+}
 
-class CategoryNode(DjangoObjectType):
+
+def filter_products(
+    queryset,
+    q=None,
+    category=None,
+    color=None,
+    is_digital=None,
+    price_min=None,
+    price_max=None,
+):
+    """Over the search index and the converted price columns, all in SQL"""
+    if q:
+        queryset = search_products(queryset, q)
+    if category:
+        queryset = filter_by_facets(queryset, ProductFacetChoices.CATEGORY, category)
+    if color:
+        queryset = filter_by_facets(queryset, ProductFacetChoices.COLOR, color)
+    if is_digital is not None:
+        queryset = filter_by_facets(
+            queryset, ProductFacetChoices.DIGITAL, [TRUE if is_digital else FALSE]
+        )
+    return filter_price_range(queryset, price_min, price_max)
+
+
+class ColorType(DjangoObjectType):
     class Meta:
-        model = Product
-        filter_fields = ["title", "slug"]
-        interfaces = (relay.Node,)
+        model = ProductColor
+        fields = ("id", "color")
+
+
+class ProductPhotoType(DjangoObjectType):
+    image_preview = graphene.String()
+    image_srcset = GenericScalar()
+
+    class Meta:
+        model = ProductPhoto
+        fields = ("id", "image_alt")
+
+    def resolve_image_preview(self, info):
+        return self.get_image()
+
+    def resolve_image_srcset(self, info):
+        return self.get_srcset()
 
 
 class ProductNode(DjangoObjectType):
+    price = graphene.String()
+    sale = graphene.String()
+    image_preview = graphene.String()
+    image_srcset = GenericScalar()
+    author = graphene.Field(AuthorType)
+    categories = graphene.List(graphene.NonNull(lambda: CategoryNode))
+    colors = graphene.List(graphene.NonNull(ColorType))
+    photos = graphene.List(graphene.NonNull(ProductPhotoType))
+
     class Meta:
         model = Product
-        filter_fields = {
-            "code": ["exact"],
-            "title": ["exact"],
-            "slug": ["exact"],
-            "sale": ["exact"],
-            "price": ["exact", "icontains", "istartswith"],
-            "notes": ["exact", "icontains"],
-            "author": ["exact"],
-            "image_preview": ["exact"],
-            "category": ["exact"],
-            "category__title": ["exact"],
-        }
         interfaces = (relay.Node,)
+        fields = (
+            "id",
+            "code",
+            "title",
+            "slug",
+            "description",
+            "excerpt",
+            "count",
+            "type_product",
+            "material",
+            "included",
+            "height",
+            "weight",
+            "is_digital",
+            "image_alt",
+            "title_seo",
+            "meta_keywords",
+            "meta_description",
+            "created_at",
+            "updated_at",
+        )
+
+    @classmethod
+    def get_queryset(cls, queryset, info):
+        return queryset.filter(is_active=True)
+
+    def resolve_price(self, info):
+        return self.get_price()
+
+    def resolve_sale(self, info):
+        return self.get_sale()
+
+    def resolve_image_preview(self, info):
+        return self.get_image()
+
+    def resolve_image_srcset(self, info):
+        return self.get_srcset()
+
+    def resolve_author(self, info):
+        return info.context.loaders.load(self, "author")
+
+    def resolve_categories(self, info):
+        return info.context.loaders.load(self, "categories")
+
+    def resolve_colors(self, info):
+        return info.context.loaders.load(self, "colors")
+
+    def resolve_photos(self, info):
+        return info.context.loaders.load(self, "photo_product")
+
+
+class CategoryNode(DjangoObjectType):
+    products = KeysetConnectionField(
+        lambda: ProductNode._meta.connection, **PRODUCT_FILTERS
+    )
+
+    class Meta:
+        model = Category
+        interfaces = (relay.Node,)
+        fields = (
+            "id",
+            "title",
+            "slug",
+            "title_seo",
+            "meta_keywords",
+            "meta_description",
+        )
+
+    def resolve_products(self, info, **filters):
+        """
+        One query per category, a connection is paged on its own,
+        so the field is weighted in GRAPHQL_FIELD_WEIGHTS
+        """
+        products = Product.objects.filter(is_active=True, categories=self)
+        return filter_products(products, **filters)
+
+
+class OrderItemType(DjangoObjectType):
+    product = graphene.Field(ProductNode)
+    item_total_cost = graphene.String()
+
+    class Meta:
+        model = OrderCartItem
+        fields = ("id", "amount")
+
+    def resolve_product(self, info):
+        return info.context.loaders.load(self, "product")
+
+    def resolve_item_total_cost(self, info):
+        return str(self.item_total_cost)
+
+
+class OrderStatusType(DjangoObjectType):
+    """
+    Order looked up by its number, the same fields as OrderRetrieveSerializer.
+    The contact details are left to OrderNode of the staff.
+    """
+
+    products = graphene.List(graphene.NonNull(OrderItemType))
+
+    class Meta:
+        model = OrderCart
+        fields = ("order_number", "status")
+        skip_registry = True
+
+    def resolve_products(self, info):
+        return info.context.loaders.load(self, "ordercartitem_ordercart")
+
+
+class OrderNode(DjangoObjectType):
+    order_total_cost = graphene.String()
+    items = graphene.List(graphene.NonNull(OrderItemType))
+
+    class Meta:
+        model = OrderCart
+        interfaces = (relay.Node,)
+        fields = (
+            "id",
+            "order_number",
+            "status",
+            "address",
+            "phone",
+            "email",
+            "comments",
+            "created_at",
+            "updated_at",
+        )
+
+    @classmethod
+    def get_queryset(cls, queryset, info):
+        """Orders and their contact details are for the staff only"""
+        if not info.context.user.is_staff:
+            return queryset.none()
+        return queryset
+
+    def resolve_order_total_cost(self, info):
+        return str(self.order_total_cost)
+
+    def resolve_items(self, info):
+        return info.context.loaders.load(self, "ordercartitem_ordercart")
 
 
 class Query(graphene.ObjectType):
-    category = relay.Node.Field(CategoryNode)
-    all_categories = DjangoFilterConnectionField(CategoryNode)
+    node = relay.Node.Field()
+    category = graphene.Field(CategoryNode, slug=graphene.String(required=True))
+    all_categories = KeysetConnectionField(
+        CategoryNode._meta.connection, ordering=("id",)
+    )
+    product = graphene.Field(ProductNode, slug=graphene.String(required=True))
+    all_products = KeysetConnectionField(
+        ProductNode._meta.connection, **PRODUCT_FILTERS
+    )
+    # by the number, as the REST API does for the customer who made it
+    order = graphene.Field(OrderStatusType, order_number=graphene.String(required=True))
+    all_orders = KeysetConnectionField(OrderNode._meta.connection)
+
+    def resolve_category(self, info, slug):
+        return info.context.loaders.first(Category.objects.filter(slug=slug))
+
+    def resolve_all_categories(self, info):
+        return Category.objects.all()
+
+    def resolve_product(self, info, slug):
+        return info.context.loaders.first(
+            Product.objects.filter(is_active=True, slug=slug)
+        )
+
+    def resolve_all_products(self, info, **filters):
+        return filter_products(Product.objects.filter(is_active=True), **filters)
+
+    def resolve_order(self, info, order_number):
+        return info.context.loaders.first(
+            OrderCart.objects.filter(order_number=order_number)
+        )
+
+    def resolve_all_orders(self, info):
+        return OrderNode.get_queryset(OrderCart.objects.all(), info)
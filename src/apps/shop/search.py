@@ -0,0 +1,184 @@
+import re
+import typing
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils.html import strip_tags
+from modeltranslation.utils import build_localized_fieldname
+
+from src.apps.shop.choices import ProductFacetChoices
+from src.apps.shop.models import (
+    Product,
+    ProductSearchTerm,
+    ProductFacet,
+    FacetCount,
+)
+from src.apps.shop.models.product import converted_field_name
+
+TERM_RE = re.compile(r"\w+")
+TRUE, FALSE = "true", "false"
+
+Facet = typing.Tuple[str, str]
+
+
+def tokenize(text: str) -> typing.List[str]:
+    """Lower case words of the text in order, html tags dropped"""
+    max_length = ProductSearchTerm._meta.get_field("term").max_length
+    return [
+        term[:max_length]
+        for term in TERM_RE.findall(strip_tags(text).lower().replace("ё", "е"))
+        if len(term) >= settings.SEARCH_MIN_TERM_LENGTH
+    ]
+
+
+def get_product_terms(product: Product) -> typing.Set[str]:
+    if not product.is_active:
+        return set()
+    text = " ".join(
+        getattr(product, build_localized_fieldname(field, language)) or ""
+        for field in settings.SEARCH_FIELDS
+        for language in settings.MODELTRANSLATION_LANGUAGES
+    )
+    return set(tokenize(text))
+
+
+def get_price_bucket(amount, currency: str) -> typing.Optional[str]:
+    """'10-25' for 12 EUR, '250-' above the last bound"""
+    if amount is None:
+        return None
+    bounds = settings.SEARCH_PRICE_BUCKETS[currency]
+    for low, high in zip(bounds, bounds[1:]):
+        if low <= amount < high:
+            return f"{low}-{high}"
+    return f"{bounds[-1]}-" if amount >= bounds[-1] else None
+
+
+def get_product_facets(product: Product) -> typing.Set[Facet]:
+    if not product.is_active:
+        return set()
+    facets = {
+        (ProductFacetChoices.DIGITAL, TRUE if product.is_digital else FALSE),
+        *(
+            (ProductFacetChoices.CATEGORY, str(pk))
+            for pk in product.categories.values_list("pk", flat=True)
+        ),
+        *(
+            (ProductFacetChoices.COLOR, str(pk))
+            for pk in product.colors.values_list("pk", flat=True)
+        ),
+    }
+    return facets | get_price_facets(product)
+
+
+def get_price_facets(product: Product) -> typing.Set[Facet]:
+    """Price bucket of the product in every currency"""
+    facets = set()
+    for currency in settings.CURRENCIES:
+        field = converted_field_name("price", currency)
+        bucket = get_price_bucket(getattr(product, field), currency)
+        if bucket is not None:
+            facets.add((field, bucket))
+    return facets
+
+
+def _facets_q(facets: typing.Iterable[Facet]) -> Q:
+    return reduce(or_, (Q(facet=facet, value=value) for facet, value in facets))
+
+
+def _update_facets(product: Product, facets: typing.Set[Facet]):
+    """Write the difference and move FacetCount by it, no GROUP BY"""
+    current = set(
+        ProductFacet.objects.filter(product=product).values_list("facet", "value")
+    )
+    removed, added = current - facets, facets - current
+    if removed:
+        ProductFacet.objects.filter(_facets_q(removed), product=product).delete()
+        FacetCount.objects.filter(_facets_q(removed)).update(count=F("count") - 1)
+    if added:
+        ProductFacet.objects.bulk_create(
+            ProductFacet(product=product, facet=facet, value=value)
+            for facet, value in added
+        )
+        FacetCount.objects.bulk_create(
+            (FacetCount(facet=facet, value=value) for facet, value in added),
+            ignore_conflicts=True,
+        )
+        FacetCount.objects.filter(_facets_q(added)).update(count=F("count") + 1)
+
+
+def _update_terms(product: Product, terms: typing.Set[str]):
+    current = set(
+        ProductSearchTerm.objects.filter(product=product).values_list("term", flat=True)
+    )
+    if current - terms:
+        ProductSearchTerm.objects.filter(
+            product=product, term__in=current - terms
+        ).delete()
+    if terms - current:
+        ProductSearchTerm.objects.bulk_create(
+            ProductSearchTerm(product=product, term=term) for term in terms - current
+        )
+
+
+def index_product(product: Product):
+    """Bring the search terms and facets of the product up to date"""
+    with transaction.atomic():
+        # the diff of two concurrent saves of the product must not overlap
+        list(Product.objects.select_for_update().filter(pk=product.pk).values("pk"))
+        _update_terms(product, get_product_terms(product))
+        _update_facets(product, get_product_facets(product))
+
+
+def unindex_product(product: Product):
+    """Before the product is deleted, the rows go with it but the counts stay"""
+    with transaction.atomic():
+        _update_facets(product, set())
+
+
+def drop_facet_value(facet: str, value: str):
+    """The category or color is deleted, m2m_changed is not sent for it"""
+    ProductFacet.objects.filter(facet=facet, value=value).delete()
+    FacetCount.objects.filter(facet=facet, value=value).delete()
+
+
+def search_products(queryset, query: str):
+    """Products with every word of the query, the last one may be a prefix"""
+    terms = list(dict.fromkeys(tokenize(query)))
+    for i, term in enumerate(terms):
+        lookup = "term__startswith" if i == len(terms) - 1 else "term"
+        queryset = queryset.filter(
+            pk__in=ProductSearchTerm.objects.filter(**{lookup: term}).values(
+                "product_id"
+            )
+        )
+    return queryset
+
+
+def filter_by_facets(queryset, facet: str, values: typing.Iterable[str]):
+    """Products with any of the values of the facet"""
+    return queryset.filter(
+        pk__in=ProductFacet.objects.filter(facet=facet, value__in=values).values(
+            "product_id"
+        )
+    )
+
+
+def get_facet_counts(currency: str) -> typing.Dict[str, typing.Dict[str, int]]:
+    """{facet: {value: count}} with the price buckets of the currency"""
+    price_facet = converted_field_name("price", currency)
+    counts = {}
+    for facet, value, count in FacetCount.objects.filter(
+        facet__in=(
+            ProductFacetChoices.CATEGORY,
+            ProductFacetChoices.COLOR,
+            ProductFacetChoices.DIGITAL,
+            price_facet,
+        ),
+        count__gt=0,
+    ).values_list("facet", "value", "count"):
+        facet = "price" if facet == price_facet else facet
+        counts.setdefault(facet, {})[value] = count
+    return counts
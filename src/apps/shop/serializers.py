@@ -1,5 +1,6 @@
 import logging
 
+from django.db import transaction
 from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
@@ -11,7 +12,10 @@ from src.apps.shop.models import (
     OrderCart,
     ProductColor,
 )
-from src.apps.shop.models.product import ProductPhoto
+from src.apps.shop.models.product import PRICE_FIELDS, ProductPhoto
+from src.apps.shop.stock import InsufficientStock, reserve_stock
+from src.core.mixins.fields import SparseFieldsSerializerMixin
+from src.core.mixins.mixin import IMAGE_FIELDS
 
 logger = logging.getLogger(__name__)
 
@@ -31,8 +35,8 @@ class CategoryRetrieveSerializer(serializers.ModelSerializer):
         )
 
     def get_products(self, obj):
-        products = Product.objects.filter(categories=obj, is_active=True)
-        return ProductListSerializer(products, many=True).data
+        """The page of products paginated by CategoryViewSet.retrieve"""
+        return self.context.get("products")
 
 
 class CategoryListSerializer(serializers.ModelSerializer):
@@ -49,17 +53,21 @@ class ColorSerializer(serializers.ModelSerializer):
 
 class ProductPhotoSerializer(serializers.ModelSerializer):
     image_preview = serializers.CharField(source="get_image")
+    image_srcset = serializers.DictField(source="get_srcset", read_only=True)
 
     class Meta:
         model = ProductPhoto
-        fields = ("image_preview", "image_alt")
+        fields = ("image_preview", "image_srcset", "image_alt")
 
 
-class ProductRetrieveSerializer(serializers.ModelSerializer):
+class ProductRetrieveSerializer(
+    SparseFieldsSerializerMixin, serializers.ModelSerializer
+):
     categories = CategoryListSerializer(many=True, read_only=True)
     colors = ColorSerializer(read_only=True, many=True)
     photo_product = ProductPhotoSerializer(many=True, read_only=True)
     image_preview = serializers.CharField(source="get_image")
+    image_srcset = serializers.DictField(source="get_srcset", read_only=True)
     price = serializers.CharField(source="get_price")
     sale = serializers.CharField(source="get_sale")
 
@@ -71,6 +79,7 @@ class ProductRetrieveSerializer(serializers.ModelSerializer):
             "title",
             "slug",
             "description",
+            "excerpt",
             "price",
             "price_currency",
             "sale",
@@ -87,6 +96,7 @@ class ProductRetrieveSerializer(serializers.ModelSerializer):
             "photo_product",
             # ImagesMixin
             "image_preview",
+            "image_srcset",
             "image_alt",
             # SeoMixin
             "title_seo",
@@ -95,12 +105,20 @@ class ProductRetrieveSerializer(serializers.ModelSerializer):
             "created_at",
             "updated_at",
         )
+        # columns of the non-model fields, see SparseFieldsSerializerMixin
+        field_columns = {
+            "price": PRICE_FIELDS,
+            "sale": PRICE_FIELDS,
+            "image_preview": IMAGE_FIELDS,
+            "image_srcset": IMAGE_FIELDS,
+        }
 
 
-class ProductListSerializer(serializers.ModelSerializer):
+class ProductListSerializer(SparseFieldsSerializerMixin, serializers.ModelSerializer):
     categories = CategoryListSerializer(many=True, read_only=True)
     colors = ColorSerializer(read_only=True, many=True)
     image_preview = serializers.CharField(source="get_image")
+    image_srcset = serializers.DictField(source="get_srcset", read_only=True)
     price = serializers.CharField(source="get_price")
     sale = serializers.CharField(source="get_sale")
 
@@ -112,22 +130,62 @@ class ProductListSerializer(serializers.ModelSerializer):
             "title",
             "slug",
             "description",
+            "excerpt",
             "price",
             "sale",
             "colors",
             "categories",
             "author",
             "image_preview",
+            "image_srcset",
             "image_alt",
         )
+        # columns of the non-model fields, see SparseFieldsSerializerMixin
+        field_columns = {
+            "price": PRICE_FIELDS,
+            "sale": PRICE_FIELDS,
+            "image_preview": IMAGE_FIELDS,
+            "image_srcset": IMAGE_FIELDS,
+        }
+
+
+class OrderProductField(serializers.PrimaryKeyRelatedField):
+    """Looks products up in the batch loaded by OrderItemListSerializer"""
+
+    products = None
+
+    def to_internal_value(self, data):
+        if self.products is None:
+            return super().to_internal_value(data)
+        try:
+            return self.products[int(data)]
+        except KeyError:
+            self.fail("does_not_exist", pk_value=data)
+        except (TypeError, ValueError):
+            self.fail("incorrect_type", data_type=type(data).__name__)
+
+
+class OrderItemListSerializer(serializers.ListSerializer):
+    def to_internal_value(self, data):
+        if isinstance(data, list):
+            ids = set()
+            for item in data:
+                try:
+                    ids.add(int(item.get("product")))
+                except (AttributeError, TypeError, ValueError):
+                    continue
+            self.child.fields["product"].products = Product.objects.in_bulk(ids)
+        return super().to_internal_value(data)
 
 
 class OrderItemSerializer(serializers.ModelSerializer):
+    product = OrderProductField(queryset=Product.objects.all())
     code = serializers.CharField(source="product.code", required=False)
 
     class Meta:
         model = OrderCartItem
         fields = ("product", "amount", "code")
+        list_serializer_class = OrderItemListSerializer
 
 
 class OrderSerializer(serializers.Serializer):
@@ -155,14 +213,20 @@ class OrderSerializer(serializers.Serializer):
 
     def create(self, validated_data):
         products_data = validated_data.pop("products")
-        order_cart = OrderCart.objects.create(**validated_data)
-        bulk_inserts = []
-        for product_data in products_data:
-            bulk_inserts.append(OrderCartItem(order_cart=order_cart, **product_data))
-        OrderCartItem.objects.bulk_create(bulk_inserts)
-        # TODO: item_data = OrderItemSerializer(item_data, many=True).data
-        # need call save() bulk_create do *not* call save()
-        order_cart.save()
+        items = [OrderCartItem(**product_data) for product_data in products_data]
+        # items are priced in memory before insert, no UPDATE per item
+        order_total_cost = OrderCart.price_items(items)
+        with transaction.atomic():
+            try:
+                reserve_stock({item.product_id: item.amount for item in items})
+            except InsufficientStock:
+                raise ValidationError({"products": [_("Product less than requested")]})
+            order_cart = OrderCart.objects.create(
+                order_total_cost=order_total_cost, **validated_data
+            )
+            for item in items:
+                item.order_cart = order_cart
+            OrderCartItem.objects.bulk_create(items)
         return order_cart
 
     def to_representation(self, instance):
@@ -0,0 +1,65 @@
+from django.db import transaction
+from django.db.models.signals import post_save, post_delete, pre_delete, m2m_changed
+from django.dispatch import receiver
+from djmoney.contrib.exchange.models import ExchangeBackend
+
+from src.apps.shop.choices import ProductFacetChoices
+from src.apps.shop.exchange import invalidate_rates
+from src.apps.shop.models import Product, Category, ProductColor
+from src.apps.shop.search import index_product, unindex_product, drop_facet_value
+from src.apps.shop.tasks import refresh_product_prices
+
+
+def _rates_updated(backend: str):
+    invalidate_rates(backend=backend)
+    refresh_product_prices.delay()
+
+
+@receiver(post_save, sender=ExchangeBackend)
+@receiver(post_delete, sender=ExchangeBackend)
+def exchange_backend_changed(sender, instance, **kwargs):
+    # update_rates saves the backend first and replaces the rates after,
+    # drop the snapshot only when the whole transaction is committed
+    transaction.on_commit(lambda: _rates_updated(backend=instance.name))
+
+
+@receiver(post_save, sender=Product)
+def product_saved(sender, instance, **kwargs):
+    index_product(instance)
+
+
+@receiver(pre_delete, sender=Product)
+def product_deleted(sender, instance, **kwargs):
+    unindex_product(instance)
+
+
+@receiver(m2m_changed, sender=Product.categories.through)
+@receiver(m2m_changed, sender=Product.colors.through)
+def product_relations_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if not reverse:
+        if action in ("post_add", "post_remove", "post_clear"):
+            index_product(instance)
+        return
+
+    # category.product_categories.add(...), instance is the category
+    if action == "pre_clear":
+        instance._cleared_product_ids = set(
+            sender.objects.filter(**{instance._meta.model_name: instance}).values_list(
+                "product_id", flat=True
+            )
+        )
+    elif action in ("post_add", "post_remove", "post_clear"):
+        if action == "post_clear":
+            pk_set = instance.__dict__.pop("_cleared_product_ids", set())
+        for product in Product.objects.filter(pk__in=pk_set):
+            index_product(product)
+
+
+@receiver(post_delete, sender=Category)
+def category_deleted(sender, instance, **kwargs):
+    drop_facet_value(ProductFacetChoices.CATEGORY, str(instance.pk))
+
+
+@receiver(post_delete, sender=ProductColor)
+def color_deleted(sender, instance, **kwargs):
+    drop_facet_value(ProductFacetChoices.COLOR, str(instance.pk))
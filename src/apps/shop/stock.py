@@ -0,0 +1,41 @@
+import logging
+import typing
+
+from django.db import transaction
+from django.db.models import Case, F, Q, When
+from django.db.models.functions import Now
+
+from src.apps.shop.models import Product
+from src.core.utils.response_cache import invalidate_tags, pk_tag
+
+logger = logging.getLogger(__name__)
+
+
+class InsufficientStock(Exception):
+    """Some product of the order has less in stock than requested"""
+
+
+def reserve_stock(lines: typing.Dict[int, int]) -> None:
+    """
+    Decrement Product.count for every {product_id: amount} of the order
+    with one conditional UPDATE. All lines are reserved or none of them,
+    the rows are locked by the UPDATE itself, no SELECT ... FOR UPDATE.
+    """
+    if not lines:
+        return
+    condition, whens = Q(), []
+    for product_id, amount in lines.items():
+        condition |= Q(pk=product_id, count__gte=amount)
+        whens.append(When(pk=product_id, then=F("count") - amount))
+
+    with transaction.atomic():
+        updated = Product.objects.filter(condition).update(
+            count=Case(*whens, default=F("count")), updated_at=Now()
+        )
+        if updated != len(lines):
+            # leaving the atomic block with an exception rolls the UPDATE back
+            logger.info(f"Not enough stock for order lines {lines}")
+            raise InsufficientStock(lines)
+        # the cached product pages show the count
+        tags = [pk_tag(Product, product_id) for product_id in lines]
+        transaction.on_commit(lambda: invalidate_tags(tags))
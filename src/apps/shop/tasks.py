@@ -0,0 +1,66 @@
+import logging
+import typing
+
+from django.utils import timezone
+
+from src.apps.shop.models import Product
+from src.apps.shop.models.product import PRICE_FIELDS
+from src.apps.shop.search import get_price_facets, index_product
+from src.core.celery import app
+from src.core.utils.response_cache import instance_tag, invalidate_tags, model_tag
+
+logger = logging.getLogger(__name__)
+
+
+@app.task()
+def refresh_product_prices(
+    product_ids: typing.Optional[typing.List[int]] = None, batch_size: int = 500
+) -> int:
+    """Recompute the converted price columns after the rates were updated"""
+    # every column set_converted_prices() reads and writes, none is deferred
+    products = Product.objects.only("id", *PRICE_FIELDS).order_by("pk")
+    if product_ids is not None:
+        products = products.filter(pk__in=product_ids)
+
+    def save(batch, fields):
+        Product.objects.bulk_update(batch, fields + ["updated_at"])
+        # nor do the cached responses learn about it
+        invalidate_tags([model_tag(Product), *map(instance_tag, batch)])
+        return len(batch)
+
+    updated, batch, fields, moved = 0, [], None, []
+    for product in products.iterator(chunk_size=batch_size):
+        price_facets = get_price_facets(product)
+        fields = product.set_converted_prices()
+        if get_price_facets(product) != price_facets:
+            moved.append(product.pk)
+        product.updated_at = timezone.now()
+        batch.append(product)
+        if len(batch) >= batch_size:
+            updated, batch = updated + save(batch, fields), []
+    if batch:
+        updated += save(batch, fields)
+    logger.info(
+        f"Converted prices refreshed for {updated} products, "
+        f"{len(moved)} moved to another price bucket"
+    )
+    # bulk_update sends no post_save, the price buckets are moved here
+    if moved:
+        reindex_products(moved, batch_size)
+    return updated
+
+
+@app.task()
+def reindex_products(
+    product_ids: typing.Optional[typing.List[int]] = None, batch_size: int = 500
+) -> int:
+    """Rebuild the search terms and facets, e.g. for products created before them"""
+    products = Product.objects.order_by("pk")
+    if product_ids is not None:
+        products = products.filter(pk__in=product_ids)
+    indexed = 0
+    for product in products.iterator(chunk_size=batch_size):
+        index_product(product)
+        indexed += 1
+    logger.info(f"Search index rebuilt for {indexed} products")
+    return indexed
@@ -12,6 +12,7 @@ class ProductTranslationOptions(TranslationOptions):
     fields = (
         "title",
         "description",
+        "excerpt",
         "type_product",
         "material",
         "included",
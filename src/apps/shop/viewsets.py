@@ -1,9 +1,13 @@
+from django.conf import settings
+from django.db.models import Prefetch
 from rest_framework import status, mixins
-from rest_framework.decorators import permission_classes
+from modeltranslation.utils import get_language
+from rest_framework.decorators import permission_classes, action
 from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.viewsets import ModelViewSet, GenericViewSet
 
+from src.apps.shop.filters import ProductPriceFilter, ProductSearchFilter
 from src.apps.shop.models.order import OrderCart, OrderCartItem
 from src.apps.shop.serializers import (
     OrderSerializer,
@@ -14,13 +18,21 @@ from src.apps.shop.serializers import (
     ProductRetrieveSerializer,
     OrderRetrieveSerializer,
 )
-from src.apps.shop.models import Product, Category
+from src.apps.shop.models import Product, Category, ProductColor
+from src.apps.shop.models.product import ProductPhoto
+from src.apps.shop.search import get_facet_counts
+from src.core.mixins.mixin import IMAGE_FIELDS
+from src.core.mixins.cache import ConditionalGetMixin
+from src.core.mixins.fields import SparseFieldsetMixin
+from src.core.pagination import KeysetPagination
 
 
-class ProductViewSet(ModelViewSet):
-    queryset = Product.objects.filter(is_active=True).prefetch_related("categories")
+class ProductViewSet(ConditionalGetMixin, SparseFieldsetMixin, ModelViewSet):
+    queryset = Product.objects.filter(is_active=True)
     lookup_field = "slug"
     http_method_names = ["get"]
+    filter_backends = (ProductSearchFilter, ProductPriceFilter)
+    pagination_class = KeysetPagination
 
     serializer_classes = {
         "list": ProductListSerializer,
@@ -30,8 +42,47 @@ class ProductViewSet(ModelViewSet):
     def get_serializer_class(self):
         return self.serializer_classes.get(self.action, ProductListSerializer)
 
-
-class CategoryViewSet(ModelViewSet):
+    @classmethod
+    def get_prefetches(cls, action: str):
+        """Relations the serializer of the action reads, one query each"""
+        prefetches = [
+            Prefetch("categories", queryset=Category.objects.only("title", "slug")),
+            Prefetch("colors", queryset=ProductColor.objects.only("color")),
+        ]
+        if action == "retrieve":
+            prefetches.append(
+                Prefetch(
+                    "photo_product",
+                    queryset=ProductPhoto.objects.only("product_id", *IMAGE_FIELDS),
+                )
+            )
+        return prefetches
+
+    @classmethod
+    def build_queryset(cls, action: str, queryset=None):
+        """Active products ready for the serializer of the action"""
+        queryset = cls.queryset.all() if queryset is None else queryset
+        queryset = queryset.prefetch_related(*cls.get_prefetches(action))
+        if action in cls.serializer_classes:
+            # columns the serializer of the action reads, the rest is deferred,
+            # and those of the ordering the paginator makes its cursor of
+            columns = cls.serializer_classes[action].get_columns()
+            ordering = (name.lstrip("-") for name in queryset.model._meta.ordering)
+            queryset = queryset.only(*columns, *ordering)
+        return queryset
+
+    def get_queryset(self):
+        return self.build_queryset(self.action, super().get_queryset())
+
+    @action(detail=False)
+    def facets(self, request):
+        """Active products per category, color, is_digital and price bucket"""
+        currency = settings.LANG_EXCHANGE.get(get_language(), settings.BASE_CURRENCY)
+        self.tag_response(models=[Product, Category, ProductColor])
+        return Response({"currency": currency, **get_facet_counts(currency)})
+
+
+class CategoryViewSet(ConditionalGetMixin, ModelViewSet):
     """Category for products"""
 
     queryset = Category.objects.all()
@@ -46,6 +97,22 @@ class CategoryViewSet(ModelViewSet):
     def get_serializer_class(self):
         return self.serializer_classes.get(self.action, CategoryListSerializer)
 
+    def retrieve(self, request, *args, **kwargs):
+        """Category with one page of its products"""
+        category = self.get_object()
+        paginator = KeysetPagination()
+        products = paginator.paginate_queryset(
+            ProductViewSet.build_queryset("list").filter(categories=category),
+            request,
+            view=self,
+        )
+        self.tag_response(*products, models=[Product])
+        context = self.get_serializer_context()
+        context["products"] = paginator.get_paginated_response(
+            ProductListSerializer(products, many=True, context=context).data
+        ).data
+        return Response(self.get_serializer(category, context=context).data)
+
 
 class OrderViewSet(mixins.CreateModelMixin, mixins.RetrieveModelMixin, GenericViewSet):
     """Viewsets order
@@ -0,0 +1,8 @@
+from django.apps import AppConfig
+
+
+class ShorterConfig(AppConfig):
+    name = "src.apps.shorter"
+
+    def ready(self):
+        import src.apps.shorter.signals  # noqa
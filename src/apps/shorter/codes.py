@@ -0,0 +1,113 @@
+import string
+import threading
+import typing
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.db.models.functions import Greatest
+
+ALPHABET = string.digits + string.ascii_letters
+SEQUENCE_NAME = "url_short"
+SEQUENCE_KEY = "shorter:sequence:url_short"
+# any multiplier coprime with 62 makes number -> code a bijection,
+# sequential numbers do not give guessable neighbour codes
+MULTIPLIER = 1_580_030_173
+OFFSET = 918_273_645
+
+
+def encode(number: int, length: int = settings.SHORTER_CODE_LENGTH) -> str:
+    """Number of the sequence to a fixed length base62 code, never repeats"""
+    space = len(ALPHABET) ** length
+    if not 0 <= number < space:
+        raise OverflowError(f"Short code space of length {length} is exhausted")
+    number = (number * MULTIPLIER + OFFSET) % space
+    chars = []
+    for _ in range(length):
+        number, index = divmod(number, len(ALPHABET))
+        chars.append(ALPHABET[index])
+    return "".join(reversed(chars))
+
+
+class DatabaseSequence:
+    """Block leases from the ShortCodeSequence row, also the redis checkpoint"""
+
+    def lease(self, size: int) -> typing.Tuple[int, int]:
+        from src.apps.shorter.models import ShortCodeSequence
+
+        with transaction.atomic():
+            sequence = ShortCodeSequence.objects.filter(pk=SEQUENCE_NAME)
+            if not sequence.update(value=F("value") + size):
+                ShortCodeSequence.objects.get_or_create(pk=SEQUENCE_NAME)
+                sequence.update(value=F("value") + size)
+            end = sequence.values_list("value", flat=True).get()
+        return end - size, end
+
+    def checkpoint(self) -> int:
+        from src.apps.shorter.models import ShortCodeSequence
+
+        sequence = ShortCodeSequence.objects.filter(pk=SEQUENCE_NAME)
+        return sequence.values_list("value", flat=True).first() or 0
+
+    def save_checkpoint(self, value: int) -> None:
+        from src.apps.shorter.models import ShortCodeSequence
+
+        sequence = ShortCodeSequence.objects.filter(pk=SEQUENCE_NAME)
+        if not sequence.update(value=Greatest(F("value"), value)):
+            ShortCodeSequence.objects.get_or_create(
+                pk=SEQUENCE_NAME, defaults={"value": value}
+            )
+
+
+class RedisSequence:
+    """Block leases with INCRBY, the DB keeps the high-water mark"""
+
+    def __init__(self, client):
+        self.client = client
+        self.database = DatabaseSequence()
+
+    def lease(self, size: int) -> typing.Tuple[int, int]:
+        if not self.client.exists(SEQUENCE_KEY):
+            # redis lost the counter, continue after the last leased block
+            self.client.set(SEQUENCE_KEY, self.database.checkpoint(), nx=True)
+        end = self.client.incrby(SEQUENCE_KEY, size)
+        self.database.save_checkpoint(end)
+        return end - size, end
+
+
+class CodeAllocator:
+    """
+    Hands out short codes from a block of the sequence leased by this process,
+    one round trip to redis (or the DB) per block_size codes.
+    """
+
+    def __init__(self, sequence, block_size: int = settings.SHORTER_CODE_BLOCK_SIZE):
+        self.sequence = sequence
+        self.block_size = block_size
+        self._next = self._end = 0
+        self._lock = threading.Lock()
+
+    def allocate(self, count: int = 1) -> typing.List[str]:
+        codes = []
+        with self._lock:
+            while len(codes) < count:
+                if self._next >= self._end:
+                    size = max(self.block_size, count - len(codes))
+                    self._next, self._end = self.sequence.lease(size)
+                take = min(self._end - self._next, count - len(codes))
+                codes.extend(encode(n) for n in range(self._next, self._next + take))
+                self._next += take
+        return codes
+
+
+_allocator = None
+
+
+def allocate_codes(count: int = 1) -> typing.List[str]:
+    global _allocator
+    if _allocator is None:
+        if settings.REDIS_CONNECT:
+            _allocator = CodeAllocator(RedisSequence(settings.REDIS_CONNECT))
+        else:
+            _allocator = CodeAllocator(DatabaseSequence())
+    return _allocator.allocate(count)
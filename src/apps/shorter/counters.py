@@ -0,0 +1,76 @@
+import logging
+import threading
+import typing
+from collections import Counter
+
+from django.conf import settings
+
+from src.core.utils.async_redis import get_async_client
+
+logger = logging.getLogger(__name__)
+
+CLICKS_KEY = "shorter:clicks"
+
+
+class LocalClickCounter:
+    """In-process stand-in of the redis counter for tests and local runs"""
+
+    def __init__(self):
+        self._clicks = Counter()
+        self._lock = threading.Lock()
+
+    def incr(self, url_short: str, amount: int = 1) -> None:
+        with self._lock:
+            self._clicks[url_short] += amount
+
+    async def aincr(self, url_short: str, amount: int = 1) -> None:
+        self.incr(url_short, amount)
+
+    def pop_all(self) -> typing.Dict[str, int]:
+        with self._lock:
+            clicks, self._clicks = self._clicks, Counter()
+        return dict(clicks)
+
+    def restore(self, clicks: typing.Dict[str, int]) -> None:
+        for url_short, amount in clicks.items():
+            self.incr(url_short, amount)
+
+
+class RedisClickCounter:
+    """Clicks of every short link in one redis hash"""
+
+    def __init__(self, client):
+        self.client = client
+
+    def incr(self, url_short: str, amount: int = 1) -> None:
+        self.client.hincrby(CLICKS_KEY, url_short, amount)
+
+    async def aincr(self, url_short: str, amount: int = 1) -> None:
+        await get_async_client(self.client).hincrby(CLICKS_KEY, url_short, amount)
+
+    def pop_all(self) -> typing.Dict[str, int]:
+        # MULTI/EXEC, clicks after the read go to a new hash
+        pipe = self.client.pipeline(transaction=True)
+        pipe.hgetall(CLICKS_KEY)
+        pipe.delete(CLICKS_KEY)
+        clicks, _ = pipe.execute()
+        return {key.decode(): int(value) for key, value in clicks.items()}
+
+    def restore(self, clicks: typing.Dict[str, int]) -> None:
+        pipe = self.client.pipeline(transaction=False)
+        for url_short, amount in clicks.items():
+            pipe.hincrby(CLICKS_KEY, url_short, amount)
+        pipe.execute()
+
+
+_counter = None
+
+
+def get_click_counter() -> typing.Union[LocalClickCounter, RedisClickCounter]:
+    global _counter
+    if _counter is None:
+        if settings.REDIS_CONNECT:
+            _counter = RedisClickCounter(settings.REDIS_CONNECT)
+        else:
+            _counter = LocalClickCounter()
+    return _counter
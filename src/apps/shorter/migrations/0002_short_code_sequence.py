@@ -0,0 +1,32 @@
+# Generated by Django 4.1.2 on 2026-10-17 06:25
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("shorter", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="ShortCodeSequence",
+            fields=[
+                (
+                    "name",
+                    models.CharField(max_length=32, primary_key=True, serialize=False),
+                ),
+                ("value", models.BigIntegerField(default=0)),
+            ],
+            options={
+                "verbose_name": "Short Code Sequence",
+                "verbose_name_plural": "Short Code Sequences",
+            },
+        ),
+        migrations.AlterField(
+            model_name="urlshorter",
+            name="url_short",
+            field=models.CharField(max_length=16, unique=True),
+        ),
+    ]
@@ -1,18 +1,14 @@
-from math import ceil
-from uuid import uuid4
 from django.conf import settings
 
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 
-
-def generate_short_code(length):
-    return "".join([uuid4().hex for _ in range(ceil(length / 32))])[:length]
+from src.apps.shorter.codes import allocate_codes
 
 
 class UrlShorter(models.Model):
     url = models.URLField(_("Url"), max_length=1024)
-    url_short = models.CharField(max_length=6, unique=True)
+    url_short = models.CharField(max_length=16, unique=True)
     count = models.IntegerField(default=0)
     is_expired = models.BooleanField(default=False)
     created_at = models.DateTimeField(verbose_name=_("Created"), auto_now_add=True)
@@ -37,5 +33,19 @@ class UrlShorter(models.Model):
         update_fields=None,
     ):
         if not self.url_short:
-            self.url_short = generate_short_code(length=6)
+            self.url_short = allocate_codes()[0]
         super().save()
+
+
+class ShortCodeSequence(models.Model):
+    """Last number of the short code sequence leased in blocks"""
+
+    name = models.CharField(max_length=32, primary_key=True)
+    value = models.BigIntegerField(default=0)
+
+    class Meta:
+        verbose_name = "Short Code Sequence"
+        verbose_name_plural = "Short Code Sequences"
+
+    def __str__(self):
+        return f"{self.name} - {self.value}"
@@ -0,0 +1,54 @@
+import typing
+
+from django.conf import settings
+from django.core.cache import cache
+
+from src.apps.shorter.models import UrlShorter
+from src.core.utils.cache import aget_or_compute, get_or_compute
+
+LINK_CACHE_KEY = "shorter:link:{url_short}"
+# cached for unknown codes, so scanners do not reach the DB
+NOT_FOUND = ()
+
+
+class ShortLink(typing.NamedTuple):
+    url: str
+    is_expired: bool
+
+
+def _load_link(url_short: str) -> tuple:
+    row = (
+        UrlShorter.objects.filter(url_short=url_short)
+        .values_list("url", "is_expired")
+        .first()
+    )
+    return NOT_FOUND if row is None else tuple(row)
+
+
+def _get_link_timeout(link: tuple) -> int:
+    if link == NOT_FOUND:
+        return settings.SHORTER_NEGATIVE_CACHE_TIMEOUT
+    return settings.SHORTER_CACHE_TIMEOUT
+
+
+def resolve_short_link(url_short: str) -> typing.Optional[ShortLink]:
+    """
+    Local tier -> shared cache -> DB, unknown codes are cached as well.
+    The "shorter:" keys are kept in the local tier of the two tier cache
+    """
+    key = LINK_CACHE_KEY.format(url_short=url_short)
+    link = get_or_compute(key, lambda: _load_link(url_short), _get_link_timeout)
+    return ShortLink(*link) if link else None
+
+
+async def aresolve_short_link(url_short: str) -> typing.Optional[ShortLink]:
+    """resolve_short_link() for async views, a cached link is read in the event loop"""
+    key = LINK_CACHE_KEY.format(url_short=url_short)
+    link = await aget_or_compute(key, lambda: _load_link(url_short), _get_link_timeout)
+    return ShortLink(*link) if link else None
+
+
+def invalidate_short_links(url_shorts: typing.Iterable[str]) -> None:
+    keys = [LINK_CACHE_KEY.format(url_short=url_short) for url_short in url_shorts]
+    # evicts the local tier of every process as well
+    cache.delete_many(keys)
@@ -1,17 +1,44 @@
+from django.conf import settings
+from django.utils.translation import gettext_lazy as _
 from rest_framework import serializers
+from rest_framework.exceptions import ValidationError
 
 
 import logging
 
+from src.apps.shorter.codes import allocate_codes
 from src.apps.shorter.models import UrlShorter
+from src.apps.shorter.resolver import invalidate_short_links
 
 logger = logging.getLogger(__name__)
 
 
+class UrlShorterListSerializer(serializers.ListSerializer):
+    def validate(self, attrs):
+        if len(attrs) > settings.SHORTER_BULK_CREATE_LIMIT:
+            raise ValidationError(
+                _("No more than %(limit)s links in one request")
+                % {"limit": settings.SHORTER_BULK_CREATE_LIMIT}
+            )
+        return attrs
+
+    def create(self, validated_data):
+        codes = allocate_codes(len(validated_data))
+        links = [
+            UrlShorter(url_short=code, **data)
+            for code, data in zip(codes, validated_data)
+        ]
+        links = UrlShorter.objects.bulk_create(links)
+        # bulk_create sends no post_save, drop negative cache entries here
+        invalidate_short_links(codes)
+        return links
+
+
 class UrlShorterSerializer(serializers.ModelSerializer):
     url = serializers.URLField(required=False)
-    url_short = serializers.URLField(required=False, source="get_url_short")
+    url_short = serializers.URLField(read_only=True, source="get_url_short")
 
     class Meta:
         model = UrlShorter
         fields = ("url", "url_short")
+        list_serializer_class = UrlShorterListSerializer
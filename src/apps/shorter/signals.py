@@ -0,0 +1,11 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from src.apps.shorter.models import UrlShorter
+from src.apps.shorter.resolver import invalidate_short_links
+
+
+@receiver(post_save, sender=UrlShorter)
+@receiver(post_delete, sender=UrlShorter)
+def short_link_changed(sender, instance, **kwargs):
+    invalidate_short_links([instance.url_short])
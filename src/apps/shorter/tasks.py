@@ -0,0 +1,39 @@
+import logging
+
+from django.conf import settings
+from django.db.models import Case, F, Value, When
+
+from src.apps.shorter.counters import get_click_counter
+from src.apps.shorter.models import UrlShorter
+from src.core.celery import app
+
+logger = logging.getLogger(__name__)
+
+
+@app.task()
+def flush_clicks(batch_size: int = settings.SHORTER_CLICKS_BATCH_SIZE) -> int:
+    """Move buffered redirect clicks into UrlShorter.count, one UPDATE per batch"""
+    counter = get_click_counter()
+    clicks = list(counter.pop_all().items())
+    flushed = 0
+    for start in range(0, len(clicks), batch_size):
+        end = start + batch_size
+        batch = clicks[start:end]
+        try:
+            UrlShorter.objects.filter(
+                url_short__in=[url_short for url_short, _ in batch]
+            ).update(
+                count=F("count")
+                + Case(
+                    *[When(url_short=code, then=Value(delta)) for code, delta in batch],
+                    default=Value(0),
+                )
+            )
+        except Exception:
+            # give the rest back to the buffer for the next flush
+            counter.restore(dict(clicks[start:]))
+            logger.exception(f"Clicks flush failed, {len(clicks) - start} returned")
+            raise
+        flushed += len(batch)
+    logger.info(f"Clicks flushed for {flushed} short links")
+    return flushed
@@ -0,0 +1,23 @@
+import logging
+
+from django.http import Http404, HttpResponseNotAllowed, HttpResponseRedirect
+from redis import RedisError
+
+from src.apps.shorter.counters import get_click_counter
+from src.apps.shorter.resolver import aresolve_short_link
+
+logger = logging.getLogger(__name__)
+
+
+async def short_link_redirect(request, url_short):
+    """UrlShorterViewset.retrieve for the ASGI server, see src.core.asgi_urls"""
+    if request.method not in ("GET", "HEAD"):
+        return HttpResponseNotAllowed(["GET"])
+    link = await aresolve_short_link(url_short)
+    if link is None or link.is_expired:
+        raise Http404
+    try:
+        await get_click_counter().aincr(url_short)
+    except RedisError as e:
+        logger.warning(f"Click of {url_short} is not counted - {e}")
+    return HttpResponseRedirect(link.url)
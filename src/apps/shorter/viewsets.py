@@ -1,22 +1,45 @@
-from django.http import HttpResponseRedirect
+import logging
+
+from django.http import HttpResponseRedirect, Http404
+from redis import RedisError
 from rest_framework import mixins
-from rest_framework.permissions import AllowAny
+from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.viewsets import GenericViewSet
 
+from src.apps.shorter.counters import get_click_counter
 from src.apps.shorter.models import UrlShorter
+from src.apps.shorter.resolver import resolve_short_link
 from src.apps.shorter.serializers import UrlShorterSerializer
 
+logger = logging.getLogger(__name__)
+
 
 class UrlShorterViewset(mixins.CreateModelMixin, GenericViewSet):
     permission_classes = (AllowAny,)
     serializer_class = UrlShorterSerializer
     queryset = UrlShorter.objects.all()
-    http_method_names = ["get"]
+    http_method_names = ["get", "post"]
     pagination_class = None
     lookup_field = "url_short"
 
+    def get_permissions(self):
+        if self.action == "create":
+            return [IsAuthenticated()]
+        return super().get_permissions()
+
+    def get_serializer(self, *args, **kwargs):
+        # a list of links is created with one bulk insert
+        kwargs.setdefault("many", isinstance(kwargs.get("data"), list))
+        return super().get_serializer(*args, **kwargs)
+
     def retrieve(self, request, *args, **kwargs):
-        instance = self.get_object()
-        instance.count += 1
-        instance.save()
-        return HttpResponseRedirect(instance.url)
+        url_short = kwargs[self.lookup_field]
+        link = resolve_short_link(url_short)
+        if link is None or link.is_expired:
+            raise Http404
+        # clicks are buffered, src.apps.shorter.tasks.flush_clicks saves them
+        try:
+            get_click_counter().incr(url_short)
+        except RedisError as e:
+            logger.warning(f"Click of {url_short} is not counted - {e}")
+        return HttpResponseRedirect(link.url)
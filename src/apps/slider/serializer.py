@@ -4,6 +4,7 @@ from .models import Slider
 
 class SliderSerializer(serializers.ModelSerializer):
     image_preview = serializers.CharField(source="get_image")
+    image_srcset = serializers.DictField(source="get_srcset", read_only=True)
 
     class Meta:
         model = Slider
@@ -14,5 +15,6 @@ class SliderSerializer(serializers.ModelSerializer):
             "ordering",
             "link",
             "image_preview",
+            "image_srcset",
             "image_alt",
         )
@@ -1,11 +1,12 @@
 from rest_framework import mixins
 from rest_framework.permissions import AllowAny
 from rest_framework.viewsets import GenericViewSet
+from src.core.mixins.cache import ResponseCacheMixin
 from .serializer import SliderSerializer
 from .models import Slider
 
 
-class SliderAPIViewSet(mixins.ListModelMixin, GenericViewSet):
+class SliderAPIViewSet(ResponseCacheMixin, mixins.ListModelMixin, GenericViewSet):
     """Slider viewset"""
 
     queryset = Slider.objects.filter(is_active=True)
@@ -1,7 +1,20 @@
 import os
 
-from django.core.asgi import get_asgi_application
+import django
+from django.core.handlers.asgi import ASGIHandler, ASGIRequest
 
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "src.settings")
 
-application = get_asgi_application()
+
+class AsyncRequest(ASGIRequest):
+    # async views of the hot read endpoints, WSGI keeps ROOT_URLCONF
+    urlconf = "src.core.asgi_urls"
+
+
+class AsyncHandler(ASGIHandler):
+    request_class = AsyncRequest
+
+
+# get_asgi_application() with the handler above
+django.setup(set_prefix=False)
+application = AsyncHandler()
@@ -0,0 +1,41 @@
+# URLs of the ASGI server, src.core.asgi: the public catalogue is served
+# by async views, everything else as by src.core.urls
+from django.urls import re_path
+
+from src.apps.blog.urls import router as blog_router
+from src.apps.menu.urls import menu as menu_router
+from src.apps.shop.urls import router as shop_router
+from src.apps.shorter.views import short_link_redirect
+from src.apps.slider.urls import router_slider
+from src.core.async_views import cached_async_view
+from src.core.mixins.cache import ResponseCacheMixin
+from src.core.urls import urlpatterns as sync_urlpatterns
+
+API_PREFIX = "api/v1/"
+
+
+def async_routes(router):
+    """Routes of the ResponseCacheMixin viewsets of the router, in its order"""
+    return [
+        re_path(
+            f"^{API_PREFIX}{route.pattern.regex.pattern.lstrip('^')}",
+            cached_async_view(route.callback),
+            name=route.name,
+        )
+        for route in router.urls
+        if issubclass(getattr(route.callback, "cls", object), ResponseCacheMixin)
+    ]
+
+
+urlpatterns = [
+    *async_routes(shop_router),
+    *async_routes(blog_router),
+    *async_routes(menu_router),
+    *async_routes(router_slider),
+    re_path(
+        rf"^{API_PREFIX}l/(?P<url_short>[^/.]+)/$",
+        short_link_redirect,
+        name="shorteners-detail",
+    ),
+    *sync_urlpatterns,
+]
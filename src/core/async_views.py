@@ -0,0 +1,29 @@
+import typing
+
+from asgiref.sync import sync_to_async
+from django.utils.translation import get_language
+
+from src.core.mixins.cache import get_cached_http_response, is_response_cacheable
+from src.core.utils.response_cache import aget_cached_response, get_response_key
+
+
+def cached_async_view(view: typing.Callable) -> typing.Callable:
+    """
+    Async view of a ResponseCacheMixin one for src.core.asgi_urls.
+    A cached response is served in the event loop, with no thread held
+    while the client reads it. Anything else is left to the view in a thread.
+    """
+    sync_view = sync_to_async(view)
+
+    async def async_view(request, *args, **kwargs):
+        if is_response_cacheable(request, view.cls.response_cache_timeout):
+            key = get_response_key(request.get_full_path(), get_language())
+            cached = await aget_cached_response(key)
+            if cached is not None:
+                return get_cached_http_response(request, cached)
+            request.response_cache_missed = True
+        return await sync_view(request, *args, **kwargs)
+
+    # csrf_exempt() of Django 4.1 would hide that the view is async
+    async_view.csrf_exempt = getattr(view, "csrf_exempt", False)
+    return async_view
@@ -0,0 +1,71 @@
+from functools import partial
+
+from graphene import NonNull, relay
+from graphene_django.settings import graphene_settings
+from graphql import GraphQLError
+
+from src.core.utils.keyset import (
+    decode_cursor,
+    encode_cursor,
+    get_row_values,
+    keyset_q,
+    to_python,
+)
+
+
+class KeysetConnectionField(relay.ConnectionField):
+    """
+    Relay connection paged by ``first`` and ``after`` on a keyset, as
+    KeysetPagination of the REST API: the cursor holds the ordering values
+    of the row, so a page costs the same wherever it is, no OFFSET.
+    The resolver returns a queryset, the ordering must end with a unique field.
+    """
+
+    def __init__(self, type_, *args, ordering=("-created_at", "-id"), **kwargs):
+        super().__init__(type_, *args, **kwargs)
+        self.ordering = ordering
+        # backward paging would need a reversed query, not offered
+        del self.args["before"], self.args["last"]
+
+    def wrap_resolve(self, parent_resolver):
+        resolver = super(relay.ConnectionField, self).wrap_resolve(parent_resolver)
+        return partial(self.resolve_keyset, resolver)
+
+    def resolve_keyset(self, resolver, root, info, first=None, after=None, **args):
+        connection_type = self.type
+        if isinstance(connection_type, NonNull):
+            connection_type = connection_type.of_type
+        max_limit = graphene_settings.RELAY_CONNECTION_MAX_LIMIT
+        first = max_limit if first is None else first
+        if not 0 <= first <= max_limit:
+            raise GraphQLError(f"first must be between 0 and {max_limit}")
+
+        queryset = resolver(root, info, **args).order_by(*self.ordering)
+        if after is not None:
+            try:
+                values = to_python(queryset.model, self.ordering, decode_cursor(after))
+            except ValueError:
+                raise GraphQLError("Invalid cursor")
+            queryset = queryset.filter(keyset_q(self.ordering, values))
+        rows = list(queryset[: first + 1])
+        has_next_page, rows = len(rows) > first, rows[:first]
+        loaders = getattr(info.context, "loaders", None)
+        if loaders is not None:
+            loaders.seen(rows)
+
+        edges = [
+            connection_type.Edge(
+                node=row,
+                cursor=encode_cursor(get_row_values(row, self.ordering)),
+            )
+            for row in rows
+        ]
+        return connection_type(
+            edges=edges,
+            page_info=relay.PageInfo(
+                start_cursor=edges[0].cursor if edges else None,
+                end_cursor=edges[-1].cursor if edges else None,
+                has_previous_page=after is not None,
+                has_next_page=has_next_page,
+            ),
+        )
@@ -0,0 +1,274 @@
+import typing
+
+from django.conf import settings
+from graphene_django.settings import graphene_settings
+from graphql import (
+    DocumentNode,
+    ExecutionContext,
+    FieldNode,
+    FragmentSpreadNode,
+    GraphQLError,
+    GraphQLField,
+    GraphQLSchema,
+    InlineFragmentNode,
+    IntValueNode,
+    OperationDefinitionNode,
+    VariableNode,
+    get_named_type,
+    get_nullable_type,
+    is_leaf_type,
+    is_list_type,
+)
+
+# argument of the connections which bounds their size
+SIZE_ARGUMENT = "first"
+# introspection is resolved from memory, it costs the weight of these fields
+INTROSPECTION_FIELDS = ("__schema", "__type")
+# fields of __Type listing other types, each level nested in another one
+# multiplies the result by the size of the schema
+INTROSPECTION_LIST_FIELDS = ("fields", "inputFields", "interfaces", "possibleTypes")
+
+
+class QueryCost(typing.NamedTuple):
+    cost: int
+    depth: int
+
+
+def get_field_weight(type_name: str, field_name: str, is_leaf: bool) -> int:
+    """Scalars are free and objects cost 1 unless GRAPHQL_FIELD_WEIGHTS says else"""
+    return settings.GRAPHQL_FIELD_WEIGHTS.get(
+        f"{type_name}.{field_name}", 0 if is_leaf else 1
+    )
+
+
+def get_size(node: FieldNode, field: GraphQLField, variables: dict):
+    """``first`` of a connection, its max limit if not given, None for other fields"""
+    if SIZE_ARGUMENT not in field.args:
+        return None
+    for argument in node.arguments:
+        if argument.name.value != SIZE_ARGUMENT:
+            continue
+        if isinstance(argument.value, IntValueNode):
+            return int(argument.value.value)
+        if isinstance(argument.value, VariableNode):
+            value = variables.get(argument.value.name.value)
+            if isinstance(value, int):
+                return value
+    return graphene_settings.RELAY_CONNECTION_MAX_LIMIT
+
+
+class CostEstimator:
+    """
+    Cost of an operation before it runs: every field costs its weight,
+    the fields under a list are multiplied by its size. That is ``first`` of
+    the connection for its edges, GRAPHQL_LIST_SIZE for other lists.
+    __schema and __type cost their weight, how deep their type lists nest
+    is bounded by GRAPHQL_MAX_INTROSPECTION_DEPTH instead.
+    """
+
+    def __init__(self, schema: GraphQLSchema, document: DocumentNode, variables):
+        self.schema = schema
+        self.variables = variables or {}
+        # the deepest nesting of INTROSPECTION_LIST_FIELDS
+        self.introspection_depth = 0
+        self.fragments = {
+            definition.name.value: definition
+            for definition in document.definitions
+            if definition.kind == "fragment_definition"
+        }
+
+    def estimate(self, operation: OperationDefinitionNode) -> QueryCost:
+        root_type = self.schema.get_root_type(operation.operation)
+        if root_type is None:
+            return QueryCost(0, 0)
+        return self.selection_cost(operation.selection_set, root_type, None, set())
+
+    def selection_cost(self, selection_set, parent_type, size, fragments) -> QueryCost:
+        cost = depth = 0
+        for selection in selection_set.selections if selection_set else ():
+            if isinstance(selection, FieldNode):
+                field_cost = self.field_cost(selection, parent_type, size, fragments)
+            elif isinstance(selection, InlineFragmentNode):
+                field_cost = self.selection_cost(
+                    selection.selection_set,
+                    self.get_type(selection.type_condition, parent_type),
+                    size,
+                    fragments,
+                )
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                # cycles are reported by the validation
+                if fragment is None or name in fragments:
+                    continue
+                field_cost = self.selection_cost(
+                    fragment.selection_set,
+                    self.get_type(fragment.type_condition, parent_type),
+                    size,
+                    fragments | {name},
+                )
+            else:
+                continue
+            cost += field_cost.cost
+            depth = max(depth, field_cost.depth)
+        return QueryCost(cost, depth)
+
+    def field_cost(self, node: FieldNode, parent_type, size, fragments) -> QueryCost:
+        name = node.name.value
+        fields = getattr(parent_type, "fields", {})
+        if name in INTROSPECTION_FIELDS:
+            self.introspection_depth = max(
+                self.introspection_depth,
+                self.get_introspection_depth(node.selection_set, fragments),
+            )
+            return QueryCost(get_field_weight(parent_type.name, name, False), 1)
+        # __typename and unknown fields, the latter fail the validation
+        if name.startswith("__") or name not in fields:
+            return QueryCost(0, 0)
+        field = fields[name]
+        field_type = field.type
+        named_type = get_named_type(field_type)
+        weight = get_field_weight(parent_type.name, name, is_leaf_type(named_type))
+        if node.selection_set is None:
+            return QueryCost(weight, 1)
+
+        multiplier = 1
+        if is_list_type(get_nullable_type(field_type)):
+            multiplier = (
+                size if name == "edges" and size else settings.GRAPHQL_LIST_SIZE
+            )
+        children = self.selection_cost(
+            node.selection_set,
+            named_type,
+            get_size(node, field, self.variables),
+            fragments,
+        )
+        return QueryCost(weight + multiplier * children.cost, children.depth + 1)
+
+    def get_introspection_depth(self, selection_set, fragments) -> int:
+        """Nesting of the type lists under __schema or __type"""
+        depth = 0
+        for selection in selection_set.selections if selection_set else ():
+            if isinstance(selection, FieldNode):
+                nested = self.get_introspection_depth(
+                    selection.selection_set, fragments
+                )
+                if selection.name.value in INTROSPECTION_LIST_FIELDS:
+                    nested += 1
+            elif isinstance(selection, InlineFragmentNode):
+                nested = self.get_introspection_depth(
+                    selection.selection_set, fragments
+                )
+            elif isinstance(selection, FragmentSpreadNode):
+                name = selection.name.value
+                fragment = self.fragments.get(name)
+                if fragment is None or name in fragments:
+                    continue
+                nested = self.get_introspection_depth(
+                    fragment.selection_set, fragments | {name}
+                )
+            else:
+                continue
+            depth = max(depth, nested)
+        return depth
+
+    def get_type(self, type_condition, parent_type):
+        if type_condition is None:
+            return parent_type
+        return self.schema.get_type(type_condition.name.value) or parent_type
+
+
+def check_query_cost(
+    schema: GraphQLSchema,
+    document: DocumentNode,
+    variables: typing.Optional[dict],
+    operation_name: typing.Optional[str],
+) -> typing.Tuple[QueryCost, typing.List[GraphQLError]]:
+    """Estimated cost of the operation and the errors of exceeded limits"""
+    estimator = CostEstimator(schema, document, variables)
+    cost, errors = QueryCost(0, 0), []
+    for definition in document.definitions:
+        if not isinstance(definition, OperationDefinitionNode):
+            continue
+        if operation_name and (
+            definition.name is None or definition.name.value != operation_name
+        ):
+            continue
+        cost = estimator.estimate(definition)
+        break
+    if cost.depth > settings.GRAPHQL_MAX_DEPTH:
+        errors.append(
+            GraphQLError(
+                f"Query depth {cost.depth} exceeds "
+                f"the limit of {settings.GRAPHQL_MAX_DEPTH}",
+                extensions={
+                    "code": "QUERY_TOO_DEEP",
+                    "depth": cost.depth,
+                    "maxDepth": settings.GRAPHQL_MAX_DEPTH,
+                },
+            )
+        )
+    if estimator.introspection_depth > settings.GRAPHQL_MAX_INTROSPECTION_DEPTH:
+        errors.append(
+            GraphQLError(
+                f"Introspection depth {estimator.introspection_depth} exceeds "
+                f"the limit of {settings.GRAPHQL_MAX_INTROSPECTION_DEPTH}",
+                extensions={
+                    "code": "INTROSPECTION_TOO_DEEP",
+                    "depth": estimator.introspection_depth,
+                    "maxDepth": settings.GRAPHQL_MAX_INTROSPECTION_DEPTH,
+                },
+            )
+        )
+    if cost.cost > settings.GRAPHQL_MAX_COST:
+        errors.append(
+            GraphQLError(
+                f"Query cost {cost.cost} exceeds "
+                f"the budget of {settings.GRAPHQL_MAX_COST}",
+                extensions={
+                    "code": "QUERY_TOO_COSTLY",
+                    "cost": cost.cost,
+                    "maxCost": settings.GRAPHQL_MAX_COST,
+                },
+            )
+        )
+    return cost, errors
+
+
+class CostExecutionContext(ExecutionContext):
+    """
+    Sums the weights of the fields resolved into ``context_value.actual_cost``.
+    Counted once per object for its selection set, scalars do not add
+    a call of their own and the sum of a selection set is kept per query.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # id of the fields, cached by collect_subfields() -> (fields, weight)
+        self._weights: typing.Dict[int, tuple] = {}
+
+    def get_fields_weight(self, parent_type, fields: dict) -> int:
+        cached = self._weights.get(id(fields))
+        if cached is None:
+            weight = 0
+            for field_nodes in fields.values():
+                name = field_nodes[0].name.value
+                field = parent_type.fields.get(name)
+                if name in INTROSPECTION_FIELDS:
+                    weight += get_field_weight(parent_type.name, name, False)
+                elif field is not None and not name.startswith("__"):
+                    weight += get_field_weight(
+                        parent_type.name,
+                        name,
+                        is_leaf_type(get_named_type(field.type)),
+                    )
+            cached = self._weights[id(fields)] = (fields, weight)
+        return cached[1]
+
+    def execute_fields(self, parent_type, source_value, path, fields):
+        self.context_value.actual_cost += self.get_fields_weight(parent_type, fields)
+        return super().execute_fields(parent_type, source_value, path, fields)
+
+    def execute_fields_serially(self, parent_type, source_value, path, fields):
+        self.context_value.actual_cost += self.get_fields_weight(parent_type, fields)
+        return super().execute_fields_serially(parent_type, source_value, path, fields)
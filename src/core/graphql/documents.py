@@ -0,0 +1,48 @@
+import hashlib
+import typing
+
+from django.conf import settings
+from graphql import DocumentNode, GraphQLError, GraphQLSchema, parse, validate
+
+from src.core.utils.lru import LRUCache
+
+
+class CachedDocument(typing.NamedTuple):
+    # None if the query does not parse
+    document: typing.Optional[DocumentNode]
+    errors: typing.List[GraphQLError]
+
+
+_documents = None
+
+
+def get_documents() -> LRUCache:
+    """
+    Made on the first query, so GRAPHQL_DOCUMENT_CACHE_SIZE is read from
+    the settings in effect, and made again when they change it
+    """
+    global _documents
+    if _documents is None or _documents.maxsize != settings.GRAPHQL_DOCUMENT_CACHE_SIZE:
+        _documents = LRUCache(maxsize=settings.GRAPHQL_DOCUMENT_CACHE_SIZE)
+    return _documents
+
+
+def get_query_hash(query: str) -> str:
+    """Hash the clients send for a persisted query"""
+    return hashlib.sha256(query.encode()).hexdigest()
+
+
+def get_document(schema: GraphQLSchema, query: str) -> CachedDocument:
+    """Parsed and validated once per process and text of the query"""
+    # there is one schema, so the text of the query is enough for the key
+    documents, key = get_documents(), get_query_hash(query)
+    cached = documents.get(key)
+    if cached is None:
+        try:
+            document = parse(query)
+        except GraphQLError as e:
+            cached = CachedDocument(None, [e])
+        else:
+            cached = CachedDocument(document, validate(schema, document))
+        documents.set(key, cached)
+    return cached
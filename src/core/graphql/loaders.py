@@ -0,0 +1,123 @@
+import collections
+import typing
+
+from django.db import models
+from django.db.models import F
+
+# annotation of the related rows with the key they were loaded for
+PARENT_ANNOTATION = "_loader_parent"
+
+
+class DataLoader:
+    """
+    Loads keys in batches with ``batch_load_fn(keys) -> values in key order``.
+    Execution is synchronous, so instead of waiting for the end of a tick
+    load() of a key not loaded yet takes every primed key into its batch.
+    """
+
+    def __init__(self, batch_load_fn: typing.Callable[[list], list]):
+        self.batch_load_fn = batch_load_fn
+        self._values = {}
+        self._primed = {}
+
+    def prime(self, keys: typing.Iterable):
+        """Keys to batch with the next load()"""
+        for key in keys:
+            if key is not None and key not in self._values:
+                self._primed[key] = None
+
+    def load(self, key):
+        if key is None:
+            return None
+        if key not in self._values:
+            self._primed[key] = None
+            keys = list(self._primed)
+            self._primed.clear()
+            self._values.update(zip(keys, self.batch_load_fn(keys)))
+        return self._values[key]
+
+    def load_many(self, keys: typing.Iterable) -> list:
+        keys = list(keys)
+        self.prime(keys)
+        return [self.load(key) for key in keys]
+
+
+class RelationLoader(DataLoader):
+    """
+    Foreign key, reverse foreign key or many to many of a model,
+    one IN query per batch. Keys are the fk values or the pks of the instances.
+    """
+
+    def __init__(self, loaders: "Loaders", field: models.Field):
+        super().__init__(self.batch_load)
+        self.loaders = loaders
+        self.field = field
+
+    def get_key(self, instance: models.Model):
+        if self.field.many_to_one:
+            return getattr(instance, self.field.attname)
+        return instance.pk
+
+    def batch_load(self, keys: list) -> list:
+        related_model = self.field.related_model
+        if self.field.many_to_one:
+            found = related_model._default_manager.in_bulk(keys)
+            self.loaders.seen(found.values())
+            return [found.get(key) for key in keys]
+
+        if self.field.one_to_many:
+            lookup = self.field.field.name
+        else:
+            lookup = self.field.related_query_name()
+        related = related_model._default_manager.filter(
+            **{f"{lookup}__in": keys}
+        ).annotate(**{PARENT_ANNOTATION: F(lookup)})
+        grouped = collections.defaultdict(list)
+        for instance in related:
+            grouped[getattr(instance, PARENT_ANNOTATION)].append(instance)
+        self.loaders.seen(instance for group in grouped.values() for instance in group)
+        return [grouped[key] for key in keys]
+
+
+class Loaders:
+    """
+    DataLoaders of one GraphQL request, ``info.context.loaders``.
+    Instances resolved so far are remembered per model, so the relation of
+    all of them is loaded at once: one query per relation and nesting level.
+    """
+
+    def __init__(self):
+        self._loaders: typing.Dict[tuple, RelationLoader] = {}
+        self._seen = collections.defaultdict(list)
+
+    def seen(self, instances: typing.Iterable[models.Model]) -> list:
+        """Remember resolved instances, root resolvers return the result"""
+        instances = list(instances)
+        for instance in instances:
+            self._seen[type(instance)].append(instance)
+        for (model, _), loader in self._loaders.items():
+            loader.prime(
+                loader.get_key(instance)
+                for instance in instances
+                if isinstance(instance, model)
+            )
+        return instances
+
+    def first(self, queryset) -> typing.Optional[models.Model]:
+        """First instance of the queryset, remembered as seen() does"""
+        instances = self.seen(queryset[:1])
+        return instances[0] if instances else None
+
+    def get_loader(
+        self, model: typing.Type[models.Model], relation: str
+    ) -> RelationLoader:
+        if (model, relation) not in self._loaders:
+            loader = RelationLoader(self, model._meta.get_field(relation))
+            loader.prime(map(loader.get_key, self._seen[model]))
+            self._loaders[model, relation] = loader
+        return self._loaders[model, relation]
+
+    def load(self, instance: models.Model, relation: str):
+        """Related instance, or list of them for a to many relation"""
+        loader = self.get_loader(type(instance), relation)
+        return loader.load(loader.get_key(instance))
@@ -0,0 +1,160 @@
+import json
+import logging
+import typing
+
+from django.conf import settings
+from django.http import HttpResponseBadRequest
+from graphene_django.views import GraphQLView as BaseGraphQLView
+from graphene_django.views import HttpError
+from graphql import (
+    DocumentNode,
+    ExecutionResult,
+    GraphQLError,
+    OperationType,
+    execute_sync,
+    get_operation_ast,
+)
+
+from src.apps.api.persisted import get_persisted_query
+from src.core.graphql.cost import CostExecutionContext, check_query_cost
+from src.core.graphql.documents import get_document, get_query_hash
+from src.core.graphql.loaders import Loaders
+
+logger = logging.getLogger(__name__)
+
+
+class GraphQLView(BaseGraphQLView):
+    """
+    Fresh DataLoaders per request in ``info.context``. Queries over
+    GRAPHQL_MAX_COST or GRAPHQL_MAX_DEPTH are rejected before they run,
+    the estimated and the actual cost of the others are logged.
+    Documents are parsed and validated once per process, registered
+    queries are run by ``extensions.persistedQuery.sha256Hash``
+    as Apollo clients send it. Mutations are left to the parent view.
+    """
+
+    def __init__(self, *args, execution_context_class=CostExecutionContext, **kwargs):
+        super().__init__(
+            *args, execution_context_class=execution_context_class, **kwargs
+        )
+
+    def get_context(self, request):
+        request.loaders = Loaders()
+        request.actual_cost = 0
+        return request
+
+    @staticmethod
+    def get_persisted_hash(request, data) -> typing.Optional[str]:
+        extensions = request.GET.get("extensions") or data.get("extensions")
+        if extensions and isinstance(extensions, str):
+            try:
+                extensions = json.loads(extensions)
+            except Exception:
+                raise HttpError(HttpResponseBadRequest("Extensions are invalid JSON."))
+        if not isinstance(extensions, dict):
+            return None
+        persisted = extensions.get("persistedQuery")
+        if not isinstance(persisted, dict):
+            return None
+        return persisted.get("sha256Hash") or None
+
+    def resolve_query(self, request, data, query) -> typing.Optional[str]:
+        """Text of the query, the registered one for a persisted query"""
+        sha256 = self.get_persisted_hash(request, data)
+        if sha256 is None:
+            if query and settings.GRAPHQL_PERSISTED_QUERIES_ONLY:
+                raise GraphQLError(
+                    "Only persisted queries are allowed",
+                    extensions={"code": "PERSISTED_QUERY_REQUIRED"},
+                )
+            return query
+        if query:
+            if get_query_hash(query) != sha256:
+                raise GraphQLError(
+                    "Provided sha256Hash does not match the query",
+                    extensions={"code": "PERSISTED_QUERY_HASH_MISMATCH"},
+                )
+            if not settings.GRAPHQL_PERSISTED_QUERIES_ONLY:
+                return query
+        persisted = get_persisted_query(sha256)
+        if persisted is None:
+            # the message Apollo clients check for
+            raise GraphQLError(
+                "PersistedQueryNotFound",
+                extensions={"code": "PERSISTED_QUERY_NOT_FOUND"},
+            )
+        return persisted
+
+    def execute_graphql_request(
+        self, request, data, query, variables, operation_name, show_graphiql=False
+    ):
+        try:
+            query = self.resolve_query(request, data, query)
+        except GraphQLError as e:
+            return ExecutionResult(errors=[e])
+        if not query:
+            return super().execute_graphql_request(
+                request, data, query, variables, operation_name, show_graphiql
+            )
+
+        document, errors = get_document(self.schema.graphql_schema, query)
+        if document is None:
+            return ExecutionResult(errors=errors)
+        operation_ast = get_operation_ast(document, operation_name)
+        # mutations go through the parent for its check of GET requests
+        # and ATOMIC_MUTATIONS, they are rare enough to be parsed again
+        is_query = (
+            operation_ast is None or operation_ast.operation == OperationType.QUERY
+        )
+        if errors:
+            if is_query:
+                return ExecutionResult(errors=errors)
+            return super().execute_graphql_request(
+                request, data, query, variables, operation_name, show_graphiql
+            )
+
+        cost, errors = check_query_cost(
+            self.schema.graphql_schema, document, variables, operation_name
+        )
+        if errors:
+            logger.warning(
+                f"GraphQL query {operation_name or ''} rejected, "
+                f"cost {cost.cost} depth {cost.depth}",
+                extra={"estimated_cost": cost.cost, "depth": cost.depth},
+            )
+            return ExecutionResult(errors=errors)
+
+        if is_query:
+            result = self.execute_document(request, document, variables, operation_name)
+        else:
+            result = super().execute_graphql_request(
+                request, data, query, variables, operation_name, show_graphiql
+            )
+        actual_cost = getattr(request, "actual_cost", 0)
+        logger.info(
+            f"GraphQL query {operation_name or ''} "
+            f"cost {cost.cost} estimated, {actual_cost} actual",
+            extra={"estimated_cost": cost.cost, "actual_cost": actual_cost},
+        )
+        return result
+
+    def execute_document(
+        self, request, document: DocumentNode, variables, operation_name
+    ) -> ExecutionResult:
+        """
+        A query as schema.execute() of the parent runs it, with the cached
+        document instead of the text it would parse and validate again
+        """
+        try:
+            return execute_sync(
+                schema=self.schema.graphql_schema,
+                document=document,
+                root_value=self.get_root_value(request),
+                variable_values=variables,
+                operation_name=operation_name,
+                context_value=self.get_context(request),
+                middleware=self.get_middleware(request),
+                execution_context_class=self.execution_context_class,
+            )
+        except Exception as e:
+            return ExecutionResult(errors=[e])
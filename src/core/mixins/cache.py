@@ -0,0 +1,147 @@
+import math
+import time
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from django.utils.http import http_date, parse_http_date_safe, quote_etag
+from django.utils.translation import get_language
+
+from src.core.utils.cache import cache_lock
+from src.core.utils.response_cache import (
+    CachedResponse,
+    collect_tags,
+    get_cached_response,
+    get_response_key,
+    get_tag_versions,
+    get_versions_etag,
+    model_tag,
+    set_cached_response,
+)
+
+VALIDATOR_HEADERS = ("ETag", "Last-Modified")
+
+
+def is_response_cacheable(request, timeout=settings.RESPONSE_CACHE_TIMEOUT) -> bool:
+    """Anonymous GET requests, their responses are the same for everyone"""
+    return (
+        request.method == "GET"
+        and bool(timeout)
+        and "HTTP_AUTHORIZATION" not in request.META
+    )
+
+
+def get_cached_http_response(request, cached: CachedResponse) -> HttpResponse:
+    """The cached response, or 304 if the client has it already"""
+    response = HttpResponse(cached.content, content_type=cached.content_type)
+    for header, value in cached.headers.items():
+        response[header] = value
+    return get_conditional_response(
+        request,
+        etag=cached.headers.get("ETag"),
+        last_modified=parse_http_date_safe(cached.headers.get("Last-Modified", "")),
+        response=response,
+    )
+
+
+class ResponseCacheMixin:
+    """
+    Caches whole responses of anonymous GET requests per path, query and language.
+    A response is tagged with every model instance it rendered, lists with
+    their model as well, see src.apps.api.signals for the invalidation.
+    """
+
+    response_cache_timeout = settings.RESPONSE_CACHE_TIMEOUT
+
+    def dispatch(self, request, *args, **kwargs):
+        if not is_response_cacheable(request, self.response_cache_timeout):
+            return self.render_response(None, request, *args, **kwargs)
+
+        key = get_response_key(request.get_full_path(), get_language())
+        # looked up already by src.core.async_views
+        if not getattr(request, "response_cache_missed", False):
+            cached = get_cached_response(key)
+            if cached is not None:
+                return get_cached_http_response(request, cached)
+        # one process renders a missing response, the others wait for it
+        # up to CACHE_LOCK_WAIT seconds, then render it themselves
+        with cache_lock(key, wait=0) as acquired:
+            if acquired:
+                return self.render_response(key, request, *args, **kwargs)
+        with cache_lock(key):
+            cached = get_cached_response(key)
+            if cached is not None:
+                return get_cached_http_response(request, cached)
+            return self.render_response(key, request, *args, **kwargs)
+
+    def render_response(self, key, request, *args, **kwargs):
+        """Response of the view, stored under the key unless it is None"""
+        self.rendered_instances, self.response_tags = [], set()
+        started = time.time()
+        response = super().dispatch(request, *args, **kwargs)
+        if request.method != "GET" or response.status_code != 200:
+            return response
+        versions = get_tag_versions(
+            self.response_tags | collect_tags(self.rendered_instances), started
+        )
+        if versions is None:
+            # changed while it was rendered, neither stored nor validated
+            return response
+        self.set_validators(response, key or request.get_full_path(), versions)
+        if key is not None:
+            response.render()
+            headers = {h: response[h] for h in VALIDATOR_HEADERS if h in response}
+            set_cached_response(
+                key, response.content, response["Content-Type"], versions, headers
+            )
+        return response
+
+    def set_validators(self, response, key: str, versions: dict):
+        """Headers of conditional GET, see ConditionalGetMixin"""
+
+    def tag_response(self, *instances, models=()):
+        """Instances or models the response shows, beyond its serializer instance"""
+        self.rendered_instances.extend(instances)
+        self.response_tags.update(model_tag(model) for model in models)
+
+    def get_serializer(self, *args, **kwargs):
+        instance = args[0] if args else kwargs.get("instance")
+        # schema generators call it outside of dispatch
+        if instance is not None and hasattr(self, "rendered_instances"):
+            if kwargs.get("many"):
+                self.tag_response(*instance, models=[self.queryset.model])
+            else:
+                self.tag_response(instance)
+        return super().get_serializer(*args, **kwargs)
+
+
+class ConditionalGetMixin(ResponseCacheMixin):
+    """
+    ETag of list and retrieve made of the versions of the response tags,
+    so it changes with any instance the response rendered, or with the model
+    of a list. A matching If-None-Match is answered with 304, from the cached
+    response without any query. Last-Modified only for a single instance,
+    a list can lose a row without getting newer.
+    """
+
+    conditional_actions = ("list", "retrieve")
+
+    def set_validators(self, response, key: str, versions: dict):
+        if self.action not in self.conditional_actions:
+            return
+        response["ETag"] = quote_etag(
+            get_versions_etag(f"{get_language()}:{key}", versions)
+        )
+        if self.action == "retrieve":
+            response["Last-Modified"] = http_date(math.ceil(max(versions.values())))
+
+    def render_response(self, key, request, *args, **kwargs):
+        response = super().render_response(key, request, *args, **kwargs)
+        if "ETag" not in response:
+            return response
+        return get_conditional_response(
+            request,
+            etag=response["ETag"],
+            last_modified=parse_http_date_safe(response.get("Last-Modified", "")),
+            response=response,
+        )
@@ -0,0 +1,93 @@
+import typing
+
+from django.core.exceptions import FieldDoesNotExist
+
+
+class SparseFieldsSerializerMixin:
+    """
+    Serializer keeping only the ``fields`` it is given, see SparseFieldsetMixin.
+    Meta.field_columns maps a field to the columns it reads,
+    a model field reads its own column by default.
+    """
+
+    def __init__(self, *args, fields=None, **kwargs):
+        super().__init__(*args, **kwargs)
+        if fields is not None:
+            for name in set(self.fields) - set(fields):
+                self.fields.pop(name)
+
+    @classmethod
+    def get_field_columns(cls, name: str) -> typing.Tuple[str, ...]:
+        field_columns = getattr(cls.Meta, "field_columns", {})
+        if name in field_columns:
+            return tuple(field_columns[name])
+        try:
+            field = cls.Meta.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            return ()
+        return (field.attname,) if field.concrete and not field.many_to_many else ()
+
+    @classmethod
+    def get_columns(
+        cls, fields: typing.Optional[typing.Iterable[str]] = None
+    ) -> typing.Set[str]:
+        """Columns the fields read, all of Meta.fields by default"""
+        columns = {"pk"}
+        for name in cls.Meta.fields if fields is None else fields:
+            columns.update(cls.get_field_columns(name))
+        return columns
+
+
+class SparseFieldsetMixin:
+    """
+    ?fields=title,slug or ?omit=content for list and retrieve.
+    The serializer drops the other fields, their columns are never loaded
+    and their relations never prefetched.
+    """
+
+    fields_param = "fields"
+    omit_param = "omit"
+
+    def get_param_list(self, param: str) -> typing.List[str]:
+        value = self.request.query_params.get(param, "")
+        return [name.strip() for name in value.split(",") if name.strip()]
+
+    def get_sparse_fields(self) -> typing.Optional[typing.List[str]]:
+        """Names of the serializer fields to render, None for all of them"""
+        if getattr(self, "request", None) is None or self.action not in (
+            "list",
+            "retrieve",
+        ):
+            return None
+        fields = self.get_param_list(self.fields_param)
+        omit = self.get_param_list(self.omit_param)
+        if not fields and not omit:
+            return None
+        return [
+            name
+            for name in self.get_serializer_class().Meta.fields
+            if (not fields or name in fields) and name not in omit
+        ]
+
+    def get_serializer(self, *args, **kwargs):
+        fields = self.get_sparse_fields()
+        if fields is not None:
+            kwargs["fields"] = fields
+        return super().get_serializer(*args, **kwargs)
+
+    def filter_queryset(self, queryset):
+        queryset = super().filter_queryset(queryset)
+        fields = self.get_sparse_fields()
+        if fields is None:
+            return queryset
+        # the relations of the dropped fields are not prefetched either
+        prefetches = [
+            lookup
+            for lookup in queryset._prefetch_related_lookups
+            if getattr(lookup, "prefetch_through", lookup).split("__")[0] in fields
+        ]
+        queryset = queryset.prefetch_related(None).prefetch_related(*prefetches)
+        # the paginator reads the ordering columns for its cursor
+        ordering = queryset.query.order_by or queryset.model._meta.ordering
+        columns = self.get_serializer_class().get_columns(fields)
+        return queryset.only(*columns, *(name.lstrip("-") for name in ordering))
@@ -1,8 +1,14 @@
-from django.db import models
+from functools import partial
+
+from django.conf import settings
+from django.db import models, transaction
 from django.utils.translation import gettext_lazy as _
+from modeltranslation.utils import build_localized_fieldname
 from optimized_image.fields import OptimizedImageField
 
-from src.core.utils.watermark import watermark_text
+from src.core.utils.text import make_excerpt
+from src.core.utils.variants import get_srcset
+from src.core.utils.watermark import watermark_image
 
 
 class SeoMixin(models.Model):
@@ -26,31 +32,97 @@ class SeoMixin(models.Model):
         abstract = True
 
 
+# columns get_image and get_srcset read
+IMAGE_FIELDS = ("image_preview", "image_alt", "image_watermark", "image_hash")
+
+
 class ImagesMixin(models.Model):
     """
     Abstract model for basic images information
     Attributes:
     image_preview: path images
     image_alt (char): image_alt for <img>
+    image_watermark: watermarked copy of image_preview, made by celery
+    image_hash (char): sha256 of image_preview the copy was made from
     """
 
     image_preview = OptimizedImageField(_("Images"), blank=True)
     image_alt = models.CharField(_("Images Alt"), blank=True, max_length=255)
+    image_watermark = models.ImageField(
+        _("Images with watermark"), blank=True, editable=False
+    )
+    image_hash = models.CharField(
+        _("Images hash"), blank=True, max_length=64, editable=False
+    )
 
     class Meta:
         abstract = True
 
-    def save(
-        self, force_insert=False, force_update=False, using=None, update_fields=None
-    ):
-        super(ImagesMixin, self).save(
-            force_insert=False, force_update=False, using=None, update_fields=None
-        )
-        watermark_text(self.image_preview.path, self.image_preview.path)
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # the name of the image as loaded, to see if save() got a new one
+        instance._loaded_image = instance.__dict__.get("image_preview", models.DEFERRED)
+        return instance
+
+    def save(self, *args, **kwargs):
+        loaded_image = getattr(self, "_loaded_image", None)
+        if not self.image_preview._committed or (
+            loaded_image is not models.DEFERRED
+            and self.image_preview.name != loaded_image
+        ):
+            self.image_watermark, self.image_hash = "", ""
+        super(ImagesMixin, self).save(*args, **kwargs)
+        self._loaded_image = self.image_preview.name
+        if self.image_preview and not self.image_watermark:
+            transaction.on_commit(
+                partial(
+                    watermark_image.delay,
+                    self._meta.app_label,
+                    self._meta.model_name,
+                    self.pk,
+                )
+            )
 
     def get_image(self) -> str:
         try:
-            image = self.image_preview.url
+            image = (self.image_watermark or self.image_preview).url
         except ValueError:
             image = None
         return image
+
+    def get_srcset(self) -> dict:
+        """Smaller copies of get_image in modern formats, by format"""
+        return get_srcset(self.image_watermark or self.image_preview, self.image_hash)
+
+
+class ExcerptMixin(models.Model):
+    """
+    Abstract model for a plain text excerpt of a translated rich text field
+    Attributes:
+    excerpt (char): start of excerpt_source without html, in every language
+    """
+
+    excerpt_source = "content"
+    excerpt = models.CharField(
+        _("Excerpt"), blank=True, max_length=300, editable=False, default=""
+    )
+
+    class Meta:
+        abstract = True
+
+    def set_excerpt(self):
+        length = self._meta.get_field("excerpt").max_length
+        for language in settings.MODELTRANSLATION_LANGUAGES:
+            source = getattr(
+                self, build_localized_fieldname(self.excerpt_source, language)
+            )
+            setattr(
+                self,
+                build_localized_fieldname("excerpt", language),
+                make_excerpt(source, length),
+            )
+
+    def save(self, *args, **kwargs):
+        self.set_excerpt()
+        super().save(*args, **kwargs)
@@ -0,0 +1,102 @@
+from collections import OrderedDict
+
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import CursorPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from src.core.utils.keyset import (
+    decode_cursor,
+    encode_cursor,
+    get_row_values,
+    keyset_q,
+    reverse_ordering,
+    to_python,
+    with_unique_key,
+)
+
+
+class KeysetPagination(CursorPagination):
+    """
+    Keyset pagination on (created_at, id), backed by an index on both columns.
+    The cursor holds the ordering values of the last row and the next page is
+    created_at <= x AND (created_at < x OR (created_at = x AND id < y)),
+    a range of the index, so page N costs the same as the first one, no OFFSET.
+    COUNT(*) is not made unless asked for by ?count=true
+    """
+
+    ordering = ("-created_at", "-id")
+    page_size_query_param = "page_size"
+    max_page_size = 100
+    count_query_param = "count"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_size = self.get_page_size(request)
+        if not self.page_size:
+            return None
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.count = None
+        if request.query_params.get(self.count_query_param) in ("1", "true"):
+            self.count = queryset.count()
+            # next and previous pages are not counted again
+            self.base_url = remove_query_param(self.base_url, self.count_query_param)
+
+        self.ordering = with_unique_key(
+            queryset.model, self.get_ordering(request, queryset, view)
+        )
+        values, backwards = self.decode_cursor(request, queryset.model)
+        ordering = reverse_ordering(self.ordering) if backwards else self.ordering
+        queryset = queryset.order_by(*ordering)
+        if values is not None:
+            queryset = queryset.filter(keyset_q(ordering, values))
+
+        rows = list(queryset[: self.page_size + 1])
+        has_more, self.page = len(rows) > self.page_size, rows[: self.page_size]
+        if backwards:
+            self.page.reverse()
+            self.has_next, self.has_previous = True, has_more
+        else:
+            self.has_next, self.has_previous = has_more, values is not None
+        return self.page
+
+    def get_ordering(self, request, queryset, view):
+        """Explicit order_by() of a filter backend wins over the default ordering"""
+        if queryset.query.order_by:
+            return tuple(queryset.query.order_by)
+        return self.ordering
+
+    def decode_cursor(self, request, model):
+        """(values of the row the page starts after, True for a previous page)"""
+        cursor = request.query_params.get(self.cursor_query_param)
+        if cursor is None:
+            return None, False
+        try:
+            values, backwards = decode_cursor(cursor)
+            return to_python(model, self.ordering, values), bool(backwards)
+        except (TypeError, ValueError):
+            raise NotFound(self.invalid_cursor_message)
+
+    def encode_cursor(self, row, backwards: bool) -> str:
+        cursor = encode_cursor([get_row_values(row, self.ordering), int(backwards)])
+        return replace_query_param(self.base_url, self.cursor_query_param, cursor)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], backwards=False)
+
+    def get_previous_link(self):
+        if not self.has_previous or not self.page:
+            return None
+        return self.encode_cursor(self.page[0], backwards=True)
+
+    def get_paginated_response(self, data):
+        page = [
+            ("next", self.get_next_link()),
+            ("previous", self.get_previous_link()),
+            ("results", data),
+        ]
+        if self.count is not None:
+            page.insert(0, ("count", self.count))
+        return Response(OrderedDict(page))
@@ -1,9 +1,12 @@
 import graphene
 
 import src.apps.blog.schema
+import src.apps.shop.schema
 
 
-class Query(src.apps.blog.schema.Query, graphene.ObjectType):
+class Query(
+    src.apps.blog.schema.Query, src.apps.shop.schema.Query, graphene.ObjectType
+):
     # This class will inherit from multiple Queries
     # as we begin to add more apps to our project
     pass
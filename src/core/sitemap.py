@@ -1,9 +1,25 @@
+import itertools
+import typing
+
+from django.conf import settings
 from django.contrib.sitemaps import Sitemap
+from django.contrib.sites.models import Site
+from django.core.cache import cache
+from django.http import HttpResponse
+from django.template.loader import render_to_string
+from django.utils import translation
 
 from src.apps.blog.models import Article
 from src.apps.shop.models import Category
 from src.apps.shop.models import Product
 
+SITEMAP_INDEX_CACHE_KEY = "sitemap:index"
+SITEMAP_PAGE_CACHE_KEY = "sitemap:{section}:{page}"
+# a render is queued, further changes until it starts are rendered with it
+SITEMAP_SCHEDULED_CACHE_KEY = "sitemap:scheduled"
+# listed in the index, see sitemap_section in src.core.urls
+SITEMAP_PAGE_PATH = "/sitemap-{section}-{page}.xml"
+
 
 class I18nSitemap(Sitemap):
     protocol = "http"
@@ -12,10 +28,30 @@ class I18nSitemap(Sitemap):
     def location(self, obj):
         return f"/{obj.slug}"
 
+    def lastmod(self, obj):
+        return obj.updated_at
+
+    def iter_urls(self, domain: str) -> typing.Iterator[dict]:
+        """
+        Entries of sitemap.xml in every language, the rows are read
+        in chunks instead of once per page and language as Sitemap.get_urls does
+        """
+        languages = self.languages or [code for code, _ in settings.LANGUAGES]
+        items = self.items().iterator(chunk_size=settings.SITEMAP_CHUNK_SIZE)
+        for item in items:
+            lastmod = self.lastmod(item)
+            for language in languages:
+                with translation.override(language):
+                    location = self.location(item)
+                yield {
+                    "location": f"{self.protocol}://{domain}{location}",
+                    "lastmod": lastmod,
+                }
+
 
 class ProductSitemap(I18nSitemap):
     def items(self):
-        return Product.objects.only("id", "title").order_by("-id")
+        return Product.objects.only("id", "slug", "updated_at").order_by("-id")
 
     def location(self, obj):
         return f"/products/{obj.slug}"
@@ -24,7 +60,7 @@ class ProductSitemap(I18nSitemap):
 class CategorySitemap(I18nSitemap):
     def items(self):
         categories = Category.objects.all().order_by("id")
-        return categories.only("id", "title", "slug")
+        return categories.only("id", "slug", "updated_at")
 
     def location(self, obj):
         return f"/categories/{obj.slug}"
@@ -32,8 +68,8 @@ class CategorySitemap(I18nSitemap):
 
 class ArticleSitemap(I18nSitemap):
     def items(self):
-        posts = Article.objects.filter(is_active=True)
-        return posts.only("id", "title", "slug")
+        posts = Article.objects.filter(is_active=True).order_by("id")
+        return posts.only("id", "slug", "updated_at")
 
     def location(self, obj):
         return f"/posts/{obj.slug}"
@@ -44,3 +80,65 @@ sitemaps = {
     "products": ProductSitemap,
     "pages": ArticleSitemap,
 }
+
+
+def render_sitemaps() -> int:
+    """
+    Render the index and the pages of every section to the cache,
+    pages of a former render beyond the current ones are deleted.
+    Returns the number of pages.
+    """
+    domain = Site.objects.get_current().domain
+    rendered, index = {}, []
+    for section, sitemap_class in sitemaps.items():
+        sitemap = sitemap_class()
+        urls = sitemap.iter_urls(domain)
+        for page in itertools.count(1):
+            urlset = list(itertools.islice(urls, settings.SITEMAP_PAGE_SIZE))
+            if not urlset:
+                break
+            key = SITEMAP_PAGE_CACHE_KEY.format(section=section, page=page)
+            rendered[key] = render_to_string("sitemap.xml", {"urlset": urlset})
+            location = SITEMAP_PAGE_PATH.format(section=section, page=page)
+            index.append(
+                {
+                    "location": f"{sitemap.protocol}://{domain}{location}",
+                    "last_mod": max(
+                        filter(None, (url["lastmod"] for url in urlset)), default=None
+                    ),
+                }
+            )
+
+    previous = cache.get(SITEMAP_INDEX_CACHE_KEY)
+    content = render_to_string("sitemap_index.xml", {"sitemaps": index})
+    rendered[SITEMAP_INDEX_CACHE_KEY] = (content, list(rendered))
+    cache.set_many(rendered, None)
+    if previous is not None:
+        cache.delete_many(set(previous[1]) - set(rendered))
+    return len(index)
+
+
+def _sitemap_response(content: typing.Optional[str]) -> HttpResponse:
+    if content is None:
+        # not rendered yet or evicted, crawlers come back later
+        # the tasks module imports this one
+        from src.apps.api.tasks import schedule_sitemap_render
+
+        schedule_sitemap_render()
+        response = HttpResponse(status=503)
+        response["Retry-After"] = settings.SITEMAP_RENDER_DELAY
+        return response
+    return HttpResponse(content, content_type="application/xml")
+
+
+def sitemap_index(request):
+    index = cache.get(SITEMAP_INDEX_CACHE_KEY)
+    return _sitemap_response(index[0] if index is not None else None)
+
+
+def sitemap_section(request, section: str, page: int):
+    key = SITEMAP_PAGE_CACHE_KEY.format(section=section, page=page)
+    content = cache.get(key)
+    if content is None and cache.get(SITEMAP_INDEX_CACHE_KEY) is not None:
+        return HttpResponse(status=404)
+    return _sitemap_response(content)
@@ -1,12 +1,11 @@
 from django.conf import settings
 from django.conf.urls.static import static
 from django.contrib import admin
-from django.contrib.sitemaps.views import sitemap
 from django.urls import include, path
 from django.views.decorators.csrf import csrf_exempt
-from graphene_django.views import GraphQLView
 
-from src.core.sitemap import sitemaps
+from src.core.graphql.views import GraphQLView
+from src.core.sitemap import sitemap_index, sitemap_section
 
 urlpatterns = [
     # API's
@@ -24,7 +23,12 @@ urlpatterns = [
     path("anymail/", include("anymail.urls")),
     path('_nested_admin/', include('nested_admin.urls')),
     # SEO
-    path("sitemap.xml", sitemap, {"sitemaps": sitemaps}, name="sitemap"),
+    path("sitemap.xml", sitemap_index, name="sitemap"),
+    path(
+        "sitemap-<slug:section>-<int:page>.xml",
+        sitemap_section,
+        name="sitemap-section",
+    ),
     path("robots.txt", include("robots.urls")),
 ]
 
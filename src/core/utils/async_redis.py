@@ -0,0 +1,91 @@
+import asyncio
+import threading
+import typing
+import weakref
+
+import redis
+from redis import asyncio as aioredis
+
+# event loop -> sync connection pool -> async client of the same server
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, dict]" = (
+    weakref.WeakKeyDictionary()
+)
+_clients_lock = threading.Lock()
+# settings of a sync connection which an async one takes as well,
+# the rest are internals of the sync parser and pool
+CONNECTION_KWARGS = (
+    "host",
+    "port",
+    "path",
+    "db",
+    "username",
+    "password",
+    "socket_timeout",
+    "socket_connect_timeout",
+    "retry_on_timeout",
+    "health_check_interval",
+    "client_name",
+)
+
+
+def get_async_pool(pool: redis.ConnectionPool) -> aioredis.ConnectionPool:
+    kwargs = {
+        name: value
+        for name, value in pool.connection_kwargs.items()
+        if name in CONNECTION_KWARGS or name.startswith("ssl_")
+    }
+    # Connection, SSLConnection or UnixDomainSocketConnection
+    connection_class = getattr(
+        aioredis, pool.connection_class.__name__, aioredis.Connection
+    )
+    return aioredis.ConnectionPool(
+        connection_class=connection_class,
+        max_connections=pool.max_connections,
+        **kwargs,
+    )
+
+
+def get_async_client(client: redis.Redis) -> aioredis.Redis:
+    """
+    redis.asyncio twin of a sync client for the running event loop,
+    its connections can not be shared with another loop
+    """
+    loop = asyncio.get_running_loop()
+    pool = client.connection_pool
+    with _clients_lock:
+        clients = _clients.setdefault(loop, {})
+        if id(pool) not in clients:
+            clients[id(pool)] = aioredis.Redis(connection_pool=get_async_pool(pool))
+        return clients[id(pool)]
+
+
+class AsyncRedisReader:
+    """
+    Reads of a django-redis cache without a thread. Keys are made and values
+    decoded by the client of the cache, so both see the same entries.
+    """
+
+    def __init__(self, cache):
+        self.cache = cache
+
+    def get_client(self) -> aioredis.Redis:
+        return get_async_client(self.cache.client.get_client(write=False))
+
+    async def aget(self, key, default=None, version=None) -> typing.Any:
+        value = await self.get_client().get(
+            self.cache.client.make_key(key, version=version)
+        )
+        return default if value is None else self.cache.client.decode(value)
+
+    async def aget_many(self, keys, version=None) -> dict:
+        keys = list(keys)
+        if not keys:
+            return {}
+        values = await self.get_client().mget(
+            [self.cache.client.make_key(key, version=version) for key in keys]
+        )
+        return {
+            key: self.cache.client.decode(value)
+            for key, value in zip(keys, values)
+            if value is not None
+        }
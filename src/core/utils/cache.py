@@ -0,0 +1,138 @@
+import contextlib
+import math
+import random
+import time
+import typing
+import uuid
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.core.cache import cache
+from redis.exceptions import LockError
+
+LOCK_CACHE_KEY = "lock:{key}"
+# how often a process waiting for a lock of a non-redis backend retries it
+LOCK_POLL_INTERVAL = 0.05
+
+
+class CacheEntry(typing.NamedTuple):
+    value: typing.Any
+    # seconds the value took to compute, the longer the earlier it is renewed
+    delta: float
+    # soft expiry, the value is stale but still served after it
+    expires_at: float
+
+
+@contextlib.contextmanager
+def cache_lock(key: str, wait: typing.Optional[float] = None):
+    """
+    Lock of the key shared by every process, yields whether it was acquired
+    within ``wait`` seconds. Expires after CACHE_LOCK_TIMEOUT so a killed
+    process does not hold it forever.
+    """
+    lock_key = LOCK_CACHE_KEY.format(key=key)
+    timeout = settings.CACHE_LOCK_TIMEOUT
+    wait = settings.CACHE_LOCK_WAIT if wait is None else wait
+    if hasattr(cache, "lock"):
+        # django-redis
+        lock = cache.lock(lock_key, timeout=timeout)
+        acquired = lock.acquire(blocking=wait > 0, blocking_timeout=wait)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                with contextlib.suppress(LockError):
+                    # expired while held, someone else may own it now
+                    lock.release()
+        return
+
+    token = uuid.uuid4().hex
+    deadline = time.monotonic() + wait
+    acquired = cache.add(lock_key, token, timeout)
+    while not acquired and time.monotonic() < deadline:
+        time.sleep(LOCK_POLL_INTERVAL)
+        acquired = cache.add(lock_key, token, timeout)
+    try:
+        yield acquired
+    finally:
+        if acquired and cache.get(lock_key) == token:
+            cache.delete(lock_key)
+
+
+def is_expired(entry: CacheEntry, beta: float, now: float) -> bool:
+    """
+    XFetch: the closer to expires_at and the slower the value is to compute,
+    the likelier it is treated as expired, so one request renews it early
+    instead of all of them at once at expires_at.
+    """
+    return now - entry.delta * beta * math.log(1 - random.random()) >= entry.expires_at
+
+
+def _compute(key: str, compute, timeout, stale_timeout: int) -> typing.Any:
+    started = time.monotonic()
+    value = compute()
+    delta = time.monotonic() - started
+    timeout = timeout(value) if callable(timeout) else timeout
+    entry = CacheEntry(value, delta, time.time() + timeout)
+    cache.set(key, tuple(entry), timeout + stale_timeout)
+    return value
+
+
+def get_or_compute(
+    key: str,
+    compute: typing.Callable[[], typing.Any],
+    timeout: typing.Union[int, typing.Callable[[typing.Any], int]],
+    stale_timeout: typing.Optional[int] = None,
+    beta: typing.Optional[float] = None,
+) -> typing.Any:
+    """
+    Value of the key, made by ``compute()`` in one process at a time.
+    ``timeout`` may depend on the value, e.g. shorter for a not found one.
+
+    A stale value is served for ``stale_timeout`` more seconds while
+    the process holding the lock renews it. A missing one is awaited for
+    up to CACHE_LOCK_WAIT seconds, then computed without the lock.
+    """
+    stale_timeout = (
+        settings.CACHE_STALE_TIMEOUT if stale_timeout is None else stale_timeout
+    )
+    beta = settings.CACHE_XFETCH_BETA if beta is None else beta
+
+    entry = cache.get(key)
+    if entry is not None:
+        entry = CacheEntry(*entry)
+        if not is_expired(entry, beta, time.time()):
+            return entry.value
+        with cache_lock(key, wait=0) as acquired:
+            if acquired:
+                return _compute(key, compute, timeout, stale_timeout)
+        return entry.value
+
+    with cache_lock(key):
+        # made by the process which held the lock meanwhile
+        entry = cache.get(key)
+        if entry is not None:
+            return CacheEntry(*entry).value
+        return _compute(key, compute, timeout, stale_timeout)
+
+
+async def aget_or_compute(
+    key: str,
+    compute: typing.Callable[[], typing.Any],
+    timeout: typing.Union[int, typing.Callable[[typing.Any], int]],
+    stale_timeout: typing.Optional[int] = None,
+    beta: typing.Optional[float] = None,
+) -> typing.Any:
+    """
+    get_or_compute() for async views: a fresh value is read in the event loop,
+    a missing or expiring one is left to get_or_compute() in a thread.
+    """
+    beta = settings.CACHE_XFETCH_BETA if beta is None else beta
+    entry = await cache.aget(key)
+    if entry is not None:
+        entry = CacheEntry(*entry)
+        if not is_expired(entry, beta, time.time()):
+            return entry.value
+    return await sync_to_async(get_or_compute)(
+        key, compute, timeout, stale_timeout, beta
+    )
@@ -0,0 +1,71 @@
+import base64
+import json
+import typing
+
+from django.db.models import Q
+
+
+def encode_cursor(payload) -> str:
+    # str() keeps the microseconds DjangoJSONEncoder would cut off
+    return base64.urlsafe_b64encode(json.dumps(payload, default=str).encode()).decode()
+
+
+def decode_cursor(cursor: str):
+    """Payload of encode_cursor(), ValueError if the cursor is not one"""
+    try:
+        return json.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except (TypeError, ValueError) as e:
+        raise ValueError(f"Invalid cursor {cursor!r}") from e
+
+
+def get_row_values(row, ordering: typing.Sequence[str]) -> list:
+    return [getattr(row, name.lstrip("-")) for name in ordering]
+
+
+def to_python(model, ordering: typing.Sequence[str], values) -> list:
+    """Values of a decoded cursor as the fields of the ordering take them"""
+    if not isinstance(values, list) or len(values) != len(ordering):
+        raise ValueError(f"Cursor does not match the ordering {ordering}")
+    try:
+        return [
+            model._meta.get_field(name.lstrip("-")).to_python(value)
+            for name, value in zip(ordering, values)
+        ]
+    except Exception as e:
+        raise ValueError(f"Invalid cursor values {values}") from e
+
+
+def with_unique_key(model, ordering: typing.Sequence[str]) -> tuple:
+    """Ordering ending with the primary key, so a row position is unambiguous"""
+    pk = model._meta.pk.name
+    ordering = tuple(ordering)
+    if not ordering or ordering[-1].lstrip("-") not in (pk, "pk"):
+        direction = "-" if ordering and ordering[-1].startswith("-") else ""
+        ordering += (f"{direction}{pk}",)
+    return tuple(
+        name.replace("pk", pk) if name.lstrip("-") == "pk" else name
+        for name in ordering
+    )
+
+
+def reverse_ordering(ordering: typing.Sequence[str]) -> tuple:
+    return tuple(name[1:] if name.startswith("-") else f"-{name}" for name in ordering)
+
+
+def keyset_q(ordering: typing.Sequence[str], values: typing.Sequence) -> Q:
+    """
+    Rows after the one with the values, in the ordering:
+    a <= x AND ((a < x) OR (a = x AND b < y) ...) for a descending ``a``.
+    The leading bound on the first column is what lets the index of the
+    columns serve it as one range scan, the OR expansion only filters
+    the ties inside the range. It holds for mixed directions as well,
+    where a row value comparison (a, b) < (x, y) would not.
+    """
+    first = ordering[0]
+    bound = "lte" if first.startswith("-") else "gte"
+    q = Q()
+    for i, name in enumerate(ordering):
+        lookup = "lt" if name.startswith("-") else "gt"
+        equal = {field.lstrip("-"): value for field, value in zip(ordering, values[:i])}
+        q |= Q(**equal, **{f"{name.lstrip('-')}__{lookup}": values[i]})
+    return Q(**{f"{first.lstrip('-')}__{bound}": values[0]}) & q
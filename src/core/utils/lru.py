@@ -0,0 +1,54 @@
+import threading
+import time
+import typing
+from collections import OrderedDict
+
+_missing = object()
+
+
+class LRUCache:
+    """
+    Bounded process-local cache, the least recently used key goes first.
+    Entries also expire after timeout seconds, None - never.
+    """
+
+    def __init__(self, maxsize: int = 1024, timeout: typing.Optional[float] = None):
+        self.maxsize = maxsize
+        self.timeout = timeout
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, _missing) is not _missing
+
+    def get(self, key, default=None):
+        with self._lock:
+            try:
+                value, expires_at = self._data[key]
+            except KeyError:
+                return default
+            if expires_at is not None and expires_at <= time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key, value, timeout: typing.Optional[float] = _missing) -> None:
+        timeout = self.timeout if timeout is _missing else timeout
+        expires_at = None if timeout is None else time.monotonic() + timeout
+        with self._lock:
+            self._data[key] = (value, expires_at)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def delete(self, key) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
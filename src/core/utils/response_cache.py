@@ -0,0 +1,148 @@
+import hashlib
+import time
+import typing
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+
+RESPONSE_CACHE_KEY = "response:{digest}"
+TAG_CACHE_KEY = "response:tag:{tag}"
+
+
+class CachedResponse(typing.NamedTuple):
+    content: bytes
+    content_type: str
+    # tag -> its version when the response was rendered
+    tags: typing.Dict[str, float]
+    # validators of conditional GET, see ConditionalGetMixin
+    headers: typing.Dict[str, str] = {}
+
+
+def model_tag(model: typing.Type[models.Model]) -> str:
+    """
+    Tag of every response listing the model, a new, deleted or moved row
+    changes all of them, see RESPONSE_CACHE_LIST_FIELDS
+    """
+    return model._meta.label_lower
+
+
+def pk_tag(model: typing.Type[models.Model], pk) -> str:
+    """Tag of the row with the primary key, without loading it"""
+    return f"{model_tag(model)}:{pk}"
+
+
+def instance_tag(instance: models.Model) -> str:
+    return pk_tag(type(instance), instance.pk)
+
+
+def parent_tags(instance) -> typing.List[str]:
+    """
+    Tags of the rows the instance points at, a new photo of a product
+    changes the responses which rendered the product with its photos
+    """
+    return [
+        pk_tag(field.related_model, getattr(instance, field.attname))
+        for field in instance._meta.concrete_fields
+        if field.many_to_one and getattr(instance, field.attname) is not None
+    ]
+
+
+def collect_tags(instances: typing.Iterable[models.Model]) -> typing.Set[str]:
+    """
+    Tags of the instances and of everything select_related or prefetch_related
+    loaded with them, without queries
+    """
+    tags, stack = set(), list(instances)
+    while stack:
+        instance = stack.pop()
+        if instance is None:
+            continue
+        tag = instance_tag(instance)
+        if tag in tags:
+            continue
+        tags.add(tag)
+        stack.extend(instance._state.fields_cache.values())
+        for related in getattr(instance, "_prefetched_objects_cache", {}).values():
+            stack.extend(related)
+    return tags
+
+
+def get_response_key(path: str, language: str) -> str:
+    digest = hashlib.md5(f"{language}:{path}".encode()).hexdigest()
+    return RESPONSE_CACHE_KEY.format(digest=digest)
+
+
+def _get_tag_keys(response: CachedResponse) -> typing.Dict[str, float]:
+    """Cache keys of the tag versions -> the versions the response was made at"""
+    return {
+        TAG_CACHE_KEY.format(tag=tag): version for tag, version in response.tags.items()
+    }
+
+
+def _is_fresh(keys: typing.Dict[str, float], versions: dict) -> bool:
+    return all(versions.get(tag_key) == v for tag_key, v in keys.items())
+
+
+def get_cached_response(key: str) -> typing.Optional[CachedResponse]:
+    """The response, unless one of its tags was invalidated after it was made"""
+    response = cache.get(key)
+    if response is None:
+        return None
+    response = CachedResponse(*response)
+    keys = _get_tag_keys(response)
+    return response if _is_fresh(keys, cache.get_many(keys)) else None
+
+
+async def aget_cached_response(key: str) -> typing.Optional[CachedResponse]:
+    """get_cached_response() for async views"""
+    response = await cache.aget(key)
+    if response is None:
+        return None
+    response = CachedResponse(*response)
+    keys = _get_tag_keys(response)
+    return response if _is_fresh(keys, await cache.aget_many(keys)) else None
+
+
+def get_tag_versions(
+    tags: typing.Iterable[str], started: float
+) -> typing.Optional[typing.Dict[str, float]]:
+    """
+    Current versions of the tags of a response rendered since ``started``,
+    None if any of them was invalidated meanwhile
+    """
+    keys = {TAG_CACHE_KEY.format(tag=tag): tag for tag in tags}
+    versions = cache.get_many(keys)
+    for tag_key in keys.keys() - versions.keys():
+        # never invalidated or expired, the response is as new as its render
+        cache.add(tag_key, started, settings.RESPONSE_CACHE_TAG_TIMEOUT)
+        versions[tag_key] = cache.get(tag_key)
+    if any(version is None or version > started for version in versions.values()):
+        return None
+    return {keys[tag_key]: version for tag_key, version in versions.items()}
+
+
+def get_versions_etag(key: str, versions: typing.Dict[str, float]) -> str:
+    """Same while no tag of the response at the key is invalidated"""
+    return hashlib.md5(f"{key}:{sorted(versions.items())}".encode()).hexdigest()
+
+
+def set_cached_response(
+    key: str,
+    content: bytes,
+    content_type: str,
+    versions: typing.Dict[str, float],
+    headers: typing.Optional[typing.Dict[str, str]] = None,
+):
+    """Stores the response made at the versions of get_tag_versions()"""
+    response = CachedResponse(content, content_type, versions, headers or {})
+    cache.set(key, tuple(response), settings.RESPONSE_CACHE_TIMEOUT)
+
+
+def invalidate_tags(tags: typing.Iterable[str]):
+    """Every response tagged with any of the tags is stale from now on"""
+    now = time.time()
+    cache.set_many(
+        {TAG_CACHE_KEY.format(tag=tag): now for tag in tags},
+        settings.RESPONSE_CACHE_TAG_TIMEOUT,
+    )
@@ -0,0 +1,41 @@
+import typing
+from html import unescape
+
+from django.conf import settings
+from django.utils.html import strip_tags
+from django.utils.text import Truncator
+from modeltranslation.utils import build_localized_fieldname
+
+
+def make_excerpt(html: typing.Optional[str], length: int) -> str:
+    """Plain text start of rich text, cut at a word and ended with an ellipsis"""
+    text = " ".join(unescape(strip_tags(html or "")).split())
+    return Truncator(text).chars(length, truncate="…")
+
+
+def fill_excerpts(model, source: str, batch_size: int = 500):
+    """
+    Excerpts of every row of the ExcerptMixin model from its ``source`` field,
+    in every language, e.g. from a data migration with the historical model
+    """
+    length = model._meta.get_field("excerpt").max_length
+    rows = list(model.objects.all())
+    for row in rows:
+        for language in settings.MODELTRANSLATION_LANGUAGES:
+            html = getattr(row, build_localized_fieldname(source, language))
+            setattr(
+                row,
+                build_localized_fieldname("excerpt", language),
+                make_excerpt(html, length),
+            )
+        row.excerpt = getattr(
+            row,
+            build_localized_fieldname(
+                "excerpt", settings.MODELTRANSLATION_DEFAULT_LANGUAGE
+            ),
+        )
+    fields = ["excerpt"] + [
+        build_localized_fieldname("excerpt", language)
+        for language in settings.MODELTRANSLATION_LANGUAGES
+    ]
+    model.objects.bulk_update(rows, fields, batch_size=batch_size)
@@ -0,0 +1,344 @@
+import collections
+import json
+import logging
+import os
+import threading
+import time
+import typing
+import uuid
+
+from django.core.cache import caches
+from django.core.cache.backends.base import DEFAULT_TIMEOUT, BaseCache
+from django.utils.functional import cached_property
+from django.utils.module_loading import import_string
+from redis.exceptions import RedisError
+
+from src.core.utils.async_redis import AsyncRedisReader
+from src.core.utils.lru import LRUCache
+
+logger = logging.getLogger(__name__)
+
+_missing = object()
+
+
+class LocalBus:
+    """
+    In-process stand-in of RedisBus for tests and a single process,
+    every tier of the channel gets the message right away
+    """
+
+    _subscribers = collections.defaultdict(list)
+
+    def __init__(self, remote_alias: str, channel: str):
+        self.channel = channel
+
+    def publish(self, message: str):
+        for on_message, _ in list(self._subscribers[self.channel]):
+            on_message(message)
+
+    def subscribe(self, on_message, on_reset):
+        self._subscribers[self.channel].append((on_message, on_reset))
+
+
+class RedisBus:
+    """
+    Redis pub/sub of a django-redis cache. Messages published while
+    the listener is reconnecting are lost, so it resets the tier on subscribe.
+    """
+
+    reconnect_interval = 1
+
+    def __init__(self, remote_alias: str, channel: str):
+        self.remote_alias = remote_alias
+        self.channel = channel
+
+    def get_client(self):
+        return caches[self.remote_alias].client.get_client(write=True)
+
+    def publish(self, message: str):
+        try:
+            self.get_client().publish(self.channel, message)
+        except RedisError as e:
+            logger.error(f"Cache invalidation was not published: {e}")
+
+    def subscribe(self, on_message, on_reset):
+        threading.Thread(
+            target=self.listen, args=(on_message, on_reset), daemon=True
+        ).start()
+
+    def listen(self, on_message, on_reset):
+        while True:
+            try:
+                pubsub = self.get_client().pubsub(ignore_subscribe_messages=True)
+                pubsub.subscribe(self.channel)
+                on_reset()
+                for message in pubsub.listen():
+                    on_message(message["data"].decode())
+            except RedisError as e:
+                logger.warning(f"Cache invalidation channel lost: {e}")
+                on_reset()
+                time.sleep(self.reconnect_interval)
+
+
+class LocalTier:
+    """LRU of one process shared by its threads, with hit and miss counters"""
+
+    def __init__(self, options: dict):
+        self.maxsize = options.get("LOCAL_MAXSIZE", 1024)
+        self.timeout = options.get("LOCAL_TIMEOUT", 10)
+        self.bus = import_string(
+            options.get("BUS", "src.core.utils.two_tier_cache.RedisBus")
+        )(options["REMOTE"], options.get("CHANNEL", "cache:invalidate"))
+        self.lru = LRUCache(maxsize=self.maxsize, timeout=self.timeout)
+        # bumped by every invalidation, a value read from the remote tier
+        # meanwhile may be stale already and is not kept
+        self.generation = 0
+        self.stats = {
+            "local": {"hits": 0, "misses": 0},
+            "remote": {"hits": 0, "misses": 0},
+        }
+        self._lock = threading.Lock()
+        self._pid = None
+        self._sender = None
+
+    def ensure_subscribed(self):
+        """Once per process, a forked worker does not inherit the listener"""
+        if self._pid == os.getpid():
+            return
+        with self._lock:
+            if self._pid == os.getpid():
+                return
+            self.reset()
+            self._sender = uuid.uuid4().hex
+            self.bus.subscribe(self.on_message, self.reset)
+            self._pid = os.getpid()
+
+    def count(self, tier: str, result: str, n: int = 1):
+        with self._lock:
+            self.stats[tier][result] += n
+
+    def reset(self):
+        self.generation += 1
+        self.lru.clear()
+
+    def evict(self, keys: typing.Iterable[str]):
+        self.generation += 1
+        for key in keys:
+            self.lru.delete(key)
+
+    def publish(self, keys: typing.Optional[typing.List[str]]):
+        """Evicts the keys in every process, None - everything"""
+        if keys is None:
+            self.reset()
+        else:
+            self.evict(keys)
+        self.bus.publish(json.dumps({"sender": self._sender, "keys": keys}))
+
+    def on_message(self, message: str):
+        message = json.loads(message)
+        if message["sender"] == self._sender:
+            return
+        if message["keys"] is None:
+            self.reset()
+        else:
+            self.evict(message["keys"])
+
+
+_tiers: typing.Dict[str, LocalTier] = {}
+_tiers_lock = threading.Lock()
+
+
+def get_local_tier(name: str, options: dict) -> LocalTier:
+    with _tiers_lock:
+        if name not in _tiers:
+            _tiers[name] = LocalTier(options)
+        return _tiers[name]
+
+
+class TwoTierCache(BaseCache):
+    """
+    Process LRU in front of the cache of OPTIONS["REMOTE"], for the keys
+    starting with any of OPTIONS["LOCAL_KEY_PREFIXES"]. Locally cached values
+    are shared by reference, they must not be mutated.
+
+    Writes go to the remote cache. set() and add() store a value, they
+    evict the key from the LRU of this process only, the others keep
+    their copy for LOCAL_TIMEOUT at most: a get_or_compute() entry is only
+    renewed, a changed value is invalidated under a new version or key.
+    Invalidations, delete(), delete_many(), set_many(), incr(), decr()
+    and clear(), evict the keys in every process through OPTIONS["BUS"],
+    one message per call. LOCAL_TIMEOUT also bounds how long a process
+    may keep a value whose eviction it missed.
+
+    aget() and aget_many() of async views read django-redis through
+    redis.asyncio, other async methods run the sync ones in a thread.
+    """
+
+    def __init__(self, location, params):
+        super().__init__(params)
+        options = params.get("OPTIONS", {})
+        self._remote_alias = options["REMOTE"]
+        self._key_prefixes = tuple(options.get("LOCAL_KEY_PREFIXES", ("",)))
+        self._tier = get_local_tier(location or self._remote_alias, options)
+
+    def __getattr__(self, name):
+        # django-redis extras as lock() or ttl(), they bypass the local tier
+        if name.startswith("_"):
+            raise AttributeError(name)
+        return getattr(self.remote, name)
+
+    @property
+    def remote(self) -> BaseCache:
+        return caches[self._remote_alias]
+
+    def _local_key(self, key, version=None) -> typing.Optional[str]:
+        if not key.startswith(self._key_prefixes):
+            return None
+        return self.remote.make_key(key, version=version)
+
+    def _evict(self, keys, version=None, publish=True):
+        local_keys = [self._local_key(key, version) for key in keys]
+        local_keys = [key for key in local_keys if key is not None]
+        if not local_keys:
+            return
+        self._tier.ensure_subscribed()
+        if publish:
+            self._tier.publish(local_keys)
+        else:
+            self._tier.evict(local_keys)
+
+    def stats(self) -> dict:
+        """Hits and misses of both tiers in this process"""
+        return {
+            **{tier: dict(counts) for tier, counts in self._tier.stats.items()},
+            "local_size": len(self._tier.lru),
+        }
+
+    def _get_local(self, local_key: typing.Optional[str]):
+        if local_key is None:
+            return _missing
+        self._tier.ensure_subscribed()
+        value = self._tier.lru.get(local_key, _missing)
+        self._tier.count("local", "misses" if value is _missing else "hits")
+        return value
+
+    def _got_remote(self, found: dict, keys: list, generation: int, version=None):
+        """Counts the reads of the remote tier, keeps the values locally"""
+        self._tier.count("remote", "hits", len(found))
+        self._tier.count("remote", "misses", len(keys) - len(found))
+        if generation != self._tier.generation:
+            return
+        for key, value in found.items():
+            local_key = self._local_key(key, version)
+            if local_key is not None:
+                self._tier.lru.set(local_key, value)
+
+    def get(self, key, default=None, version=None):
+        value = self._get_local(self._local_key(key, version))
+        if value is not _missing:
+            return value
+        generation = self._tier.generation
+        value = self.remote.get(key, _missing, version=version)
+        found = {} if value is _missing else {key: value}
+        self._got_remote(found, [key], generation, version)
+        return found.get(key, default)
+
+    def get_many(self, keys, version=None):
+        found, remote_keys = {}, []
+        for key in keys:
+            value = self._get_local(self._local_key(key, version))
+            if value is _missing:
+                remote_keys.append(key)
+            else:
+                found[key] = value
+        if remote_keys:
+            generation = self._tier.generation
+            remote_found = self.remote.get_many(remote_keys, version=version)
+            self._got_remote(remote_found, remote_keys, generation, version)
+            found.update(remote_found)
+        return found
+
+    @cached_property
+    def async_remote(self):
+        """Reads of the remote tier for async views, without a thread for redis"""
+        if hasattr(self.remote, "client") and hasattr(self.remote.client, "decode"):
+            # django-redis
+            return AsyncRedisReader(self.remote)
+        return self.remote
+
+    async def aget(self, key, default=None, version=None):
+        value = self._get_local(self._local_key(key, version))
+        if value is not _missing:
+            return value
+        generation = self._tier.generation
+        value = await self.async_remote.aget(key, _missing, version=version)
+        found = {} if value is _missing else {key: value}
+        self._got_remote(found, [key], generation, version)
+        return found.get(key, default)
+
+    async def aget_many(self, keys, version=None):
+        found, remote_keys = {}, []
+        for key in keys:
+            value = self._get_local(self._local_key(key, version))
+            if value is _missing:
+                remote_keys.append(key)
+            else:
+                found[key] = value
+        if remote_keys:
+            generation = self._tier.generation
+            remote_found = await self.async_remote.aget_many(
+                remote_keys, version=version
+            )
+            self._got_remote(remote_found, remote_keys, generation, version)
+            found.update(remote_found)
+        return found
+
+    def has_key(self, key, version=None):
+        return self.get(key, _missing, version=version) is not _missing
+
+    def add(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        added = self.remote.add(key, value, timeout, version=version)
+        if added:
+            # the key was missing, no other process holds it for long
+            self._evict([key], version, publish=False)
+        return added
+
+    def set(self, key, value, timeout=DEFAULT_TIMEOUT, version=None):
+        self.remote.set(key, value, timeout, version=version)
+        self._evict([key], version, publish=False)
+
+    def set_many(self, data, timeout=DEFAULT_TIMEOUT, version=None):
+        failed = self.remote.set_many(data, timeout, version=version)
+        self._evict(data, version)
+        return failed
+
+    def touch(self, key, timeout=DEFAULT_TIMEOUT, version=None):
+        return self.remote.touch(key, timeout, version=version)
+
+    def delete(self, key, version=None):
+        deleted = self.remote.delete(key, version=version)
+        self._evict([key], version)
+        return deleted
+
+    def delete_many(self, keys, version=None):
+        keys = list(keys)
+        self.remote.delete_many(keys, version=version)
+        self._evict(keys, version)
+
+    def incr(self, key, delta=1, version=None):
+        value = self.remote.incr(key, delta, version=version)
+        self._evict([key], version)
+        return value
+
+    def decr(self, key, delta=1, version=None):
+        value = self.remote.decr(key, delta, version=version)
+        self._evict([key], version)
+        return value
+
+    def clear(self):
+        self.remote.clear()
+        self._tier.ensure_subscribed()
+        self._tier.publish(None)
+
+    def close(self, **kwargs):
+        self.remote.close(**kwargs)
@@ -0,0 +1,81 @@
+import logging
+from io import BytesIO
+from typing import Dict, List, Tuple
+
+from django.conf import settings
+from django.core.files.base import ContentFile
+from PIL import Image
+
+from src.core.utils.cache import get_or_compute
+
+logger = logging.getLogger(__name__)
+
+VARIANTS_CACHE_KEY = "images:variants:{image_hash}"
+
+
+def get_formats() -> Tuple[str, ...]:
+    """Modern formats the installed Pillow can write, the smallest first"""
+    Image.init()
+    return tuple(
+        image_format for image_format in ("AVIF", "WEBP") if image_format in Image.SAVE
+    )
+
+
+def make_variants(image_field, image_hash: str) -> Dict[str, List[Tuple[int, str]]]:
+    """
+    Writes the missing variants of the image to the storage.
+    Widths wider than the image itself are skipped.
+    :return: {format: [(width, name), ...]}
+    """
+    storage = image_field.storage
+    manifest = {}
+    with image_field.open("rb") as image_file, Image.open(image_file) as photo:
+        widths = [w for w in settings.IMAGE_VARIANT_WIDTHS if w < photo.width]
+        for image_format in get_formats():
+            variants = manifest[image_format.lower()] = []
+            for width in widths:
+                name = (
+                    f"{settings.IMAGE_VARIANT_DIR}/{image_hash}/"
+                    f"{width}.{image_format.lower()}"
+                )
+                if not storage.exists(name):
+                    variant = photo.copy()
+                    variant.thumbnail((width, photo.height), Image.LANCZOS)
+                    buffer = BytesIO()
+                    variant.save(
+                        buffer,
+                        format=image_format,
+                        quality=settings.IMAGE_VARIANT_QUALITY,
+                    )
+                    name = storage.save(name, ContentFile(buffer.getvalue()))
+                    logger.info(f"Image variant {name} made")
+                variants.append((width, name))
+    return manifest
+
+
+def get_srcset(image_field, image_hash: str) -> Dict[str, str]:
+    """
+    srcset of every format for <picture><source type="image/...">,
+    the variants are made on the first call and kept by the content hash.
+    """
+    if not image_hash or not image_field:
+        return {}
+    key = VARIANTS_CACHE_KEY.format(image_hash=image_hash)
+    try:
+        # made by one process, the others wait for its manifest
+        manifest = get_or_compute(
+            key,
+            lambda: make_variants(image_field, image_hash),
+            settings.IMAGE_VARIANTS_CACHE_TIMEOUT,
+        )
+    except (OSError, ValueError) as e:
+        logger.error(f"Image variants of {image_field.name} failed: {e}")
+        return {}
+    storage = image_field.storage
+    return {
+        image_format: ", ".join(
+            f"{storage.url(name)} {width}w" for width, name in variants
+        )
+        for image_format, variants in manifest.items()
+        if variants
+    }
@@ -1,11 +1,51 @@
+import hashlib
+import logging
+import os
+from functools import lru_cache
+from io import BytesIO
+from typing import Optional
+
+from django.apps import apps
+from django.core.files.base import ContentFile
 from PIL import Image, ImageDraw, ImageFont
+
+from src.core.celery import app
+from src.core.utils.response_cache import instance_tag, invalidate_tags, parent_tags
 from src.settings.components.watermark import (
     WATERMARK_TEXT,
     WATERMARK_POSITION,
     WATERMARK_FONT,
+    WATERMARK_FONT_SIZE,
+    WATERMARK_DIR,
     IMAGE_SIZE,
 )
 
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=8)
+def get_font(font=WATERMARK_FONT, size=WATERMARK_FONT_SIZE):
+    try:
+        return ImageFont.truetype(font, size)
+    except OSError:
+        logger.warning(f"Font {font} not found, the default font is used")
+        return ImageFont.load_default()
+
+
+def draw_watermark(
+    photo: Image.Image,
+    text=WATERMARK_TEXT,
+    pos=WATERMARK_POSITION,
+    font=WATERMARK_FONT,
+) -> Image.Image:
+    """Resized copy of the photo with the text on it"""
+    photo = photo.copy()
+    photo.thumbnail(IMAGE_SIZE, Image.ANTIALIAS)
+    drawing = ImageDraw.Draw(photo)
+    font_color = (200, 200, 200)
+    drawing.text(pos, text, fill=font_color, font=get_font(font))
+    return photo
+
 
 def watermark_text(
     input_image_path,
@@ -24,15 +64,54 @@ def watermark_text(
     Example: (0,0) is a top left corner of the image
     :return:
     """
-    photo = Image.open(input_image_path)
-    # resizing
-    photo.thumbnail(IMAGE_SIZE, Image.ANTIALIAS)
+    with Image.open(input_image_path) as photo:
+        draw_watermark(photo, text=text, pos=pos, font=font).save(output_image_path)
 
-    # make the image editable
-    drawing = ImageDraw.Draw(photo)
 
-    font_color = (200, 200, 200)
-    font = ImageFont.truetype(font, 40)
-    drawing.text(pos, text, fill=font_color, font=font)
-    photo.show()  # just to show the result picture when you test it
-    photo.save(output_image_path)
+@app.task()
+def watermark_image(app_label: str, model_name: str, pk: int) -> Optional[str]:
+    """
+    Writes a watermarked copy of ImagesMixin.image_preview next to the original.
+    The copy is named by the content hash, the same image is never done twice.
+    """
+    model = apps.get_model(app_label, model_name)
+    parents = [f.attname for f in model._meta.concrete_fields if f.many_to_one]
+    instance = (
+        model.objects.filter(pk=pk)
+        .only("image_preview", "image_watermark", "image_hash", *parents)
+        .first()
+    )
+    if instance is None or not instance.image_preview:
+        return None
+
+    try:
+        with instance.image_preview.open("rb") as image_file:
+            content = image_file.read()
+    except OSError as e:
+        logger.warning(f"{app_label}.{model_name} {pk}, no image to watermark - {e}")
+        return None
+    image_hash = hashlib.sha256(content).hexdigest()
+    if image_hash == instance.image_hash and instance.image_watermark:
+        return instance.image_watermark.name
+
+    storage = instance.image_watermark.storage
+    _, ext = os.path.splitext(instance.image_preview.name)
+    name = f"{WATERMARK_DIR}/{image_hash}{ext.lower()}"
+    if not storage.exists(name):
+        with Image.open(BytesIO(content)) as photo:
+            image_format = photo.format
+            photo = draw_watermark(photo)
+        buffer = BytesIO()
+        photo.save(buffer, format=image_format)
+        name = storage.save(name, ContentFile(buffer.getvalue()))
+
+    # nothing is written if the image was replaced meanwhile,
+    # the save of the new image queued its own task
+    updated = model.objects.filter(
+        pk=pk, image_preview=instance.image_preview.name
+    ).update(image_hash=image_hash, image_watermark=name)
+    if updated:
+        # an update() sends no post_save, the cached responses show the image
+        invalidate_tags([instance_tag(instance), *parent_tags(instance)])
+    logger.info(f"Watermark {name} for {app_label}.{model_name} {pk}")
+    return name
@@ -1,10 +1,34 @@
 from src.settings.components.redis import REDIS_HOST, REDIS_PORT, REDIS_PASSWORD
 
 SESSION_ENGINE = "django.contrib.sessions.backends.cache"
-SESSION_CACHE_ALIAS = "default"
+# sessions skip the process tier, a logout must be seen by every process at once
+SESSION_CACHE_ALIAS = "shared"
 
 CACHES = {
+    # a process LRU in front of "shared" for nearly static data,
+    # see src.core.utils.two_tier_cache
     "default": {
+        "BACKEND": "src.core.utils.two_tier_cache.TwoTierCache",
+        "OPTIONS": {
+            "REMOTE": "shared",
+            "BUS": "src.core.utils.two_tier_cache.RedisBus",
+            "CHANNEL": "cache:invalidate",
+            "LOCAL_MAXSIZE": 2048,
+            # seconds a process may serve a value whose invalidation it missed
+            "LOCAL_TIMEOUT": 10,
+            "LOCAL_KEY_PREFIXES": (
+                "menu:",
+                # tag versions only, the rendered bodies are too large
+                # for an LRU bounded by the number of entries
+                "response:tag:",
+                "shop:exchange:",
+                "shorter:",
+                "images:variants:",
+                "graphql:",
+            ),
+        },
+    },
+    "shared": {
         "BACKEND": "django_redis.cache.RedisCache",
         "LOCATION": f"redis://{REDIS_HOST}:{REDIS_PORT}/3",
         "OPTIONS": {
@@ -17,8 +41,60 @@ CACHES = {
             "MAX_CONNECTIONS": 1000,
             "PICKLE_VERSION": -1,
         },
-    }
+    },
 }
 
 if REDIS_PASSWORD:
-    CACHES["default"]["OPTIONS"]["PASSWORD"] = REDIS_PASSWORD
+    CACHES["shared"]["OPTIONS"]["PASSWORD"] = REDIS_PASSWORD
+
+# get_or_compute of src.core.utils.cache
+# seconds a lock is held at most, longer than any computation
+CACHE_LOCK_TIMEOUT = 30
+# seconds a process waits for a missing value computed by another one
+CACHE_LOCK_WAIT = 10
+# seconds an expired value is still served while it is renewed
+CACHE_STALE_TIMEOUT = 60 * 5
+# > 1 renews values earlier, < 1 later
+CACHE_XFETCH_BETA = 1.0
+
+# menu trees are cached per language until a menu is changed
+MENU_TREE_CACHE_TIMEOUT = 60 * 60 * 24
+
+# whole responses of anonymous GET requests, see ResponseCacheMixin
+RESPONSE_CACHE_TIMEOUT = 60 * 60
+# versions of the response tags outlive every response made at them,
+# a tag evicted or expired reads as invalidated
+RESPONSE_CACHE_TAG_TIMEOUT = RESPONSE_CACHE_TIMEOUT * 2
+# a save or delete of these invalidates the responses that rendered them
+RESPONSE_CACHE_MODELS = (
+    "account.User",
+    "blog.Article",
+    "blog.Tag",
+    "menu.Menu",
+    "menu.MenuItems",
+    "reviews.Review",
+    "shop.Category",
+    "shop.Product",
+    "shop.ProductColor",
+    "shop.ProductPhoto",
+    "slider.Slider",
+)
+# fields the cached lists of a model filter or order by, an update of other
+# fields only invalidates the responses which rendered the instance;
+# models not listed here invalidate their lists on every save
+RESPONSE_CACHE_LIST_FIELDS = {
+    "blog.Article": ("is_active", "created_at"),
+    "shop.Product": (
+        "is_active",
+        "created_at",
+        "is_digital",
+        "price",
+        "price_currency",
+        "sale",
+        "sale_currency",
+        # words of ?q=, see SEARCH_FIELDS
+        "title",
+        "description",
+        "material",
+    ),
+}
@@ -1,4 +1,11 @@
 from src.settings.components.redis import REDIS_PASSWORD, REDIS_HOST, REDIS_PORT
+from src.settings.components.shorter import SHORTER_CLICKS_FLUSH_INTERVAL
 
 CELERY_CACHE_BACKEND = "default"
 CELERY_BROKER_URL = f"redis://:{REDIS_PASSWORD}@{REDIS_HOST}:{REDIS_PORT}/2"
+CELERY_BEAT_SCHEDULE = {
+    "shorter-flush-clicks": {
+        "task": "src.apps.shorter.tasks.flush_clicks",
+        "schedule": SHORTER_CLICKS_FLUSH_INTERVAL,
+    },
+}
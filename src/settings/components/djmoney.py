@@ -8,3 +8,5 @@ OPEN_EXCHANGE_RATES_APP_ID = config("OPEN_EXCHANGE_RATES_APP_ID", "")
 FIXER_ACCESS_KEY = config("FIXER_ACCESS_KEY", "")
 FIXER_URL = "http://data.fixer.io/api/latest?symbols=EUR,USD,RUB"
 LANG_EXCHANGE = {"ru": "RUB", "en": "EUR"}
+# Rates snapshot in the two tier cache, see LOCAL_KEY_PREFIXES
+EXCHANGE_RATES_CACHE_TIMEOUT = 60 * 60 * 24
@@ -1 +1,29 @@
 GRAPHENE = {"SCHEMA": "src.core.schema.schema"}
+
+# limits of a query, checked before it runs, see src.core.graphql.cost
+GRAPHQL_MAX_COST = 1000
+GRAPHQL_MAX_DEPTH = 10
+# nesting of the type lists (fields, interfaces...) under __schema or __type,
+# 1 is all GraphiQL asks for
+GRAPHQL_MAX_INTROSPECTION_DEPTH = 1
+# size assumed for lists which are not connections
+GRAPHQL_LIST_SIZE = 10
+# "Type.field": weight, scalars cost 0 and objects 1 by default
+GRAPHQL_FIELD_WEIGHTS = {
+    # the image variants are made on the first request
+    "ProductNode.imageSrcset": 2,
+    "ProductPhotoType.imageSrcset": 2,
+    # a query of its own for every category
+    "CategoryNode.products": 5,
+    # the whole schema, so a query can not ask for it over and over
+    "Query.__schema": 100,
+    "Query.__type": 10,
+}
+
+# parsed and validated documents kept per process, see src.core.graphql.documents
+GRAPHQL_DOCUMENT_CACHE_SIZE = 256
+# queries registered in the admin, run by the sha256 hash the clients send
+GRAPHQL_PERSISTED_QUERY_CACHE_TIMEOUT = 60 * 60 * 24
+GRAPHQL_PERSISTED_QUERY_NEGATIVE_CACHE_TIMEOUT = 60
+# reject the queries which are not registered
+GRAPHQL_PERSISTED_QUERIES_ONLY = False
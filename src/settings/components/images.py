@@ -0,0 +1,5 @@
+# Responsive variants of ImagesMixin images, made on the first request
+IMAGE_VARIANT_WIDTHS = (160, 320, 480)
+IMAGE_VARIANT_DIR = "variants"  # in MEDIA_ROOT, one directory per content hash
+IMAGE_VARIANT_QUALITY = 80
+IMAGE_VARIANTS_CACHE_TIMEOUT = 60 * 60 * 24 * 30
@@ -0,0 +1,9 @@
+# product search, fields of every translation are indexed
+SEARCH_FIELDS = ("title", "description", "material")
+SEARCH_MIN_TERM_LENGTH = 2
+# lower bounds of the price facet buckets, per currency
+SEARCH_PRICE_BUCKETS = {
+    "RUB": (0, 500, 1000, 2500, 5000, 10000),
+    "EUR": (0, 10, 25, 50, 100, 250),
+    "USD": (0, 10, 25, 50, 100, 250),
+}
@@ -1,3 +1,13 @@
 from decouple import config
 
 SHORT_URL = config("SHORT_URL", "")
+# redirect clicks are buffered in redis and flushed by celery beat
+SHORTER_CLICKS_FLUSH_INTERVAL = 60  # seconds
+SHORTER_CLICKS_BATCH_SIZE = 500
+# url_short -> (url, is_expired), in the two tier cache
+SHORTER_CACHE_TIMEOUT = 60 * 60 * 24
+SHORTER_NEGATIVE_CACHE_TIMEOUT = 60
+# base62 codes, 62 ** 7 of them, leased by a process in blocks
+SHORTER_CODE_LENGTH = 7
+SHORTER_CODE_BLOCK_SIZE = 1000
+SHORTER_BULK_CREATE_LIMIT = 1000
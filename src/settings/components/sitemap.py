@@ -0,0 +1,9 @@
+# sitemap.xml is rendered to the cache by src.apps.api.tasks.render_sitemap
+# urls per page, the protocol allows 50000
+SITEMAP_PAGE_SIZE = 10000
+# rows read from the DB at once
+SITEMAP_CHUNK_SIZE = 2000
+# seconds a render waits for further changes
+SITEMAP_RENDER_DELAY = 60
+# a save or delete of these renders the sitemap again
+SITEMAP_MODELS = ("blog.Article", "shop.Category", "shop.Product")
@@ -1,4 +1,6 @@
 WATERMARK_FONT = "FreeSans.ttf"
+WATERMARK_FONT_SIZE = 40
 IMAGE_SIZE = (500, 500)
 WATERMARK_TEXT = "\u00A9 Little Knits Story"
 WATERMARK_POSITION = (5, 5)  # x, y
+WATERMARK_DIR = "watermarks"  # in MEDIA_ROOT, originals are kept as is
@@ -9,15 +9,29 @@ DATABASES = {
     "default": {
         "ENGINE": "django.db.backends.sqlite3",
         "NAME": os.path.join(BASE_DIR, "db.sqlite3"),
-        "TEST": {}
+        "TEST": {},
     }
 }
 
 CACHES = {
     "default": {
-        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
-        "LOCATION": "/var/tmp/django_cache",
-    }
+        "BACKEND": "src.core.utils.two_tier_cache.TwoTierCache",
+        "OPTIONS": {
+            "REMOTE": "shared",
+            "BUS": "src.core.utils.two_tier_cache.LocalBus",
+            "LOCAL_KEY_PREFIXES": (
+                "menu:",
+                "response:tag:",
+                "shop:exchange:",
+                "shorter:",
+                "graphql:",
+            ),
+        },
+    },
+    "shared": {
+        "BACKEND": "django.core.cache.backends.locmem.LocMemCache",
+        "LOCATION": "lks_test",
+    },
 }
 
 REDIS_CONNECT = ""
@@ -32,3 +46,5 @@ if "create-db" not in sys.argv:
     # Database
     # https://docs.djangoproject.com/en/{{ docs_version }}/ref/settings/#databases
     DATABASES["default"]["TEST"]["NAME"] = f"{BASE_DIR}/test.db.sqlite3"
+
+CELERY_TASK_ALWAYS_EAGER = True
@@ -1,6 +1,7 @@
 import json
 
 import pytest
+from django.core.cache import cache
 from django.core.management import call_command
 
 
@@ -15,6 +16,12 @@ def django_db_setup(django_db_setup, django_db_blocker):
         call_command("loaddata", "src/fixtures/exchange.json")
 
 
+@pytest.fixture(autouse=True)
+def clear_cache():
+    """Responses and other cached entries must not leak between the tests"""
+    cache.clear()
+
+
 @pytest.fixture
 def headers(client, django_user_model):
     django_user_model.objects.create_user(
@@ -1,4 +1,12 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
 import pytest
+from django.core.cache import cache
+from django.test import Client
+
+from src.core.utils.response_cache import get_response_key
 
 
 @pytest.mark.django_db
@@ -15,6 +23,39 @@ def test_get_menu_url(client):
     assert client.get("/menu/1/").status_code == 200
 
 
+@pytest.mark.django_db
+@pytest.mark.urls("apps.menu.urls")
+def test_get_menu_tree(
+    client, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    from src.apps.menu.models import MenuItems
+
+    response = client.get("/menu/tree/header/", HTTP_ACCEPT_LANGUAGE="en")
+    assert response.status_code == 200
+    items = response.json()["items"]
+    assert [item["ordering"] for item in items] == sorted(
+        item["ordering"] for item in items
+    )
+    shop = next(item for item in items if item["id"] == 2)
+    assert shop["name"] == "Shop"
+    # the only child of the shop item is not active
+    assert shop["children"] == []
+
+    with django_assert_num_queries(0):
+        assert client.get("/menu/tree/header/", HTTP_ACCEPT_LANGUAGE="en").json() == (
+            response.json()
+        )
+
+    MenuItems.objects.filter(pk=5).update(is_active=True)
+    with django_capture_on_commit_callbacks(execute=True):
+        MenuItems.objects.get(pk=5).save()
+    response = client.get("/menu/tree/header/", HTTP_ACCEPT_LANGUAGE="en")
+    shop = next(item for item in response.json()["items"] if item["id"] == 2)
+    assert [child["id"] for child in shop["children"]] == [5]
+
+    assert client.get("/menu/tree/unknown/").status_code == 404
+
+
 @pytest.mark.django_db
 @pytest.mark.urls("apps.blog.urls")
 def test_get_blog_url(client):
@@ -39,3 +80,203 @@ def test_get_reviews_url(client):
 @pytest.mark.urls("apps.slider.urls")
 def test_get_slider_url(client):
     assert client.get("/sliders/").status_code == 200
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.shop.urls")
+def test_response_cache_tags(
+    client,
+    django_user_model,
+    django_assert_num_queries,
+    django_capture_on_commit_callbacks,
+):
+    from rest_framework_simplejwt.tokens import RefreshToken
+
+    from src.apps.shop.models import Category, Product
+
+    def get(path, **extra):
+        response = client.get(path, **extra)
+        assert response.status_code == 200
+        return response.json()
+
+    ru = get("/products/pattents/")
+    with django_assert_num_queries(0):
+        assert get("/products/pattents/") == ru
+    assert get("/products/pattents/", HTTP_ACCEPT_LANGUAGE="en") != ru
+    get("/products/pattents_2/")
+    get("/products/")
+
+    with django_capture_on_commit_callbacks(execute=True):
+        category = Category.objects.get(pk=3)
+        category.title = "Schemas"
+        category.save()
+    # only the responses which rendered the category are gone
+    with django_assert_num_queries(0):
+        get("/products/pattents_2/")
+    assert get("/products/pattents/")["categories"][0]["title"] == "Schemas"
+    assert "Schemas" in str(get("/products/"))
+
+    # the lists carry the tags of the products they show, a product
+    # which is not shown changes them only when it may move into them
+    page = get("/products/?page_size=2")
+    hidden = Product.objects.exclude(
+        pk__in=[product["id"] for product in page["results"]]
+    ).first()
+    with django_capture_on_commit_callbacks(execute=True):
+        hidden.count += 1
+        hidden.save()
+    with django_assert_num_queries(0):
+        get("/products/?page_size=2")
+    with django_capture_on_commit_callbacks(execute=True):
+        hidden.title = "Moved"
+        hidden.save()
+    with django_assert_num_queries(3):
+        get("/products/?page_size=2")
+
+    # never cached for a signed in user
+    user = django_user_model.objects.create_user(username="cache", password="x")
+    token = RefreshToken.for_user(user).access_token
+    with django_assert_num_queries(5):
+        get("/products/pattents_2/", HTTP_AUTHORIZATION=f"Bearer {token}")
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.shop.urls")
+def test_response_cache_tag_versions_expire(client, settings):
+    from src.core.utils.response_cache import TAG_CACHE_KEY, invalidate_tags
+
+    with mock.patch.object(cache, "add", wraps=cache.add) as add, mock.patch.object(
+        cache, "set_many", wraps=cache.set_many
+    ) as set_many:
+        client.get("/products/")
+        invalidate_tags(["shop.product"])
+    tag_key = TAG_CACHE_KEY.format(tag="")
+    timeouts = [c.args[2] for c in add.call_args_list if c.args[0].startswith(tag_key)]
+    timeouts += [c.args[1] for c in set_many.call_args_list]
+    assert timeouts and set(timeouts) == {settings.RESPONSE_CACHE_TAG_TIMEOUT}
+    assert settings.RESPONSE_CACHE_TAG_TIMEOUT >= settings.RESPONSE_CACHE_TIMEOUT
+
+
+@pytest.mark.urls("apps.shop.urls")
+def test_response_cache_miss_rendered_once():
+    from rest_framework.response import Response
+
+    from src.apps.shop.viewsets import ProductViewSet
+
+    renders = []
+
+    def slow_list(self, request, *args, **kwargs):
+        renders.append(request)
+        time.sleep(0.2)
+        return Response({"rendered": len(renders)})
+
+    def get(path):
+        return Client().get(path).content
+
+    with mock.patch.object(ProductViewSet, "list", slow_list), mock.patch.object(
+        ProductViewSet, "set_validators"
+    ), ThreadPoolExecutor(max_workers=4) as executor:
+        contents = list(executor.map(get, ["/products/"] * 4))
+    assert len(renders) == 1
+    assert len(set(contents)) == 1
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.shop.urls")
+def test_conditional_get(
+    client, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    from src.apps.shop.models import Product, ProductColor
+
+    response = client.get("/products/pattents/")
+    etag = response["ETag"]
+    assert client.get("/products/pattents/", HTTP_ACCEPT_LANGUAGE="en")["ETag"] != etag
+
+    # from the response cache without any query
+    with django_assert_num_queries(0):
+        response = client.get("/products/pattents/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert response["ETag"] == etag
+    # rendered again at the same tag versions, the same validator
+    cache.delete(get_response_key("/products/pattents/", "ru"))
+    response = client.get("/products/pattents/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 304
+    assert not response.content
+    assert client.get("/products/pattents/", HTTP_IF_NONE_MATCH=etag).status_code == 304
+
+    # a list is validated by its ETag only, it can lose a row without getting newer
+    response = client.get("/products/")
+    assert "Last-Modified" not in response
+    list_etag = response["ETag"]
+    product = Product.objects.get(slug="pattents")
+    with django_capture_on_commit_callbacks(execute=True):
+        product.is_active = False
+        product.save()
+    assert client.get("/products/", HTTP_IF_NONE_MATCH=list_etag).status_code == 200
+
+    # relations and photos do not touch updated_at, their tags go with the product
+    product = Product.objects.filter(is_active=True).first()
+    etag = client.get(f"/products/{product.slug}/")["ETag"]
+    with django_capture_on_commit_callbacks(execute=True):
+        product.colors.add(ProductColor.objects.exclude(product_colors=product)[0])
+    response = client.get(f"/products/{product.slug}/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    etag = response["ETag"]
+    with django_capture_on_commit_callbacks(execute=True):
+        product.photo_product.create(image_alt="photo")
+    response = client.get(f"/products/{product.slug}/", HTTP_IF_NONE_MATCH=etag)
+    assert response.status_code == 200
+    assert response.json()["photo_product"][0]["image_alt"] == "photo"
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.blog.urls")
+def test_sparse_fieldsets(client):
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from src.apps.blog.models import Article
+
+    article = Article.objects.get(slug="prosto-zapis-v-blog")
+    article.save()
+    assert article.excerpt_en.startswith("Lorem ipsum dolor sit amet")
+    assert "<" not in article.excerpt_ru
+    assert len(article.excerpt_ru) <= 300
+
+    with CaptureQueriesContext(connection) as queries:
+        results = client.get("/posts/?omit=content&page_size=100").json()["results"]
+    assert all("content" not in result for result in results)
+    saved = next(r for r in results if r["slug"] == "prosto-zapis-v-blog")
+    assert saved["excerpt"] == article.excerpt_ru
+    assert not any("content_" in query["sql"] for query in queries)
+
+    with CaptureQueriesContext(connection) as queries:
+        response = client.get("/posts/prosto-zapis-v-blog/?fields=title,slug,excerpt")
+    assert set(response.json()) == {"title", "slug", "excerpt"}
+    assert not any("content_" in query["sql"] for query in queries)
+    assert "content" in client.get("/posts/prosto-zapis-v-blog/").json()
+
+
+@pytest.mark.django_db
+def test_fill_excerpts():
+    from src.apps.blog.models import Article
+    from src.core.utils.text import fill_excerpts
+
+    Article.objects.update(excerpt="", excerpt_ru="", excerpt_en="")
+    fill_excerpts(Article, "content")
+    article = Article.objects.get(slug="prosto-zapis-v-blog")
+    assert article.excerpt_en.startswith("Lorem ipsum dolor sit amet")
+    assert article.excerpt == article.excerpt_ru != ""
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.shop.urls")
+def test_sparse_fieldsets_products(client, django_assert_num_queries):
+    # the relations left out are not prefetched
+    with django_assert_num_queries(1):
+        response = client.get("/products/?fields=title,slug,price")
+    assert set(response.json()["results"][0]) == {"title", "slug", "price"}
+    with django_assert_num_queries(3):
+        response = client.get("/products/pattents/?omit=description,photo_product")
+    assert "description" not in response.json()
+    assert "categories" in response.json()
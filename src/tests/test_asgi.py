@@ -0,0 +1,99 @@
+import asyncio
+from unittest import mock
+
+import pytest
+from asgiref.sync import async_to_sync
+from asgiref.testing import ApplicationCommunicator
+from django.core.signals import request_started
+from django.db import close_old_connections
+from django.http import HttpResponse
+from django.urls import resolve
+
+from src.apps.shop.viewsets import ProductViewSet
+from src.apps.shorter.counters import get_click_counter
+from src.apps.shorter.models import UrlShorter
+
+
+@async_to_sync
+async def asgi_get(path: str, headers=()) -> tuple:
+    from src.core.asgi import application
+
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "path": path,
+        "query_string": b"",
+        "headers": [(b"host", b"testserver"), *headers],
+    }
+    communicator = ApplicationCommunicator(application, scope)
+    await communicator.send_input({"type": "http.request", "body": b""})
+    start = await communicator.receive_output(5)
+    body = await communicator.receive_output(5)
+    await communicator.wait(5)
+    return start["status"], dict(start["headers"]), body["body"]
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("src.core.asgi_urls")
+def test_catalogue_cache_served_in_event_loop(client, django_assert_num_queries):
+    for path in ("/api/v1/products/", "/api/v1/posts/", "/api/v1/sliders/"):
+        assert asyncio.iscoroutinefunction(resolve(path).func)
+    # products/<slug>/ must not take the actions of the router
+    assert "currency" in client.get("/api/v1/products/facets/").json()
+
+    response = client.get("/api/v1/products/")
+    assert response.status_code == 200
+    with mock.patch.object(
+        ProductViewSet, "dispatch", side_effect=AssertionError
+    ), django_assert_num_queries(0):
+        cached = client.get("/api/v1/products/")
+        assert cached.content == response.content
+        not_modified = client.get(
+            "/api/v1/products/", HTTP_IF_NONE_MATCH=response["ETag"]
+        )
+        assert not_modified.status_code == 304
+
+    # the viewset answers everything the cache does not
+    with mock.patch.object(
+        ProductViewSet, "dispatch", autospec=True, return_value=HttpResponse("sync")
+    ):
+        response = client.get("/api/v1/products/", HTTP_AUTHORIZATION="Bearer token")
+        assert response.content == b"sync"
+        # the timeout of the viewset, its responses are not cached
+        with mock.patch.object(ProductViewSet, "response_cache_timeout", 0):
+            assert client.get("/api/v1/products/").content == b"sync"
+
+
+@pytest.mark.django_db
+def test_asgi_application_serves_async_routes(client):
+    response = client.get("/api/v1/products/")
+    # as the test clients do, the test transaction must stay open
+    request_started.disconnect(close_old_connections)
+    try:
+        with mock.patch.object(ProductViewSet, "dispatch", side_effect=AssertionError):
+            status, headers, body = asgi_get("/api/v1/products/")
+    finally:
+        request_started.connect(close_old_connections)
+    assert status == 200
+    assert body == response.content
+    assert headers[b"ETag"] == response["ETag"].encode()
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("src.core.asgi_urls")
+def test_async_short_link_redirect(client, django_assert_num_queries):
+    link = UrlShorter.objects.create(url="https://littleknitsstory.com/async")
+    get_click_counter().pop_all()
+    assert client.get(f"/api/v1/l/{link.url_short}/").url == link.url
+    with django_assert_num_queries(0):
+        response = client.get(f"/api/v1/l/{link.url_short}/")
+    assert response.status_code == 302
+    assert get_click_counter().pop_all() == {link.url_short: 2}
+
+    assert client.get("/api/v1/l/zzzzzz/").status_code == 404
+    assert client.post(f"/api/v1/l/{link.url_short}/").status_code == 405
+    link.is_expired = True
+    link.save()
+    assert client.get(f"/api/v1/l/{link.url_short}/").status_code == 404
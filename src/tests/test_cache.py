@@ -0,0 +1,130 @@
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import cache
+
+from src.core.utils.cache import (
+    CacheEntry,
+    LOCK_CACHE_KEY,
+    cache_lock,
+    get_or_compute,
+    is_expired,
+)
+
+
+def test_get_or_compute_single_flight():
+    calls = []
+
+    def compute():
+        calls.append(1)
+        time.sleep(0.2)
+        return "value"
+
+    results = []
+    threads = [
+        threading.Thread(
+            target=lambda: results.append(get_or_compute("single", compute, 60))
+        )
+        for _ in range(5)
+    ]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    assert results == ["value"] * 5
+    assert len(calls) == 1
+
+
+def test_get_or_compute_stale_while_revalidate():
+    cache.set("stale", tuple(CacheEntry("old", 0.1, time.time() - 1)), 60)
+    # another process renews it, the stale value is served meanwhile
+    with cache_lock("stale", wait=0) as acquired:
+        assert acquired
+        assert get_or_compute("stale", lambda: "new", 60) == "old"
+    assert cache.get(LOCK_CACHE_KEY.format(key="stale")) is None
+    assert get_or_compute("stale", lambda: "new", 60) == "new"
+    assert get_or_compute("stale", lambda: "newer", 60) == "new"
+
+
+def test_get_or_compute_timeout_of_value():
+    get_or_compute("missing", lambda: (), lambda value: 60 if value else 5)
+    assert CacheEntry(*cache.get("missing")).expires_at < time.time() + 6
+
+
+def test_is_expired_early():
+    now = time.time()
+    assert not is_expired(CacheEntry(None, 0, now + 1), 1.0, now)
+    assert is_expired(CacheEntry(None, 0, now), 1.0, now)
+    # a minute to compute, it is renewed well before it expires
+    slow = CacheEntry(None, 60, now + 1)
+    assert sum(is_expired(slow, 1.0, now) for _ in range(100)) > 90
+
+
+def test_two_tier_cache_invalidation():
+    from src.core.utils.two_tier_cache import LocalBus, TwoTierCache
+
+    params = {
+        "OPTIONS": {
+            "REMOTE": "shared",
+            "BUS": "src.core.utils.two_tier_cache.LocalBus",
+            "CHANNEL": "test:invalidate",
+            "LOCAL_KEY_PREFIXES": ("menu:",),
+        }
+    }
+    # two processes sharing the remote cache
+    first, second = TwoTierCache("first", params), TwoTierCache("second", params)
+    first.set("menu:main", ["home"])
+    assert second.get("menu:main") == ["home"]
+    assert second.get("menu:main") == ["home"]
+    assert second.stats()["local"] == {"hits": 1, "misses": 1}
+    assert second.stats()["remote"] == {"hits": 1, "misses": 0}
+
+    # a new value is seen by the other processes once their copy expires,
+    # an invalidation evicts the key in all of them at once
+    first.set("menu:main", ["shop"])
+    assert first.get("menu:main") == ["shop"]
+    assert second.get("menu:main") == ["home"]
+    first.delete("menu:main")
+    assert second.get("menu:main") is None
+    with mock.patch.object(LocalBus, "publish") as publish:
+        first.set("menu:main", ["blog"])
+        first.add("menu:other", 1)
+    assert not publish.called
+
+    # keys without a local prefix always go to the remote cache
+    first.set("lock:menu", 1)
+    assert second.get("lock:menu") == 1
+    assert second.stats()["local_size"] == 0
+
+    second.set_many({"menu:a": 1, "menu:b": 2})
+    assert first.get_many(["menu:a", "menu:b", "menu:c"]) == {"menu:a": 1, "menu:b": 2}
+    first.clear()
+    assert second.get_many(["menu:a", "menu:b"]) == {}
+
+
+def test_two_tier_cache_async_reads():
+    from asgiref.sync import async_to_sync
+
+    from src.core.utils.two_tier_cache import TwoTierCache
+
+    params = {
+        "OPTIONS": {
+            "REMOTE": "shared",
+            "BUS": "src.core.utils.two_tier_cache.LocalBus",
+            "CHANNEL": "test:async",
+            "LOCAL_KEY_PREFIXES": ("menu:",),
+        }
+    }
+    first, second = TwoTierCache("sync", params), TwoTierCache("async", params)
+    first.set_many({"menu:a": 1, "lock:a": 2})
+    assert async_to_sync(second.aget)("menu:a") == 1
+    assert async_to_sync(second.aget)("menu:a") == 1
+    assert async_to_sync(second.aget)("menu:b", "default") == "default"
+    assert second.stats()["local"] == {"hits": 1, "misses": 2}
+    assert async_to_sync(second.aget_many)(["menu:a", "lock:a", "menu:b"]) == {
+        "menu:a": 1,
+        "lock:a": 2,
+    }
+    first.delete("menu:a")
+    assert async_to_sync(second.aget)("menu:a") is None
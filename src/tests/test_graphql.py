@@ -0,0 +1,265 @@
+import json
+from unittest import mock
+
+import pytest
+
+from src.core.graphql.documents import get_query_hash
+
+
+def graphql(client, query: str) -> dict:
+    response = client.post(
+        "/api/v2/", {"query": query}, content_type="application/json"
+    )
+    assert response.status_code == 200, response.content
+    result = response.json()
+    assert "errors" not in result, result
+    return result["data"]
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("src.core.urls")
+def test_articles_relations_batched(client, django_assert_num_queries):
+    from src.apps.blog.models import Article
+
+    query = "{ allArticles { slug author { id } tags { slug } } }"
+    # articles, their authors, their tags
+    with django_assert_num_queries(3):
+        articles = graphql(client, query)["allArticles"]
+    assert len(articles) == Article.objects.count()
+    article = Article.objects.get(slug=articles[0]["slug"])
+    assert articles[0]["author"]["id"] == str(article.author_id)
+    assert sorted(tag["slug"] for tag in articles[0]["tags"]) == sorted(
+        article.tags.values_list("slug", flat=True)
+    )
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("src.core.urls")
+def test_category_page_one_round_trip(client, django_assert_num_queries):
+    query = """{
+      category(slug: "Toys") {
+        title
+        products(first: 2) {
+          edges {
+            node { slug colors { color } photos { imageAlt } categories { slug } }
+          }
+          pageInfo { hasNextPage endCursor }
+        }
+      }
+    }"""
+    # category, products, then colors, photos and categories of all of them
+    with django_assert_num_queries(5):
+        category = graphql(client, query)["category"]
+    products = category["products"]
+    assert len(products["edges"]) == 2
+    assert products["pageInfo"]["hasNextPage"]
+    for edge in products["edges"]:
+        assert "Toys" in [c["slug"] for c in edge["node"]["categories"]]
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("src.core.urls")
+def test_products_keyset_paging_and_filters(client):
+    from src.apps.shop.models import Product
+    from src.apps.shop.tasks import reindex_products
+
+    query = """query($after: String, $category: [Int!]) {
+      allProducts(first: 3, after: $after, category: $category) {
+        edges { cursor node { slug } }
+        pageInfo { hasNextPage hasPreviousPage endCursor }
+      }
+    }"""
+
+    def page(**variables):
+        response = client.post(
+            "/api/v2/",
+            {"query": query, "variables": variables},
+            content_type="application/json",
+        )
+        return response.json()["data"]["allProducts"]
+
+    slugs, after = [], None
+    while True:
+        products = page(after=after)
+        slugs += [edge["node"]["slug"] for edge in products["edges"]]
+        assert products["pageInfo"]["hasPreviousPage"] == (after is not None)
+        if not products["pageInfo"]["hasNextPage"]:
+            break
+        after = products["pageInfo"]["endCursor"]
+    assert slugs == list(
+        Product.objects.filter(is_active=True)
+        .order_by("-created_at", "-id")
+        .values_list("slug", flat=True)
+    )
+
+    reindex_products()
+    products = page(category=[3])
+    assert {edge["node"]["slug"] for edge in products["edges"]} == set(
+        Product.objects.filter(categories=3).values_list("slug", flat=True)
+    )
+
+    response = client.post(
+        "/api/v2/",
+        {"query": query, "variables": {"after": "broken"}},
+        content_type="application/json",
+    )
+    assert response.json()["errors"][0]["message"] == "Invalid cursor"
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("src.core.urls")
+def test_orders_for_staff_only(client, django_user_model):
+    from src.apps.shop.models import OrderCart
+
+    order = OrderCart.objects.create(email="buyer@example.com")
+    query = "{ allOrders { edges { node { orderNumber email } } } }"
+    assert graphql(client, query)["allOrders"]["edges"] == []
+    # the customer gets what the REST API shows, no contact details
+    number_query = (
+        '{ order(orderNumber: "%s") { orderNumber status products { amount } } }'
+    )
+    assert graphql(client, number_query % order.order_number)["order"] == {
+        "orderNumber": order.order_number,
+        "status": order.status,
+        "products": [],
+    }
+    email_query = '{ order(orderNumber: "%s") { email } }' % order.order_number
+    response = client.post(
+        "/api/v2/", {"query": email_query}, content_type="application/json"
+    )
+    assert "email" in response.json()["errors"][0]["message"]
+
+    client.force_login(django_user_model.objects.create_user("staff", is_staff=True))
+    assert graphql(client, query)["allOrders"]["edges"] == [
+        {"node": {"orderNumber": order.order_number, "email": "buyer@example.com"}}
+    ]
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("src.core.urls")
+def test_query_cost_limits(client, caplog, django_assert_num_queries):
+    nested = """{
+      allCategories(first: 100) {
+        edges { node { products(first: 100) { edges { node { slug } } } } }
+      }
+    }"""
+    with django_assert_num_queries(0):
+        response = client.post(
+            "/api/v2/", {"query": nested}, content_type="application/json"
+        )
+    assert response.status_code == 400
+    error = response.json()["errors"][0]
+    assert error["extensions"]["code"] == "QUERY_TOO_COSTLY"
+    assert error["extensions"]["cost"] > error["extensions"]["maxCost"]
+
+    deep = """{
+      allProducts { edges { node { categories { products { edges { node {
+        categories { products { edges { node { slug } } } }
+      } } } } } } }
+    }"""
+    response = client.post("/api/v2/", {"query": deep}, content_type="application/json")
+    codes = [error["extensions"]["code"] for error in response.json()["errors"]]
+    assert "QUERY_TOO_DEEP" in codes
+
+    with caplog.at_level("INFO", logger="src.core.graphql.views"):
+        graphql(client, "{ allProducts(first: 2) { edges { node { slug } } } }")
+    record = caplog.records[-1]
+    # allProducts, edges, then node of each product
+    assert record.estimated_cost == 1 + 1 + 2
+    assert record.actual_cost == 1 + 1 + 2
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("src.core.urls")
+def test_introspection_limits(client):
+    from graphql import get_introspection_query
+
+    # what GraphiQL asks for
+    assert graphql(client, get_introspection_query())["__schema"]["types"]
+
+    def codes(query):
+        response = client.post(
+            "/api/v2/", {"query": query}, content_type="application/json"
+        )
+        return [error["extensions"]["code"] for error in response.json()["errors"]]
+
+    nested = "{ __schema { types { fields { type { fields { name } } } } } }"
+    assert codes(nested) == ["INTROSPECTION_TOO_DEEP"]
+    aliases = " ".join(f"s{i}: __schema {{ types {{ name }} }}" for i in range(11))
+    assert codes("{ %s }" % aliases) == ["QUERY_TOO_COSTLY"]
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("src.core.urls")
+def test_persisted_queries(client, settings, django_capture_on_commit_callbacks):
+    from src.apps.api.models import PersistedQuery
+
+    persisted = PersistedQuery.objects.create(
+        name="Categories", query="{ allCategories(first: 1) { edges { node { id } } } }"
+    )
+    extensions = {"persistedQuery": {"version": 1, "sha256Hash": persisted.sha256}}
+    response = client.post(
+        "/api/v2/", {"extensions": extensions}, content_type="application/json"
+    )
+    assert len(response.json()["data"]["allCategories"]["edges"]) == 1
+    response = client.get("/api/v2/", {"extensions": json.dumps(extensions)})
+    assert response.status_code == 200
+    assert "data" in response.json()
+
+    articles = "{ allArticles { slug } }"
+    unknown = {"persistedQuery": {"version": 1, "sha256Hash": get_query_hash(articles)}}
+    response = client.post(
+        "/api/v2/", {"extensions": unknown}, content_type="application/json"
+    )
+    error = response.json()["errors"][0]
+    assert error["message"] == "PersistedQueryNotFound"
+    # a query registered after the miss is found at once
+    with django_capture_on_commit_callbacks(execute=True):
+        PersistedQuery.objects.create(query=articles)
+    response = client.post(
+        "/api/v2/", {"extensions": unknown}, content_type="application/json"
+    )
+    assert "allArticles" in response.json()["data"]
+
+    settings.GRAPHQL_PERSISTED_QUERIES_ONLY = True
+    response = client.post(
+        "/api/v2/", {"query": "{ allArticles { id } }"}, content_type="application/json"
+    )
+    codes = [error["extensions"]["code"] for error in response.json()["errors"]]
+    assert codes == ["PERSISTED_QUERY_REQUIRED"]
+    response = client.post(
+        "/api/v2/",
+        {"query": persisted.query, "extensions": extensions},
+        content_type="application/json",
+    )
+    assert "data" in response.json()
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("src.core.urls")
+def test_documents_parsed_and_validated_once(client, settings):
+    from src.core.graphql import documents
+
+    query = "{ allProducts(first: 1) { edges { cursor } } }"
+    invalid = "{ allProducts { unknown } }"
+    with mock.patch.object(
+        documents, "parse", wraps=documents.parse
+    ) as parse, mock.patch.object(
+        documents, "validate", wraps=documents.validate
+    ) as validate:
+        for _ in range(3):
+            graphql(client, query)
+        for _ in range(2):
+            response = client.post(
+                "/api/v2/", {"query": invalid}, content_type="application/json"
+            )
+            assert response.status_code == 400
+    assert parse.call_count == validate.call_count == 2
+
+    settings.GRAPHQL_DOCUMENT_CACHE_SIZE = 1
+    with mock.patch.object(documents, "parse", wraps=documents.parse) as parse:
+        for text in (query, "{ allCategories { edges { cursor } } }", query):
+            graphql(client, text)
+    assert parse.call_count == 3
+    # mutations are answered by graphene-django
+    assert client.get("/api/v2/", {"query": "mutation { x }"}).status_code == 405
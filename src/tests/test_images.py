@@ -0,0 +1,108 @@
+from io import BytesIO
+
+import pytest
+from django.core.files.uploadedfile import SimpleUploadedFile
+from PIL import Image
+
+from src.apps.slider.models import Slider
+from src.core.utils.watermark import watermark_image
+
+
+def make_image(name="slide.png", color=(255, 0, 0)):
+    buffer = BytesIO()
+    Image.new("RGB", (800, 600), color).save(buffer, format="PNG")
+    return SimpleUploadedFile(name, buffer.getvalue(), content_type="image/png")
+
+
+def watermark_tasks(callbacks):
+    return [c for c in callbacks if getattr(c, "func", None) == watermark_image.delay]
+
+
+@pytest.fixture
+def media_root(settings, tmp_path):
+    settings.MEDIA_ROOT = tmp_path
+    return tmp_path
+
+
+@pytest.mark.django_db
+def test_watermark_made_by_task_once(media_root, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        slider = Slider.objects.create(
+            title="s", ordering=1, image_preview=make_image()
+        )
+    assert len(watermark_tasks(callbacks)) == 1
+    original = slider.image_preview.read()
+
+    slider = Slider.objects.get(pk=slider.pk)
+    assert slider.image_hash
+    assert slider.image_watermark.name.startswith("watermarks/")
+    assert slider.get_image() == slider.image_watermark.url
+    with Image.open(slider.image_watermark.path) as watermark:
+        assert max(watermark.size) == 500
+    with slider.image_preview.open("rb") as image_file:
+        assert image_file.read() == original
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        slider.title = "new title"
+        slider.save()
+    assert not watermark_tasks(callbacks)
+
+    with django_capture_on_commit_callbacks(execute=True) as callbacks:
+        slider.image_preview = make_image(color=(0, 255, 0))
+        slider.save()
+    assert len(watermark_tasks(callbacks)) == 1
+    assert Slider.objects.get(pk=slider.pk).image_hash != slider.image_hash
+
+
+@pytest.mark.django_db
+def test_watermark_skips_missing_file(media_root, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks():
+        slider = Slider.objects.create(
+            title="s", ordering=1, image_preview=make_image()
+        )
+    slider.image_preview.storage.delete(slider.image_preview.name)
+    assert watermark_image("slider", "slider", slider.pk) is None
+    assert not Slider.objects.get(pk=slider.pk).image_watermark
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("src.core.urls")
+def test_watermark_invalidates_cached_responses(
+    client, media_root, django_capture_on_commit_callbacks
+):
+    with django_capture_on_commit_callbacks():
+        slider = Slider.objects.create(
+            title="s", ordering=1, image_preview=make_image()
+        )
+    response = client.get("/api/v1/sliders/")
+    assert slider.image_preview.url in response.content.decode()
+
+    name = watermark_image("slider", "slider", slider.pk)
+    response = client.get("/api/v1/sliders/")
+    assert slider.image_watermark.storage.url(name) in response.content.decode()
+
+
+@pytest.mark.django_db
+def test_srcset_variants_made_once(media_root, django_capture_on_commit_callbacks):
+    with django_capture_on_commit_callbacks(execute=True):
+        slider = Slider.objects.create(
+            title="s", ordering=1, image_preview=make_image()
+        )
+    slider.refresh_from_db()
+
+    srcset = slider.get_srcset()
+    assert set(srcset) == {"webp"} | ({"avif"} if "AVIF" in Image.SAVE else set())
+    urls = [item.split()[0] for item in srcset["webp"].split(", ")]
+    assert [item.split()[1] for item in srcset["webp"].split(", ")] == [
+        "160w",
+        "320w",
+        "480w",
+    ]
+    with Image.open(media_root / urls[0].split("/media/")[1]) as variant:
+        assert variant.format == "WEBP"
+        assert variant.width == 160
+
+    # the manifest is cached by the content hash, the file is not opened again
+    slider.image_watermark.open = None
+    assert slider.get_srcset() == srcset
+    assert Slider(image_preview=slider.image_preview).get_srcset() == {}
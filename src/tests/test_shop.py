@@ -1,9 +1,22 @@
 import json
+from importlib import import_module
+from unittest import mock
+from concurrent.futures import ThreadPoolExecutor
 
 import pytest
+from django.apps import apps
+from django.core.cache import cache
+from django.db import connection
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from djmoney.contrib.exchange.models import ExchangeBackend
 from moneyed import Money, Currency
 
-from src.apps.shop.models import Product
+from src.apps.shop.checks import check_converted_price_fields
+from src.apps.shop.exchange import get_rates_snapshot, invalidate_rates
+from src.apps.shop.models import OrderCart, Product
+from src.apps.shop.stock import InsufficientStock, reserve_stock
+from src.apps.shop.tasks import refresh_product_prices
 
 pytestmark = pytest.mark.django_db
 
@@ -92,3 +105,348 @@ def test_get_product_and_lang_product_url(client, settings):
     res_2 = client.get("/products/test_slug/")
     assert res_2.status_code == 200
     assert res_2.json().get("title") == "test_title_en"
+
+
+@pytest.mark.django_db
+def test_product_get_money_without_queries(django_assert_num_queries):
+    product = Product(price=Money(10, "RUB"), sale=Money(5, "RUB"))
+    product.get_money(value=product.price, currency="EUR")
+    with django_assert_num_queries(0):
+        for _ in range(100):
+            product.get_price()
+            product.get_sale()
+
+
+@pytest.mark.django_db
+def test_update_rates_invalidate_snapshot(django_capture_on_commit_callbacks):
+    backend = ExchangeBackend.objects.get(name="fixer.io")
+    product = Product(price=Money(10, "RUB"))
+    assert product.get_money(value=product.price, currency="USD").amount == 10
+    with django_capture_on_commit_callbacks(execute=True):
+        backend.rates.filter(currency="USD").update(value=2)
+        backend.save()
+    assert product.get_money(value=product.price, currency="USD").amount == 20
+    # the test transaction is rolled back, the snapshot is not
+    invalidate_rates()
+
+
+@pytest.mark.django_db
+def test_rates_updated_while_snapshot_loaded(django_capture_on_commit_callbacks):
+    from src.apps.shop import exchange
+
+    backend = ExchangeBackend.objects.get(name="fixer.io")
+    load_snapshot = exchange._load_snapshot
+
+    def load_then_update(name):
+        snapshot = load_snapshot(name)
+        if backend.rates.filter(currency="USD", value=1).exists():
+            # update_rates commits before the old snapshot is cached
+            with django_capture_on_commit_callbacks(execute=True):
+                backend.rates.filter(currency="USD").update(value=2)
+                backend.save()
+        return snapshot
+
+    with mock.patch.object(exchange, "_load_snapshot", side_effect=load_then_update):
+        assert exchange.get_rate("EUR", "USD") == 1
+    assert exchange.get_rate("EUR", "USD") == 2
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.shop.urls")
+def test_refresh_product_prices_and_price_filter(client):
+    with CaptureQueriesContext(connection) as queries:
+        assert refresh_product_prices() == Product.objects.count()
+    # no deferred column is loaded per product
+    assert len(queries) < Product.objects.count()
+    product = Product.objects.get(slug="test_slug")
+    assert product.price_rub == 10
+    assert product.get_converted(field="price", currency="EUR") == Money(10, "EUR")
+
+    products = client.get("/products/?price_min=5&price_max=11").json()["results"]
+    assert [p["slug"] for p in products] == ["test_slug"]
+    products = client.get("/products/?ordering=price").json()["results"]
+    assert [p["slug"] for p in products[:2]] == ["test_slug", "pattents_7"]
+
+
+@pytest.mark.django_db
+def test_migration_fills_converted_prices(settings):
+    fill_converted_prices = import_module(
+        "src.apps.shop.migrations.0002_product_converted_prices"
+    ).fill_converted_prices
+    Product.objects.update(price_rub=None, price_eur=None, price_usd=None)
+    fill_converted_prices(apps, None)
+    product = Product.objects.get(slug="test_slug")
+    assert product.price_rub == 10
+    assert product.price_usd == product.get_money(product.price, "USD").amount
+
+    # without rates only the currency of the price itself
+    Product.objects.update(price_rub=None, price_usd=None)
+    settings.EXCHANGE_BACKEND = (
+        "djmoney.contrib.exchange.backends.OpenExchangeRatesBackend"
+    )
+    fill_converted_prices(apps, None)
+    product = Product.objects.get(slug="test_slug")
+    assert (product.price_rub, product.price_usd) == (10, None)
+
+
+def test_converted_price_columns_check(settings):
+    assert check_converted_price_fields() == []
+    settings.CURRENCIES = ("USD", "EUR", "GBP")
+    errors = check_converted_price_fields()
+    assert [error.id for error in errors] == ["shop.E001"] * 2 + ["shop.E002"] * 2
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.shop.urls")
+def test_post_orders_constant_queries(client):
+    def post_order(products_ids):
+        data = {"products": [{"product": pk, "amount": 1} for pk in products_ids]}
+        with CaptureQueriesContext(connection) as queries:
+            res = client.post(
+                "/orders/", data=json.dumps(data), content_type="application/json"
+            )
+        assert res.status_code == 201
+        return res.json()["order_number"], len(queries)
+
+    Product.objects.update(count=10)
+    # the rates snapshot is loaded once, then read from the cache
+    get_rates_snapshot()
+    _, small_cart_queries = post_order([1])
+    order_number, large_cart_queries = post_order(range(1, 11))
+    assert small_cart_queries == large_cart_queries
+
+    order = OrderCart.objects.get(order_number=order_number)
+    items = order.ordercartitem_ordercart.all()
+    # all rates in the fixture are 1
+    assert order.order_total_cost.amount == sum(
+        item.item_total_cost.amount for item in items
+    )
+    assert order.update_total_cost() == order.order_total_cost
+
+
+@pytest.mark.django_db(transaction=True)
+@pytest.mark.urls("apps.shop.urls")
+def test_post_orders_concurrent_stock_reservation():
+    stock, orders = 3, 12
+    Product.objects.filter(pk=1).update(count=stock)
+    data = json.dumps({"products": [{"product": 1, "amount": 1}]})
+
+    def post_order(_):
+        try:
+            return (
+                Client()
+                .post("/orders/", data=data, content_type="application/json")
+                .status_code
+            )
+        finally:
+            connection.close()
+
+    with ThreadPoolExecutor(max_workers=orders) as executor:
+        statuses = list(executor.map(post_order, range(orders)))
+
+    assert statuses.count(201) == stock
+    assert statuses.count(400) == orders - stock
+    assert Product.objects.get(pk=1).count == 0
+    assert OrderCart.objects.count() == stock
+
+
+@pytest.mark.django_db
+def test_reserve_stock_all_or_nothing():
+    Product.objects.filter(pk__in=[1, 2]).update(count=2)
+    with pytest.raises(InsufficientStock):
+        reserve_stock({1: 1, 2: 3})
+    assert list(
+        Product.objects.filter(pk__in=[1, 2]).values_list("count", flat=True)
+    ) == [2, 2]
+    reserve_stock({1: 1, 2: 2})
+    assert Product.objects.get(pk=1).count == 1
+    assert Product.objects.get(pk=2).count == 0
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.shop.urls")
+def test_products_constant_queries(client, django_assert_num_queries):
+    product = Product.objects.filter(is_active=True).first()
+    product.photo_product.create(image_alt="photo")
+    for page_size in (2, 10):
+        # products, categories, colors
+        with django_assert_num_queries(3):
+            response = client.get("/products/", {"page_size": page_size})
+        assert len(response.json()["results"]) == page_size
+        assert all(item["price"] for item in response.json()["results"])
+
+    # product, categories, colors, photos
+    with django_assert_num_queries(4):
+        response = client.get(f"/products/{product.slug}/")
+    assert response.json()["photo_product"][0]["image_alt"] == "photo"
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.shop.urls")
+def test_category_products_paginated(client, django_assert_num_queries):
+    from src.apps.shop.models import Category
+
+    category = Category.objects.get(pk=1)
+    for product in Product.objects.filter(is_active=True):
+        product.categories.add(category)
+    total = category.product_categories.filter(is_active=True).count()
+    assert total > 3
+
+    seen = []
+    url = f"/categories/{category.slug}/"
+    while url:
+        # category, products, categories, colors
+        with django_assert_num_queries(4):
+            response = client.get(url, {"page_size": 3} if not seen else None)
+        products = response.json()["products"]
+        seen += [product["id"] for product in products["results"]]
+        url = products["next"]
+    assert len(seen) == len(set(seen)) == total
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.shop.urls")
+def test_products_keyset_pagination(client, django_assert_num_queries):
+    products = list(
+        Product.objects.filter(is_active=True)
+        .order_by("-created_at", "-id")
+        .values_list("id", flat=True)
+    )
+    response = client.get("/products/", {"page_size": 3, "count": "true"})
+    assert response.json()["count"] == len(products)
+
+    seen, url = [], response.json()["next"]
+    seen += [product["id"] for product in response.json()["results"]]
+    while url:
+        # the deep pages make no COUNT(*) and no more queries than the first
+        with django_assert_num_queries(3):
+            response = client.get(url)
+        assert "count" not in response.json()
+        seen += [product["id"] for product in response.json()["results"]]
+        url = response.json()["next"]
+    assert seen == products
+
+    # the ordering of ProductPriceFilter is paginated by the cursor as well
+    refresh_product_prices()
+    seen, url = [], "/products/?ordering=price&page_size=2"
+    while url:
+        response = client.get(url)
+        seen += [product["id"] for product in response.json()["results"]]
+        url = response.json()["next"]
+    assert sorted(seen) == sorted(products)
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.shop.urls")
+def test_products_keyset_ties_and_previous(client):
+    # one created_at for all, the id alone tells the rows apart
+    Product.objects.update(created_at=Product.objects.first().created_at)
+    products = list(
+        Product.objects.filter(is_active=True)
+        .order_by("-id")
+        .values_list("id", flat=True)
+    )
+    pages, url = [], "/products/?page_size=3"
+    while url:
+        with CaptureQueriesContext(connection) as queries:
+            response = client.get(url)
+        assert not any("OFFSET" in query["sql"] for query in queries)
+        pages.append([product["id"] for product in response.json()["results"]])
+        url = response.json()["next"]
+    assert sum(pages, []) == products
+    # the index range of the last page is bound by its first column
+    assert any('"shop_product"."created_at" <=' in q["sql"] for q in queries)
+
+    back, url = [], response.json()["previous"]
+    while url:
+        response = client.get(url)
+        back.insert(0, [product["id"] for product in response.json()["results"]])
+        url = response.json()["previous"]
+    assert back == pages[:-1]
+    assert client.get("/products/", {"cursor": "junk"}).status_code == 404
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.shop.urls")
+def test_products_search(client):
+    def search(**params):
+        response = client.get("/products/", {"page_size": 50, **params})
+        return sorted(product["id"] for product in response.json()["results"])
+
+    assert search(q="носков") == [4, 5, 6, 7, 8, 9, 10]
+    assert search(q="Pattent nosk") == [4, 5, 6, 7, 8, 9, 10]
+    assert search(q="пряжа дракон") == [3]
+    assert search(q="wolf", category=1) == [2, 9, 10]
+    assert search(category=[1, 2], color=1) == [1, 2, 3, 9]
+    assert search(q="nothing like it") == []
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.shop.urls")
+def test_products_facets_incremental(client, django_capture_on_commit_callbacks):
+    from src.apps.shop.models import Category, FacetCount
+
+    def facets():
+        return client.get("/products/facets/", HTTP_ACCEPT_LANGUAGE="en").json()
+
+    assert facets()["category"] == {"1": 4, "2": 2, "3": 3}
+    assert facets()["color"] == {"1": 4, "2": 3, "3": 1}
+    assert facets()["digital"] == {"false": 10}
+
+    with django_capture_on_commit_callbacks(execute=True):
+        Product.objects.get(pk=5).categories.add(1)
+        Category.objects.get(pk=2).product_categories.clear()
+        product = Product.objects.get(pk=2)
+        product.is_active = False
+        product.save()
+        Product.objects.get(pk=1).delete()
+    assert facets()["category"] == {"1": 3, "3": 3}
+    assert facets()["digital"] == {"false": 8}
+
+    refresh_product_prices()
+    assert facets()["currency"] == "EUR"
+    assert sum(facets()["price"].values()) == 8
+    assert facets()["price"]["10-25"] == 1
+    # one query for the counts, none at all from the response cache
+    cache.clear()
+    with CaptureQueriesContext(connection) as context:
+        facets()
+    assert len(context.captured_queries) == 1
+    with CaptureQueriesContext(connection) as context:
+        facets()
+    assert len(context.captured_queries) == 0
+    assert not FacetCount.objects.filter(count__lt=0).exists()
+
+    # nothing moves between the buckets, nothing is indexed again
+    with mock.patch("src.apps.shop.tasks.index_product") as index_product:
+        refresh_product_prices()
+    assert not index_product.called
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.shop.urls")
+def test_migration_indexes_existing_products(client):
+    from src.apps.shop.models import FacetCount, ProductFacet, ProductSearchTerm
+
+    index_products = import_module(
+        "src.apps.shop.migrations.0007_index_existing_products"
+    ).index_products
+    refresh_product_prices()
+    indexed = {
+        "terms": set(ProductSearchTerm.objects.values_list("product", "term")),
+        "facets": set(ProductFacet.objects.values_list("product", "facet", "value")),
+        "counts": set(
+            FacetCount.objects.filter(count__gt=0).values_list(
+                "facet", "value", "count"
+            )
+        ),
+    }
+    ProductSearchTerm.objects.all().delete()
+    ProductFacet.objects.all().delete()
+    FacetCount.objects.update(count=0)
+    index_products(apps, None)
+    assert indexed == {
+        "terms": set(ProductSearchTerm.objects.values_list("product", "term")),
+        "facets": set(ProductFacet.objects.values_list("product", "facet", "value")),
+        "counts": set(FacetCount.objects.values_list("facet", "value", "count")),
+    }
@@ -0,0 +1,83 @@
+import pytest
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from src.apps.shorter.codes import encode
+from src.apps.shorter.models import UrlShorter
+from src.apps.shorter.tasks import flush_clicks
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.shorter.urls")
+def test_redirect_buffers_clicks(client):
+    link = UrlShorter.objects.create(url="https://littleknitsstory.com")
+    other = UrlShorter.objects.create(url="https://littleknitsstory.com/shop")
+
+    with CaptureQueriesContext(connection) as queries:
+        for _ in range(3):
+            res = client.get(f"/l/{link.url_short}/")
+            assert res.status_code == 302
+            assert res.url == link.url
+        client.get(f"/l/{other.url_short}/")
+    assert not any(q["sql"].startswith("UPDATE") for q in queries.captured_queries)
+    link.refresh_from_db()
+    assert link.count == 0
+
+    assert flush_clicks() == 2
+    link.refresh_from_db()
+    other.refresh_from_db()
+    assert (link.count, other.count) == (3, 1)
+    assert flush_clicks() == 0
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.shorter.urls")
+def test_redirect_resolves_from_cache(client, django_assert_num_queries):
+    link = UrlShorter.objects.create(url="https://littleknitsstory.com/blog")
+    assert client.get(f"/l/{link.url_short}/").status_code == 302
+    with django_assert_num_queries(0):
+        assert client.get(f"/l/{link.url_short}/").url == link.url
+
+    assert client.get("/l/zzzzzz/").status_code == 404
+    with django_assert_num_queries(0):
+        assert client.get("/l/zzzzzz/").status_code == 404
+    UrlShorter.objects.create(
+        url="https://littleknitsstory.com/new", url_short="zzzzzz"
+    )
+    assert client.get("/l/zzzzzz/").url == "https://littleknitsstory.com/new"
+
+    link.is_expired = True
+    link.save()
+    assert client.get(f"/l/{link.url_short}/").status_code == 404
+
+
+def test_short_codes_never_repeat():
+    codes = {encode(number) for number in range(20000)}
+    assert len(codes) == 20000
+    assert all(len(code) == 7 for code in codes)
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("apps.shorter.urls")
+def test_bulk_create_short_links(
+    client, django_user_model, django_assert_max_num_queries
+):
+    user = django_user_model.objects.create_user(username="shorter", password="pass")
+    token = RefreshToken.for_user(user).access_token
+    data = [{"url": f"https://littleknitsstory.com/{i}"} for i in range(50)]
+    assert (
+        client.post("/l/", data=data, content_type="application/json").status_code
+        == 401
+    )
+    with django_assert_max_num_queries(10):
+        res = client.post(
+            "/l/",
+            data=data,
+            content_type="application/json",
+            HTTP_AUTHORIZATION=f"Bearer {token}",
+        )
+    assert res.status_code == 201
+    assert len(res.json()) == 50
+    assert UrlShorter.objects.count() == 50
+    assert len(set(UrlShorter.objects.values_list("url_short", flat=True))) == 50
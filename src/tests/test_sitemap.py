@@ -0,0 +1,38 @@
+import pytest
+from django.core.cache import cache
+
+from src.core.sitemap import SITEMAP_INDEX_CACHE_KEY
+
+
+@pytest.mark.django_db
+@pytest.mark.urls("src.core.urls")
+def test_sitemap_from_cache(
+    client, settings, django_assert_num_queries, django_capture_on_commit_callbacks
+):
+    from src.apps.shop.models import Category
+
+    settings.SITEMAP_PAGE_SIZE = 4
+    # not rendered yet, the render is queued
+    with django_capture_on_commit_callbacks(execute=True):
+        response = client.get("/sitemap.xml")
+    assert response.status_code == 503
+    assert cache.get(SITEMAP_INDEX_CACHE_KEY) is not None
+
+    with django_assert_num_queries(0):
+        index = client.get("/sitemap.xml")
+        page = client.get("/sitemap-categories-1.xml")
+    assert index.status_code == 200
+    assert "/sitemap-products-1.xml" in index.content.decode()
+    assert "/sitemap-categories-2.xml" in index.content.decode()
+    # every row in both languages
+    assert page.content.decode().count("<url>") == 4
+    assert client.get("/sitemap-categories-100.xml").status_code == 404
+
+    with django_capture_on_commit_callbacks(execute=True):
+        category = Category.objects.order_by("id").first()
+        category.slug = "sitemap-slug"
+        category.save()
+    assert (
+        "/categories/sitemap-slug"
+        in client.get("/sitemap-categories-1.xml").content.decode()
+    )